@@ -0,0 +1,81 @@
+"""
+Asynchronous AI moves for event loops.
+
+``AsyncAI`` hands the position to a background executor and returns a
+``concurrent.futures.Future`` right away, so a pygame loop keeps handling
+events and drawing frames while the engine thinks. Poll the request once
+per frame with ``poll``, or await it from asyncio code with
+``asyncio.wrap_future``.
+
+The search runs on a copy of the game, so the caller's engine can keep
+being read and drawn in the meantime. The copy shares the engine's
+transposition table and move-ordering history. Cancelling (on undo, a new
+game or quitting) stops the search at its next limit check, and a
+cancelled request's move is never returned.
+"""
+import threading
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from typing import Optional
+
+from .search import SearchResult
+
+
+class AsyncAI:
+    """Runs one AI move request at a time in the background."""
+
+    def __init__(self, engine, executor: Optional[Executor] = None):
+        """
+        Args:
+            engine: GameEngine whose position is searched
+            executor: Where searches run; defaults to a private
+                single-thread pool
+        """
+        self.engine = engine
+        self._owns_executor = executor is None
+        self.executor = executor or ThreadPoolExecutor(max_workers=1, thread_name_prefix="ai")
+        self._future: Optional[Future] = None
+        self._cancel: Optional[threading.Event] = None
+
+    @property
+    def busy(self) -> bool:
+        """Whether a request is waiting to be collected."""
+        return self._future is not None
+
+    def request_move(self, difficulty: str) -> Future:
+        """
+        Start thinking about the current position, cancelling any earlier
+        request. The future resolves to a ``SearchResult``.
+        """
+        self.cancel()
+        position = self.engine.copy()
+        position.transposition_table = self.engine.tt
+        position.move_orderer = self.engine.move_orderer
+        self._cancel = threading.Event()
+        self._future = self.executor.submit(position.think, difficulty, self._cancel)
+        return self._future
+
+    def poll(self) -> Optional[SearchResult]:
+        """
+        Collect the result once it is ready; returns None while the engine
+        is still thinking or when nothing was requested.
+
+        Errors raised by the search are re-raised here.
+        """
+        future = self._future
+        if future is None or not future.done():
+            return None
+        self._future = self._cancel = None
+        return future.result()
+
+    def cancel(self):
+        """Abandon the current request, if any."""
+        if self._future is not None:
+            self._cancel.set()
+            self._future.cancel()
+        self._future = self._cancel = None
+
+    def shutdown(self):
+        """Cancel any request and stop a private executor."""
+        self.cancel()
+        if self._owns_executor:
+            self.executor.shutdown(wait=True)
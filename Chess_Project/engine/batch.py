@@ -0,0 +1,291 @@
+"""
+Batched position encoding and vectorized evaluation with NumPy.
+
+For offline analysis of many positions at once, ``PositionBatch`` stores N
+positions as an ``(N, 64)`` int8 array of square contents (0 for empty,
+piece index + 1 otherwise) plus an ``(N,)`` array of sides to move. It
+converts to and from ``GameEngine`` objects, the nested-list
+``Board.board`` layout and ``(N, 12, 64)`` one-hot piece planes.
+
+Evaluation works on the whole batch at once. Each piece plane is packed
+into one uint64 bitboard per position, so attack sets for mobility and
+king safety are computed with shifts and masks over arrays of N words
+rather than per square. The material and piece-square term uses the same
+tables as ``engine.evaluation`` and gives the same scores as ``evaluate``.
+"""
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .bitboard import (
+    BitBoard, COLOR_INDEX, COLOR_NAMES, PIECE_INDEX, PIECE_NAMES,
+    PAWN, KNIGHT, BISHOP, ROOK, QUEEN, KING, WHITE, BLACK,
+)
+from .evaluation import EG_TABLES, MAX_PHASE, MG_TABLES, PIECE_PHASES
+from .game_engine import GameEngine
+from .zobrist import zobrist_hash
+
+# Centipawns per square a piece attacks that is not occupied by its own side
+MOBILITY_WEIGHTS = (0, 4, 5, 2, 1, 0)
+KING_ZONE_ATTACK_PENALTY = 12  # Per attacked square next to the king
+PAWN_SHIELD_BONUS = 10         # Per own pawn directly in front of the king
+
+# Lookup tables with a row of zeros for empty squares (code 0)
+_MG_LUT = np.array([[0] * 64] + MG_TABLES, dtype=np.int32)
+_EG_LUT = np.array([[0] * 64] + EG_TABLES, dtype=np.int32)
+_PHASE_LUT = np.array((0,) + tuple(PIECE_PHASES), dtype=np.int32)
+_SQUARES = np.arange(64)
+
+_U = np.uint64
+_NOT_FILE_A = _U(0xFEFEFEFEFEFEFEFE)
+_NOT_FILE_H = _U(0x7F7F7F7F7F7F7F7F)
+_NOT_FILE_AB = _U(0xFCFCFCFCFCFCFCFC)
+_NOT_FILE_GH = _U(0x3F3F3F3F3F3F3F3F)
+_ONE, _SEVEN, _EIGHT, _NINE = _U(1), _U(7), _U(8), _U(9)
+_SIX, _TEN, _FIFTEEN, _SEVENTEEN = _U(6), _U(10), _U(15), _U(17)
+
+_BYTE_POPCOUNT = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+
+# Directional shifts on (N,) uint64 bitboards. Square 0 is a8, so "north"
+# (towards rank 8) lowers the square index.
+def _north(b): return b >> _EIGHT
+def _south(b): return b << _EIGHT
+def _east(b): return (b << _ONE) & _NOT_FILE_A
+def _west(b): return (b >> _ONE) & _NOT_FILE_H
+def _north_east(b): return (b >> _SEVEN) & _NOT_FILE_A
+def _north_west(b): return (b >> _NINE) & _NOT_FILE_H
+def _south_east(b): return (b << _NINE) & _NOT_FILE_A
+def _south_west(b): return (b << _SEVEN) & _NOT_FILE_H
+
+
+_ROOK_SHIFTS = (_north, _south, _east, _west)
+_BISHOP_SHIFTS = (_north_east, _north_west, _south_east, _south_west)
+
+
+def _knight_attacks(b):
+    return (((b >> _SEVENTEEN) & _NOT_FILE_H) | ((b >> _FIFTEEN) & _NOT_FILE_A)
+            | ((b >> _TEN) & _NOT_FILE_GH) | ((b >> _SIX) & _NOT_FILE_AB)
+            | ((b << _SEVENTEEN) & _NOT_FILE_A) | ((b << _FIFTEEN) & _NOT_FILE_H)
+            | ((b << _TEN) & _NOT_FILE_AB) | ((b << _SIX) & _NOT_FILE_GH))
+
+
+def _king_attacks(b):
+    row = b | _east(b) | _west(b)
+    return (row | _north(row) | _south(row)) & ~b
+
+
+def _popcount(b: np.ndarray) -> np.ndarray:
+    """Set bits in each uint64, as int32."""
+    if hasattr(np, "bitwise_count"):  # NumPy 2.0+
+        return np.bitwise_count(b).astype(np.int32)
+    return _BYTE_POPCOUNT[b.view(np.uint8).reshape(-1, 8)].sum(axis=1, dtype=np.int32)
+
+
+def _slider_attacks(pieces, empty, shifts) -> Tuple[np.ndarray, List[np.ndarray]]:
+    """
+    Squares attacked by the sliders in ``pieces``, flooding each direction
+    until a blocker.
+
+    Returns the union and the ray fronts reached at each step. No two
+    pieces share a front square within a direction, so popcounts of the
+    fronts count each piece's attacks separately.
+    """
+    union = np.zeros_like(pieces)
+    per_piece = []
+    for shift in shifts:
+        front = pieces
+        for _ in range(7):
+            front = shift(front)
+            if not front.any():
+                break
+            union |= front
+            per_piece.append(front)
+            front = front & empty
+    return union, per_piece
+
+
+class PositionBatch:
+    """N positions as NumPy arrays, with vectorized evaluation."""
+
+    def __init__(self, squares: np.ndarray, sides: Optional[np.ndarray] = None):
+        """
+        Args:
+            squares: (N, 64) array of square codes: 0 empty, piece index + 1
+            sides: (N,) side to move per position (0 white, 1 black);
+                defaults to white everywhere
+        """
+        self.squares = np.ascontiguousarray(squares, dtype=np.int8)
+        if self.squares.ndim != 2 or self.squares.shape[1] != 64:
+            raise ValueError(f"Expected an (N, 64) array, got shape {self.squares.shape}")
+        if sides is None:
+            sides = np.zeros(len(self.squares), dtype=np.int8)
+        self.sides = np.asarray(sides, dtype=np.int8)
+
+    def __len__(self) -> int:
+        return len(self.squares)
+
+    # ------------------------------------------------------------------
+    # Conversion
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def from_engines(cls, engines: Iterable[GameEngine]) -> "PositionBatch":
+        """Encode the current position of each engine."""
+        rows, sides = [], []
+        for engine in engines:
+            rows.append([0 if piece is None else piece + 1 for piece in engine.board.mailbox])
+            sides.append(engine.side)
+        return cls(np.array(rows, dtype=np.int8).reshape(-1, 64), np.array(sides, dtype=np.int8))
+
+    @classmethod
+    def from_rows(cls, boards: Iterable[Sequence[Sequence]],
+                  sides: Optional[Sequence[str]] = None) -> "PositionBatch":
+        """
+        Encode nested ``board[y][x]`` lists, as returned by ``BitBoard.board``
+        or stored in saved games. Squares hold (color, type) tuples, objects
+        with ``color``/``type`` attributes (``Piece``), or None.
+        """
+        rows = []
+        for board in boards:
+            row = []
+            for rank in board:
+                for piece in rank:
+                    if piece is None:
+                        row.append(0)
+                        continue
+                    color, piece_type = piece if isinstance(piece, tuple) else (piece.color, piece.type)
+                    row.append(COLOR_INDEX[color] * 6 + PIECE_INDEX[piece_type] + 1)
+            rows.append(row)
+        squares = np.array(rows, dtype=np.int8).reshape(-1, 64)
+        side_codes = None if sides is None else np.array([COLOR_INDEX[side] for side in sides], dtype=np.int8)
+        return cls(squares, side_codes)
+
+    @classmethod
+    def from_planes(cls, planes: np.ndarray, sides: Optional[np.ndarray] = None) -> "PositionBatch":
+        """Decode an (N, 12, 64) one-hot array from ``planes``."""
+        planes = np.asarray(planes)
+        if planes.ndim != 3 or planes.shape[1:] != (12, 64):
+            raise ValueError(f"Expected an (N, 12, 64) array, got shape {planes.shape}")
+        codes = np.arange(1, 13, dtype=np.int8).reshape(1, 12, 1)
+        return cls((planes.astype(np.int8) * codes).sum(axis=1, dtype=np.int8), sides)
+
+    def planes(self) -> np.ndarray:
+        """(N, 12, 64) int8 one-hot piece planes, indexed by piece index then square."""
+        codes = np.arange(1, 13, dtype=np.int8).reshape(1, 12, 1)
+        return (self.squares[:, None, :] == codes).astype(np.int8)
+
+    def bitboards(self) -> np.ndarray:
+        """(N, 12) uint64 piece bitboards, matching ``BitBoard.pieces``."""
+        packed = np.packbits(self.planes().astype(bool), axis=2, bitorder="little")
+        return np.ascontiguousarray(packed).view("<u8").reshape(len(self), 12).astype(np.uint64)
+
+    def to_rows(self) -> List[List[List[Optional[Tuple[str, str]]]]]:
+        """Nested ``board[y][x]`` lists of (color, type) tuples, as ``BitBoard.board``."""
+        names = [None] + [(COLOR_NAMES[piece // 6], PIECE_NAMES[piece % 6]) for piece in range(12)]
+        return [[[names[code] for code in squares[y * 8:y * 8 + 8]] for y in range(8)]
+                for squares in self.squares.tolist()]
+
+    def to_engines(self) -> List[GameEngine]:
+        """
+        A GameEngine per position.
+
+        The batch holds only piece placement and side to move, so the
+        engines have no castle rights, en passant square or history.
+        """
+        engines = []
+        for squares, side in zip(self.squares.tolist(), self.sides.tolist()):
+            engine = GameEngine()
+            board = BitBoard(empty=True)
+            for sq, code in enumerate(squares):
+                if code:
+                    board.put(code - 1, sq)
+            board.refresh_attacks()
+            engine.board = board
+            engine.side = side
+            engine.castling = 0
+            engine.hash = zobrist_hash(board, side, 0, None)
+            engine.update_game_state()
+            engines.append(engine)
+        return engines
+
+    # ------------------------------------------------------------------
+    # Evaluation
+    # ------------------------------------------------------------------
+
+    def features(self) -> Dict[str, np.ndarray]:
+        """
+        Evaluation terms for every position, all white-relative int32 arrays:
+
+        - ``mg`` / ``eg``: material plus piece-square totals
+        - ``phase``: game phase, 0 (bare kings and pawns) to 24
+        - ``material``: tapered material and piece-square score
+        - ``mobility``: weighted count of attacked squares not holding own pieces
+        - ``king_safety``: pawn shield minus attacks on the squares around the king
+        """
+        squares = self.squares.astype(np.intp)
+        mg = _MG_LUT[squares, _SQUARES].sum(axis=1, dtype=np.int32)
+        eg = _EG_LUT[squares, _SQUARES].sum(axis=1, dtype=np.int32)
+        phase = _PHASE_LUT[squares].sum(axis=1, dtype=np.int32)
+        clipped = np.minimum(phase, MAX_PHASE)
+        material = (mg * clipped + eg * (MAX_PHASE - clipped)) // MAX_PHASE
+
+        boards = self.bitboards()
+        occupancy = [np.bitwise_or.reduce(boards[:, color * 6:color * 6 + 6], axis=1)
+                     for color in (WHITE, BLACK)]
+        empty = ~(occupancy[WHITE] | occupancy[BLACK])
+
+        mobility = [np.zeros(len(self), dtype=np.int32) for _ in (WHITE, BLACK)]
+        attacks = []
+        for color in (WHITE, BLACK):
+            base = color * 6
+            not_own = ~occupancy[color]
+            pawns = boards[:, base + PAWN]
+            if color == WHITE:
+                attacked = _north_east(pawns) | _north_west(pawns)
+            else:
+                attacked = _south_east(pawns) | _south_west(pawns)
+            attacked |= _king_attacks(boards[:, base + KING])
+
+            knights = _knight_attacks(boards[:, base + KNIGHT])
+            attacked |= knights
+            mobility[color] += MOBILITY_WEIGHTS[KNIGHT] * _popcount(knights & not_own)
+
+            for piece_type, shifts in ((BISHOP, _BISHOP_SHIFTS), (ROOK, _ROOK_SHIFTS),
+                                       (QUEEN, _ROOK_SHIFTS + _BISHOP_SHIFTS)):
+                union, fronts = _slider_attacks(boards[:, base + piece_type], empty, shifts)
+                attacked |= union
+                for front in fronts:
+                    mobility[color] += MOBILITY_WEIGHTS[piece_type] * _popcount(front & not_own)
+            attacks.append(attacked)
+
+        safety = []
+        for color in (WHITE, BLACK):
+            king = boards[:, color * 6 + KING]
+            zone = _king_attacks(king)
+            forward = _north if color == WHITE else _south
+            shield = forward(king | _east(king) | _west(king))
+            score = (PAWN_SHIELD_BONUS * _popcount(shield & boards[:, color * 6 + PAWN])
+                     - KING_ZONE_ATTACK_PENALTY * _popcount(zone & attacks[color ^ 1]))
+            safety.append(score)
+
+        # King safety matters while the opponent still has pieces to attack with
+        king_safety = (safety[WHITE] - safety[BLACK]) * clipped // MAX_PHASE
+        return {
+            "mg": mg,
+            "eg": eg,
+            "phase": phase,
+            "material": material.astype(np.int32),
+            "mobility": mobility[WHITE] - mobility[BLACK],
+            "king_safety": king_safety.astype(np.int32),
+        }
+
+    def evaluate(self, terms: Sequence[str] = ("material", "mobility", "king_safety")) -> np.ndarray:
+        """
+        (N,) int32 scores in centipawns from each side to move's point of view.
+
+        With ``terms=("material",)`` the scores match ``engine.evaluation.evaluate``.
+        """
+        features = self.features()
+        score = sum(features[term] for term in terms)
+        return np.where(self.sides == WHITE, score, -score).astype(np.int32)
@@ -0,0 +1,421 @@
+"""
+Bitboard position representation.
+
+Squares are numbered ``y * 8 + x`` using the same (x, y) coordinates as
+``GameEngine`` and the GUI: x is the file (0 = a) and y is the row from the
+top of the board (0 = rank 8). Square 0 is a8 and square 63 is h1.
+"""
+from typing import List, Optional, Tuple
+
+from .evaluation import EG_TABLES, MG_TABLES, PIECE_PHASES
+
+WHITE, BLACK = 0, 1
+COLOR_NAMES = ("white", "black")
+COLOR_INDEX = {"white": WHITE, "black": BLACK}
+
+PAWN, KNIGHT, BISHOP, ROOK, QUEEN, KING = range(6)
+PIECE_NAMES = ("pawn", "knight", "bishop", "rook", "queen", "king")
+PIECE_INDEX = {name: i for i, name in enumerate(PIECE_NAMES)}
+
+ALL_SQUARES = (1 << 64) - 1
+FILE_A = 0x0101010101010101
+FILE_H = FILE_A << 7
+
+# Move encoding: from (6 bits) | to (6 bits) | promotion type (3 bits) | flag (3 bits)
+FLAG_NORMAL = 0
+FLAG_DOUBLE_PUSH = 1
+FLAG_EN_PASSANT = 2
+FLAG_CASTLE = 3
+
+
+def encode_move(from_sq: int, to_sq: int, promotion: int = 0, flag: int = FLAG_NORMAL) -> int:
+    """Pack a move into a single int."""
+    return from_sq | (to_sq << 6) | (promotion << 12) | (flag << 15)
+
+
+def decode_move(move: int) -> Tuple[int, int, int, int]:
+    """Unpack a move into (from_sq, to_sq, promotion, flag)."""
+    return move & 63, (move >> 6) & 63, (move >> 12) & 7, move >> 15
+
+
+def square_index(pos: Tuple[int, int]) -> int:
+    """Convert an (x, y) position to a square index."""
+    return pos[1] * 8 + pos[0]
+
+
+def square_pos(sq: int) -> Tuple[int, int]:
+    """Convert a square index to an (x, y) position."""
+    return sq & 7, sq >> 3
+
+
+def square_name(sq: int) -> str:
+    """Algebraic name of a square, e.g. 0 -> "a8"."""
+    return "abcdefgh"[sq & 7] + str(8 - (sq >> 3))
+
+
+def parse_square(name: str) -> int:
+    """Square index of an algebraic name, e.g. "a8" -> 0."""
+    if len(name) != 2 or name[0] not in "abcdefgh" or name[1] not in "12345678":
+        raise ValueError(f"Invalid square: {name!r}")
+    return (8 - int(name[1])) * 8 + "abcdefgh".index(name[0])
+
+
+def move_name(move: int) -> str:
+    """Coordinate notation for an encoded move, e.g. "e2e4" or "e7e8q"."""
+    promotion = (move >> 12) & 7
+    name = square_name(move & 63) + square_name((move >> 6) & 63)
+    return name + "pnbrqk"[promotion] if promotion else name
+
+
+def piece_index(color: int, piece_type: int) -> int:
+    """Index of a (color, type) pair in ``BitBoard.pieces``."""
+    return color * 6 + piece_type
+
+
+def lsb(bb: int) -> int:
+    """Index of the least significant set bit."""
+    return (bb & -bb).bit_length() - 1
+
+
+def popcount(bb: int) -> int:
+    """Number of set bits."""
+    return bin(bb).count("1")
+
+
+def iter_bits(bb: int):
+    """Yield the square index of every set bit."""
+    while bb:
+        low = bb & -bb
+        yield low.bit_length() - 1
+        bb ^= low
+
+
+# ---------------------------------------------------------------------------
+# Precomputed attack tables
+# ---------------------------------------------------------------------------
+
+def _on_board(x: int, y: int) -> bool:
+    return 0 <= x < 8 and 0 <= y < 8
+
+
+def _leaper_table(offsets) -> List[int]:
+    table = []
+    for sq in range(64):
+        x, y = square_pos(sq)
+        mask = 0
+        for dx, dy in offsets:
+            if _on_board(x + dx, y + dy):
+                mask |= 1 << ((y + dy) * 8 + x + dx)
+        table.append(mask)
+    return table
+
+
+KNIGHT_ATTACKS = _leaper_table([(1, 2), (2, 1), (2, -1), (1, -2),
+                                (-1, -2), (-2, -1), (-2, 1), (-1, 2)])
+KING_ATTACKS = _leaper_table([(1, 0), (1, 1), (0, 1), (-1, 1),
+                              (-1, 0), (-1, -1), (0, -1), (1, -1)])
+# Squares attacked by a pawn of the given color standing on each square
+PAWN_ATTACKS = (_leaper_table([(-1, -1), (1, -1)]),
+                _leaper_table([(-1, 1), (1, 1)]))
+
+# Ray directions as (dx, dy). The first four step towards higher square
+# indices, so their nearest blocker is the lowest set bit.
+DIRECTIONS = ((1, 0), (0, 1), (1, 1), (-1, 1),
+              (-1, 0), (0, -1), (-1, -1), (1, -1))
+ROOK_DIRECTIONS = (0, 1, 4, 5)
+BISHOP_DIRECTIONS = (2, 3, 6, 7)
+
+
+def _ray_table(dx: int, dy: int) -> List[int]:
+    table = []
+    for sq in range(64):
+        x, y = square_pos(sq)
+        mask = 0
+        x, y = x + dx, y + dy
+        while _on_board(x, y):
+            mask |= 1 << (y * 8 + x)
+            x, y = x + dx, y + dy
+        table.append(mask)
+    return table
+
+
+RAYS = [_ray_table(dx, dy) for dx, dy in DIRECTIONS]
+
+
+def _line_tables():
+    between = [[0] * 64 for _ in range(64)]
+    line = [[0] * 64 for _ in range(64)]
+    for sq in range(64):
+        for d in range(8):
+            opposite = (d + 4) % 8
+            full_line = RAYS[d][sq] | RAYS[opposite][sq] | (1 << sq)
+            for target in iter_bits(RAYS[d][sq]):
+                between[sq][target] = RAYS[d][sq] ^ RAYS[d][target] ^ (1 << target)
+                line[sq][target] = full_line
+    return between, line
+
+
+# BETWEEN[a][b]: squares strictly between two aligned squares (0 if not aligned)
+# LINE[a][b]: the whole board line through two aligned squares (0 if not aligned)
+BETWEEN, LINE = _line_tables()
+
+
+def _slider_attacks(sq: int, occupied: int, directions) -> int:
+    attacks = 0
+    for d in directions:
+        ray = RAYS[d][sq]
+        blockers = ray & occupied
+        if blockers:
+            if d < 4:
+                blocker = (blockers & -blockers).bit_length() - 1
+            else:
+                blocker = blockers.bit_length() - 1
+            ray ^= RAYS[d][blocker]
+        attacks |= ray
+    return attacks
+
+
+def rook_attacks(sq: int, occupied: int) -> int:
+    """Squares attacked by a rook on ``sq`` given the occupancy mask."""
+    return _slider_attacks(sq, occupied, ROOK_DIRECTIONS)
+
+
+def bishop_attacks(sq: int, occupied: int) -> int:
+    """Squares attacked by a bishop on ``sq`` given the occupancy mask."""
+    return _slider_attacks(sq, occupied, BISHOP_DIRECTIONS)
+
+
+def queen_attacks(sq: int, occupied: int) -> int:
+    """Squares attacked by a queen on ``sq`` given the occupancy mask."""
+    return _slider_attacks(sq, occupied, range(8))
+
+
+def piece_attacks(piece: int, sq: int, occupied: int) -> int:
+    """Squares attacked by a piece index standing on ``sq``."""
+    piece_type = piece % 6
+    if piece_type == PAWN:
+        return PAWN_ATTACKS[piece // 6][sq]
+    if piece_type == KNIGHT:
+        return KNIGHT_ATTACKS[sq]
+    if piece_type == BISHOP:
+        return _slider_attacks(sq, occupied, BISHOP_DIRECTIONS)
+    if piece_type == ROOK:
+        return _slider_attacks(sq, occupied, ROOK_DIRECTIONS)
+    if piece_type == QUEEN:
+        return _slider_attacks(sq, occupied, range(8))
+    return KING_ATTACKS[sq]
+
+
+class BitBoard:
+    """
+    Chess position stored as twelve 64-bit piece sets plus occupancy masks.
+
+    A square-indexed mailbox mirrors the piece sets so "what is on square X"
+    is a single list lookup. The nested-list ``board`` property is a derived,
+    read-only view kept for code that still expects ``board[y][x]`` tuples.
+
+    Per-square attack sets, per-color attack maps and the king squares are
+    kept alongside the piece sets. ``put``/``remove``/``relocate`` only touch
+    the piece sets, king squares and evaluation totals; callers batch the
+    squares they changed and pass them to ``refresh_attacks`` once the move
+    is complete.
+    """
+
+    def __init__(self, empty: bool = False):
+        """Create a board in the starting position (or an empty one)."""
+        self.pieces = [0] * 12
+        self.occupancy = [0, 0]
+        self.occupied = 0
+        self.mailbox: List[Optional[int]] = [None] * 64
+        self.king_squares: List[Optional[int]] = [None, None]
+        self.attacks_from = [0] * 64  # Squares attacked by the piece on each square
+        self.attack_maps = [0, 0]     # Squares attacked by each color
+        self.mg_score = 0  # Running white-relative evaluation totals, see engine.evaluation
+        self.eg_score = 0
+        self.phase = 0
+        if not empty:
+            self.setup_pieces()
+
+    def setup_pieces(self):
+        """Place all pieces in their starting positions."""
+        self.clear()
+        back_rank = [ROOK, KNIGHT, BISHOP, QUEEN, KING, BISHOP, KNIGHT, ROOK]
+        for x in range(8):
+            self.put(piece_index(BLACK, back_rank[x]), x)
+            self.put(piece_index(BLACK, PAWN), 8 + x)
+            self.put(piece_index(WHITE, PAWN), 48 + x)
+            self.put(piece_index(WHITE, back_rank[x]), 56 + x)
+        self.refresh_attacks()
+
+    def clear(self):
+        """Remove every piece from the board."""
+        self.pieces = [0] * 12
+        self.occupancy = [0, 0]
+        self.occupied = 0
+        self.mailbox = [None] * 64
+        self.king_squares = [None, None]
+        self.attacks_from = [0] * 64
+        self.attack_maps = [0, 0]
+        self.mg_score = self.eg_score = self.phase = 0
+
+    def copy(self) -> "BitBoard":
+        """Independent copy of the position and its attack maps."""
+        board = BitBoard(empty=True)
+        board.pieces = self.pieces[:]
+        board.occupancy = self.occupancy[:]
+        board.occupied = self.occupied
+        board.mailbox = self.mailbox[:]
+        board.king_squares = self.king_squares[:]
+        board.attacks_from = self.attacks_from[:]
+        board.attack_maps = self.attack_maps[:]
+        board.mg_score = self.mg_score
+        board.eg_score = self.eg_score
+        board.phase = self.phase
+        return board
+
+    def put(self, piece: int, sq: int):
+        """Place a piece on an empty square."""
+        bit = 1 << sq
+        self.pieces[piece] |= bit
+        self.occupancy[piece // 6] |= bit
+        self.occupied |= bit
+        self.mailbox[sq] = piece
+        if piece % 6 == KING:
+            self.king_squares[piece // 6] = sq
+        self.mg_score += MG_TABLES[piece][sq]
+        self.eg_score += EG_TABLES[piece][sq]
+        self.phase += PIECE_PHASES[piece]
+
+    def remove(self, piece: int, sq: int):
+        """Remove a piece from its square."""
+        bit = 1 << sq
+        self.pieces[piece] ^= bit
+        self.occupancy[piece // 6] ^= bit
+        self.occupied ^= bit
+        self.mailbox[sq] = None
+        if piece % 6 == KING:
+            self.king_squares[piece // 6] = None
+        self.mg_score -= MG_TABLES[piece][sq]
+        self.eg_score -= EG_TABLES[piece][sq]
+        self.phase -= PIECE_PHASES[piece]
+
+    def relocate(self, piece: int, from_sq: int, to_sq: int):
+        """Move a piece to an empty square."""
+        mask = (1 << from_sq) | (1 << to_sq)
+        self.pieces[piece] ^= mask
+        self.occupancy[piece // 6] ^= mask
+        self.occupied ^= mask
+        self.mailbox[from_sq] = None
+        self.mailbox[to_sq] = piece
+        if piece % 6 == KING:
+            self.king_squares[piece // 6] = to_sq
+        table = MG_TABLES[piece]
+        self.mg_score += table[to_sq] - table[from_sq]
+        table = EG_TABLES[piece]
+        self.eg_score += table[to_sq] - table[from_sq]
+
+    def refresh_attacks(self, changed: int = ALL_SQUARES):
+        """
+        Bring the attack maps up to date after the squares in ``changed``
+        gained or lost a piece.
+
+        Only pieces standing on changed squares and sliders whose current
+        attack set touches a changed square can attack differently, so
+        everything else keeps its cached attack set.
+        """
+        mailbox = self.mailbox
+        attacks_from = self.attacks_from
+        occupied = self.occupied
+        for sq in iter_bits(changed):
+            piece = mailbox[sq]
+            attacks_from[sq] = 0 if piece is None else piece_attacks(piece, sq, occupied)
+
+        pieces = self.pieces
+        sliders = (pieces[BISHOP] | pieces[ROOK] | pieces[QUEEN] |
+                   pieces[6 + BISHOP] | pieces[6 + ROOK] | pieces[6 + QUEEN]) & ~changed
+        for sq in iter_bits(sliders):
+            if attacks_from[sq] & changed:
+                attacks_from[sq] = piece_attacks(mailbox[sq], sq, occupied)
+
+        for color in (WHITE, BLACK):
+            attacked = 0
+            for sq in iter_bits(self.occupancy[color]):
+                attacked |= attacks_from[sq]
+            self.attack_maps[color] = attacked
+
+    def piece_at(self, sq: int) -> Optional[int]:
+        """Piece index on a square, or None if it is empty."""
+        return self.mailbox[sq]
+
+    def get_piece(self, pos: Tuple[int, int]) -> Optional[Tuple[str, str]]:
+        """Get the (color, type) tuple at an (x, y) position."""
+        if not (0 <= pos[0] < 8 and 0 <= pos[1] < 8):
+            return None
+        piece = self.mailbox[pos[1] * 8 + pos[0]]
+        if piece is None:
+            return None
+        return COLOR_NAMES[piece // 6], PIECE_NAMES[piece % 6]
+
+    def set_piece(self, pos: Tuple[int, int], piece: Optional[Tuple[str, str]]):
+        """Replace whatever is on an (x, y) position with a (color, type) tuple or None."""
+        sq = square_index(pos)
+        current = self.mailbox[sq]
+        if current is not None:
+            self.remove(current, sq)
+        if piece:
+            self.put(piece_index(COLOR_INDEX[piece[0]], PIECE_INDEX[piece[1]]), sq)
+        self.refresh_attacks(1 << sq)
+
+    def move_piece(self, start_pos: Tuple[int, int], end_pos: Tuple[int, int]) -> bool:
+        """Move whatever is on ``start_pos`` to ``end_pos``, replacing any piece there."""
+        piece = self.get_piece(start_pos)
+        if piece is None:
+            return False
+        self.set_piece(start_pos, None)
+        self.set_piece(end_pos, piece)
+        return True
+
+    @property
+    def board(self) -> List[List[Optional[Tuple[str, str]]]]:
+        """Derived ``board[y][x]`` view of (color, type) tuples. Writes to it are not reflected."""
+        return [[self.get_piece((x, y)) for x in range(8)] for y in range(8)]
+
+    def set_from_rows(self, rows):
+        """Load a position from a nested ``rows[y][x]`` list of (color, type) pairs."""
+        self.clear()
+        for y in range(8):
+            for x in range(8):
+                piece = rows[y][x]
+                if piece:
+                    self.put(piece_index(COLOR_INDEX[piece[0]], PIECE_INDEX[piece[1]]), y * 8 + x)
+        self.refresh_attacks()
+
+    def count(self, color: int, piece_type: int) -> int:
+        """Number of pieces of a type and color."""
+        return popcount(self.pieces[color * 6 + piece_type])
+
+    def king_square(self, color: int) -> Optional[int]:
+        """Square of the given side's king, or None if it has no king."""
+        return self.king_squares[color]
+
+    def attackers_to(self, sq: int, by_color: int, occupied: Optional[int] = None) -> int:
+        """Bitboard of ``by_color`` pieces attacking a square."""
+        if occupied is None:
+            occupied = self.occupied
+        base = by_color * 6
+        pieces = self.pieces
+        attackers = PAWN_ATTACKS[by_color ^ 1][sq] & pieces[base + PAWN]
+        attackers |= KNIGHT_ATTACKS[sq] & pieces[base + KNIGHT]
+        attackers |= KING_ATTACKS[sq] & pieces[base + KING]
+        queens = pieces[base + QUEEN]
+        diagonal = pieces[base + BISHOP] | queens
+        if diagonal:
+            attackers |= bishop_attacks(sq, occupied) & diagonal
+        straight = pieces[base + ROOK] | queens
+        if straight:
+            attackers |= rook_attacks(sq, occupied) & straight
+        return attackers
+
+    def is_attacked(self, sq: int, by_color: int) -> bool:
+        """Whether any ``by_color`` piece attacks a square, read from the attack maps."""
+        return (self.attack_maps[by_color] >> sq) & 1 == 1
@@ -0,0 +1,255 @@
+"""
+Opening book in a compact, memory-mapped binary format.
+
+The file layout follows Polyglot: a flat array of 16-byte big-endian
+records ``(key: u64, move: u16, weight: u16, learn: u32)`` sorted by key.
+Keys and moves are this engine's own, though: ``key`` is the Zobrist hash
+from ``engine.zobrist`` and ``move`` holds the low 15 bits of an encoded
+move (from, to, promotion). Polyglot ``.bin`` files from other programs
+are therefore not interchangeable with these books.
+
+A book is opened with ``mmap`` and searched in place, so opening even a
+very large book takes no time and no heap: the operating system pages in
+only the few records a lookup touches.
+
+Books are built from PGN game collections::
+
+    python -m engine.book build book.bin games1.pgn games2.pgn --plies 24
+    python -m engine.book probe book.bin --fen "<FEN>"
+"""
+import argparse
+import mmap
+import random
+import re
+import struct
+import sys
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .bitboard import move_name
+from .game_engine import GameEngine
+
+ENTRY = struct.Struct(">QHHI")
+ENTRY_SIZE = ENTRY.size
+MOVE_MASK = 0x7FFF      # from | to << 6 | promotion << 12
+MAX_WEIGHT = 0xFFFF
+DEFAULT_BOOK_PLIES = 24
+
+# Points for the side that played a move, by game result
+RESULT_POINTS = {"1-0": (2, 0), "0-1": (0, 2), "1/2-1/2": (1, 1)}
+UNKNOWN_RESULT_POINTS = (1, 1)
+
+_KEY = struct.Struct(">Q")
+
+
+class OpeningBook:
+    """Read-only view of a book file."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, "rb")
+        size = self._file.seek(0, 2)
+        if size % ENTRY_SIZE:
+            self._file.close()
+            raise ValueError(f"{path} is not a book file: size {size} is not a multiple of {ENTRY_SIZE}")
+        self.entries = size // ENTRY_SIZE
+        # mmap cannot map an empty file
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if size else b""
+
+        self.hits = 0
+        self.misses = 0
+
+    def probe(self, key: int) -> List[Tuple[int, int]]:
+        """All (move, weight) records for a position key, heaviest first."""
+        data = self._map
+        low, high = 0, self.entries
+        while low < high:  # First record with a key >= ``key``
+            middle = (low + high) >> 1
+            if _KEY.unpack_from(data, middle * ENTRY_SIZE)[0] < key:
+                low = middle + 1
+            else:
+                high = middle
+        found = []
+        for index in range(low, self.entries):
+            entry_key, move, weight, _ = ENTRY.unpack_from(data, index * ENTRY_SIZE)
+            if entry_key != key:
+                break
+            found.append((move, weight))
+        return found
+
+    def moves(self, engine: GameEngine) -> List[Tuple[int, int]]:
+        """Legal encoded moves the book lists for the engine's position, with weights."""
+        entries = self.probe(engine.hash)
+        if not entries:
+            return []
+        legal = {move & MOVE_MASK: move for move in engine.legal_moves()}
+        return [(legal[move], weight) for move, weight in entries if move in legal]
+
+    def choose(self, engine: GameEngine, rng: Optional[random.Random] = None) -> Optional[int]:
+        """Pick a book move at random in proportion to its weight, or None when out of book."""
+        candidates = [(move, weight) for move, weight in self.moves(engine) if weight > 0]
+        if not candidates:
+            self.misses += 1
+            return None
+        self.hits += 1
+        rng = rng or random
+        return rng.choices([move for move, _ in candidates],
+                           weights=[weight for _, weight in candidates])[0]
+
+    def close(self):
+        """Unmap the book and close its file."""
+        if isinstance(self._map, mmap.mmap):
+            self._map.close()
+        self._file.close()
+
+    def __enter__(self) -> "OpeningBook":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self) -> int:
+        return self.entries
+
+
+# ---------------------------------------------------------------------------
+# Building books from PGN
+# ---------------------------------------------------------------------------
+
+_COMMENT = re.compile(r"\{[^}]*\}|;[^\n]*")
+_NAG = re.compile(r"\$\d+")
+_MOVE_NUMBER = re.compile(r"\d+\.(\.\.)?")
+_RESULTS = ("1-0", "0-1", "1/2-1/2", "*")
+
+
+def _strip_variations(text: str) -> str:
+    """Drop parenthesised (possibly nested) variations."""
+    out, depth = [], 0
+    for char in text:
+        if char == "(":
+            depth += 1
+        elif char == ")":
+            depth = max(0, depth - 1)
+        elif depth == 0:
+            out.append(char)
+    return "".join(out)
+
+
+def read_pgn(lines: Iterable[str]) -> Iterator[Tuple[List[str], str]]:
+    """Yield (SAN moves, result) for each game in PGN text."""
+    result, movetext = "*", []
+
+    def finish():
+        text = _strip_variations(_COMMENT.sub(" ", " ".join(movetext)))
+        text = _MOVE_NUMBER.sub(" ", _NAG.sub(" ", text))
+        tokens = text.split()
+        game_result = result
+        if tokens and tokens[-1] in _RESULTS:
+            game_result = tokens.pop()
+        return [token for token in tokens if token not in _RESULTS], game_result
+
+    for line in lines:
+        line = line.strip()
+        if line.startswith("["):
+            if movetext:  # A header after movetext starts the next game
+                yield finish()
+                result, movetext = "*", []
+            match = re.match(r'\[Result\s+"([^"]*)"\]', line)
+            if match:
+                result = match.group(1)
+        elif line:
+            movetext.append(line)
+    if movetext:
+        yield finish()
+
+
+def collect_book_moves(games: Iterable[Tuple[List[str], str]],
+                       max_plies: int = DEFAULT_BOOK_PLIES) -> Dict[Tuple[int, int], List[int]]:
+    """
+    Play through games and tally each (position key, move) pair.
+
+    Returns:
+        {(key, move): [games, points]}, points scoring 2 for a win and 1
+        for a draw from the mover's side. A game stops counting at the
+        first move that cannot be read.
+    """
+    stats: Dict[Tuple[int, int], List[int]] = {}
+    for moves, result in games:
+        points = RESULT_POINTS.get(result, UNKNOWN_RESULT_POINTS)
+        engine = GameEngine()
+        for san in moves[:max_plies]:
+            try:
+                move = engine.parse_san(san)
+            except ValueError:
+                break
+            entry = stats.setdefault((engine.hash, move & MOVE_MASK), [0, 0])
+            entry[0] += 1
+            entry[1] += points[engine.side]
+            engine.push(move)
+    return stats
+
+
+def write_book(stats: Dict[Tuple[int, int], List[int]], path: str, min_games: int = 1) -> int:
+    """
+    Write tallied moves as a sorted book file; returns the number of entries.
+
+    Moves seen in fewer than ``min_games`` games, or that never scored,
+    are left out. Weights are scaled down if any exceeds 16 bits.
+    """
+    kept = [(key, move, points) for (key, move), (games, points) in stats.items()
+            if games >= min_games and points > 0]
+    top = max((points for _, _, points in kept), default=0)
+    scale = MAX_WEIGHT / top if top > MAX_WEIGHT else 1.0
+    # Sorted by key, heaviest move first within a position
+    kept.sort(key=lambda entry: (entry[0], -entry[2]))
+    with open(path, "wb") as f:
+        for key, move, points in kept:
+            f.write(ENTRY.pack(key, move, max(1, int(points * scale)), 0))
+    return len(kept)
+
+
+def build_book(pgn_paths: Iterable[str], path: str, max_plies: int = DEFAULT_BOOK_PLIES,
+               min_games: int = 1) -> int:
+    """Build a book file from PGN files; returns the number of entries written."""
+    def games():
+        for pgn_path in pgn_paths:
+            with open(pgn_path, encoding="utf-8", errors="replace") as f:
+                yield from read_pgn(f)
+    return write_book(collect_book_moves(games(), max_plies), path, min_games)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Build or inspect opening books")
+    commands = parser.add_subparsers(dest="command", required=True)
+    build = commands.add_parser("build", help="build a book from PGN files")
+    build.add_argument("book")
+    build.add_argument("pgn", nargs="+")
+    build.add_argument("--plies", type=int, default=DEFAULT_BOOK_PLIES,
+                       help="moves per game to include, counted in plies")
+    build.add_argument("--min-games", type=int, default=1,
+                       help="leave out moves seen in fewer games")
+    probe = commands.add_parser("probe", help="list the book moves for a position")
+    probe.add_argument("book")
+    probe.add_argument("--fen", help="position to look up (default: start position)")
+    args = parser.parse_args(argv)
+
+    if args.command == "build":
+        count = build_book(args.pgn, args.book, args.plies, args.min_games)
+        print(f"Wrote {count} entries to {args.book}")
+        return 0
+
+    engine = GameEngine()
+    if args.fen:
+        engine.load_fen(args.fen)
+    with OpeningBook(args.book) as book:
+        moves = book.moves(engine)
+        total = sum(weight for _, weight in moves) or 1
+        for move, weight in moves:
+            print(f"{move_name(move):<6} {weight:>6} {weight / total:6.1%}")
+        if not moves:
+            print("Position not in book")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,145 @@
+"""
+Static evaluation: material plus piece-square tables, tapered between
+middlegame and endgame.
+
+Every (piece, square) pair has a fixed middlegame and endgame value that
+already includes the piece's material, signed so white pieces count
+positive and black pieces negative. ``BitBoard`` adds and subtracts these
+values whenever it places or removes a piece, so the running totals are
+always current and ``evaluate`` costs the same for any position.
+
+The game phase is measured by the non-pawn material left on the board:
+24 with all minor and major pieces present, 0 with none. The final score
+blends the two totals by phase, so king activity and passed pawns matter
+more as pieces come off.
+
+Tables are written from white's point of view with a8 first, the same
+order as the square indices; black uses the vertically mirrored square.
+"""
+from typing import List
+
+# Indexed by piece type: pawn, knight, bishop, rook, queen, king
+MG_VALUES = (100, 320, 330, 500, 900, 0)
+EG_VALUES = (120, 290, 320, 530, 930, 0)
+PHASE_WEIGHTS = (0, 1, 1, 2, 4, 0)
+MAX_PHASE = 24
+
+_PAWN = (
+      0,   0,   0,   0,   0,   0,   0,   0,
+     50,  50,  50,  50,  50,  50,  50,  50,
+     10,  10,  20,  30,  30,  20,  10,  10,
+      5,   5,  10,  25,  25,  10,   5,   5,
+      0,   0,   0,  20,  20,   0,   0,   0,
+      5,  -5, -10,   0,   0, -10,  -5,   5,
+      5,  10,  10, -20, -20,  10,  10,   5,
+      0,   0,   0,   0,   0,   0,   0,   0,
+)
+# In the endgame only advancement counts
+_PAWN_ENDGAME = tuple((0, 80, 50, 30, 15, 5, 0, 0)[sq >> 3] for sq in range(64))
+_KNIGHT = (
+    -50, -40, -30, -30, -30, -30, -40, -50,
+    -40, -20,   0,   0,   0,   0, -20, -40,
+    -30,   0,  10,  15,  15,  10,   0, -30,
+    -30,   5,  15,  20,  20,  15,   5, -30,
+    -30,   0,  15,  20,  20,  15,   0, -30,
+    -30,   5,  10,  15,  15,  10,   5, -30,
+    -40, -20,   0,   5,   5,   0, -20, -40,
+    -50, -40, -30, -30, -30, -30, -40, -50,
+)
+_BISHOP = (
+    -20, -10, -10, -10, -10, -10, -10, -20,
+    -10,   0,   0,   0,   0,   0,   0, -10,
+    -10,   0,   5,  10,  10,   5,   0, -10,
+    -10,   5,   5,  10,  10,   5,   5, -10,
+    -10,   0,  10,  10,  10,  10,   0, -10,
+    -10,  10,  10,  10,  10,  10,  10, -10,
+    -10,   5,   0,   0,   0,   0,   5, -10,
+    -20, -10, -10, -10, -10, -10, -10, -20,
+)
+_ROOK = (
+      0,   0,   0,   0,   0,   0,   0,   0,
+      5,  10,  10,  10,  10,  10,  10,   5,
+     -5,   0,   0,   0,   0,   0,   0,  -5,
+     -5,   0,   0,   0,   0,   0,   0,  -5,
+     -5,   0,   0,   0,   0,   0,   0,  -5,
+     -5,   0,   0,   0,   0,   0,   0,  -5,
+     -5,   0,   0,   0,   0,   0,   0,  -5,
+      0,   0,   0,   5,   5,   0,   0,   0,
+)
+_QUEEN = (
+    -20, -10, -10,  -5,  -5, -10, -10, -20,
+    -10,   0,   0,   0,   0,   0,   0, -10,
+    -10,   0,   5,   5,   5,   5,   0, -10,
+     -5,   0,   5,   5,   5,   5,   0,  -5,
+      0,   0,   5,   5,   5,   5,   0,  -5,
+    -10,   5,   5,   5,   5,   5,   0, -10,
+    -10,   0,   5,   0,   0,   0,   0, -10,
+    -20, -10, -10,  -5,  -5, -10, -10, -20,
+)
+# Middlegame: stay castled behind the pawns
+_KING = (
+    -30, -40, -40, -50, -50, -40, -40, -30,
+    -30, -40, -40, -50, -50, -40, -40, -30,
+    -30, -40, -40, -50, -50, -40, -40, -30,
+    -30, -40, -40, -50, -50, -40, -40, -30,
+    -20, -30, -30, -40, -40, -30, -30, -20,
+    -10, -20, -20, -20, -20, -20, -20, -10,
+     20,  20,   0,   0,   0,   0,  20,  20,
+     20,  30,  10,   0,   0,  10,  30,  20,
+)
+# Endgame: head for the centre
+_KING_ENDGAME = (
+    -50, -40, -30, -20, -20, -30, -40, -50,
+    -30, -20, -10,   0,   0, -10, -20, -30,
+    -30, -10,  20,  30,  30,  20, -10, -30,
+    -30, -10,  30,  40,  40,  30, -10, -30,
+    -30, -10,  30,  40,  40,  30, -10, -30,
+    -30, -10,  20,  30,  30,  20, -10, -30,
+    -30, -30,   0,   0,   0,   0, -30, -30,
+    -50, -30, -30, -30, -30, -30, -30, -50,
+)
+
+_MG_SQUARES = (_PAWN, _KNIGHT, _BISHOP, _ROOK, _QUEEN, _KING)
+_EG_SQUARES = (_PAWN_ENDGAME, _KNIGHT, _BISHOP, _ROOK, _QUEEN, _KING_ENDGAME)
+
+
+def _signed_tables(values, squares) -> List[List[int]]:
+    """Per-piece-index tables of material plus square bonus, negated for black."""
+    tables = []
+    for color, sign in ((0, 1), (1, -1)):
+        for piece_type in range(6):
+            table = squares[piece_type]
+            tables.append([sign * (values[piece_type] + table[sq ^ 56 if color else sq])
+                           for sq in range(64)])
+    return tables
+
+
+# Indexed by piece index (color * 6 + type), then square
+MG_TABLES = _signed_tables(MG_VALUES, _MG_SQUARES)
+EG_TABLES = _signed_tables(EG_VALUES, _EG_SQUARES)
+PIECE_PHASES = PHASE_WEIGHTS * 2
+
+
+def tapered(mg: int, eg: int, phase: int) -> int:
+    """Blend middlegame and endgame scores by game phase."""
+    if phase > MAX_PHASE:
+        phase = MAX_PHASE  # Extra promoted pieces do not make it more of a middlegame
+    return (mg * phase + eg * (MAX_PHASE - phase)) // MAX_PHASE
+
+
+def evaluate(engine) -> int:
+    """Static score in centipawns from the side to move's point of view."""
+    board = engine.board
+    score = tapered(board.mg_score, board.eg_score, board.phase)
+    return score if engine.side == 0 else -score
+
+
+def evaluate_from_scratch(board) -> int:
+    """White-relative score recomputed from every square, for checking the running totals."""
+    mg = eg = phase = 0
+    for sq, piece in enumerate(board.mailbox):
+        if piece is not None:
+            mg += MG_TABLES[piece][sq]
+            eg += EG_TABLES[piece][sq]
+            phase += PIECE_PHASES[piece]
+    return tapered(mg, eg, phase)
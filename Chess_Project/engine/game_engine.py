@@ -1,44 +1,168 @@
-from Chess_Project.engine.board import Board
-from .board import Board
-from .piece import Piece
-from typing import Optional, Tuple, List, Dict, Any
+from .bitboard import (
+    BitBoard, WHITE, BLACK, COLOR_NAMES, COLOR_INDEX, PIECE_INDEX,
+    PAWN, KNIGHT, BISHOP, ROOK, QUEEN, KING, ALL_SQUARES,
+    FLAG_NORMAL, FLAG_DOUBLE_PUSH, FLAG_EN_PASSANT, FLAG_CASTLE,
+    KNIGHT_ATTACKS, KING_ATTACKS, PAWN_ATTACKS, BETWEEN, LINE,
+    bishop_attacks, rook_attacks, queen_attacks, encode_move, iter_bits, lsb, popcount,
+    move_name, parse_square, square_index, square_name, square_pos,
+)
+from .memo import PositionMemo
+from .move_ordering import MoveOrderer, mvv_lva
+from .parallel import SearchPool
+from .search import MAX_PLY, Search, SearchResult, static_exchange
+from .tablebase import TB_LOSS, TB_WIN
+from .transposition import TranspositionTable, DEFAULT_SIZE_MB, MATE_SCORE
+from .zobrist import PIECE_KEYS, SIDE_KEY, CASTLE_KEYS, ep_key, zobrist_hash
+from typing import Optional, Tuple, List, Dict, Any, Union
+import time
+
+# Castle right bits
+WHITE_KINGSIDE, WHITE_QUEENSIDE, BLACK_KINGSIDE, BLACK_QUEENSIDE = 1, 2, 4, 8
+CASTLE_RIGHT_NAMES = (
+    (WHITE_KINGSIDE, "white_kingside"),
+    (WHITE_QUEENSIDE, "white_queenside"),
+    (BLACK_KINGSIDE, "black_kingside"),
+    (BLACK_QUEENSIDE, "black_queenside"),
+)
+
+# Castle rights kept when a move starts or ends on a square
+CASTLE_MASK = [15] * 64
+CASTLE_MASK[60] = 15 & ~(WHITE_KINGSIDE | WHITE_QUEENSIDE)  # e1
+CASTLE_MASK[63] = 15 & ~WHITE_KINGSIDE                      # h1
+CASTLE_MASK[56] = 15 & ~WHITE_QUEENSIDE                     # a1
+CASTLE_MASK[4] = 15 & ~(BLACK_KINGSIDE | BLACK_QUEENSIDE)   # e8
+CASTLE_MASK[7] = 15 & ~BLACK_KINGSIDE                       # h8
+CASTLE_MASK[0] = 15 & ~BLACK_QUEENSIDE                      # a8
+
+PROMOTION_TYPES = (QUEEN, ROOK, BISHOP, KNIGHT)
+FEN_PIECES = "pnbrqk"  # FEN letters indexed by piece type
+
+# Search budgets for the difficulties backed by a real search. A level may
+# also set "workers" to override the engine's ``search_workers``.
+SEARCH_LEVELS = {
+    "hard": {"depth": 4, "max_nodes": 60000, "time_limit_ms": 2000},
+    "expert": {"depth": 8, "max_nodes": None, "time_limit_ms": 5000},
+}
+DEFAULT_SEARCH_DEPTH = 4
 class GameEngine:
     """
     Advanced game engine for chess with comprehensive rule enforcement
     and AI capabilities.
     """
-    def __init__(self):
-        self.board = Board()
-        self.current_turn = "white"
+    def __init__(self, transposition_table: Optional[TranspositionTable] = None,
+                 search_workers: int = 1, opening_book=None, tablebases=None):
+        """
+        Args:
+            transposition_table: Table for the AI to use. Pass one shared
+                table to every engine in a process hosting many games to
+                keep memory flat; otherwise each engine allocates its own
+                the first time the AI runs.
+            search_workers: Processes the AI searches with. Above 1 the
+                table is moved into shared memory and helper processes
+                search alongside this one (see ``engine.parallel``).
+            opening_book: ``engine.book.OpeningBook`` the AI plays from
+                before it starts searching
+            tablebases: ``engine.tablebase.Tablebases`` the AI plays from
+                instead of searching in the endings they cover
+        """
+        self.board = BitBoard()
+        self.transposition_table = transposition_table
+        self.move_orderer = MoveOrderer()  # Killer/history statistics survive between searches
+        self.search_workers = search_workers
+        self.opening_book = opening_book
+        self.tablebases = tablebases
+        self._search_pool: Optional[SearchPool] = None
+        self._shared_tt: Optional[TranspositionTable] = None  # Shared table this engine created
+        self.side = WHITE  # Side to move as a color index
         self.move_history = []
         self.game_state = "playing"  # playing, check, checkmate, stalemate, draw
-        self.castle_rights = {
-            "white_kingside": True,
-            "white_queenside": True,
-            "black_kingside": True,
-            "black_queenside": True
-        }
+        self.castling = WHITE_KINGSIDE | WHITE_QUEENSIDE | BLACK_KINGSIDE | BLACK_QUEENSIDE
+        self.ep_square = None  # Square a pawn can capture onto en passant
         self.last_move = None
         self.halfmove_clock = 0  # For 50-move rule
         self.fullmove_number = 1  # Increments after black's move
+        self._move_stack: List[int] = []  # Encoded moves made with push()
+        self._undo_stack: List[int] = []  # Packed undo records, parallel to _move_stack
+        self._hash_history: List[int] = []  # Zobrist key before each pushed move
+        self.hash = zobrist_hash(self.board, self.side, self.castling, self.ep_square)
+        self.memo = PositionMemo()  # Move lists of the current position, keyed by Zobrist key
+
+    @property
+    def tt(self) -> TranspositionTable:
+        """Transposition table used by the AI, created on first use."""
+        if self.transposition_table is None:
+            self.transposition_table = TranspositionTable()
+        return self.transposition_table
+
+    def copy(self) -> "GameEngine":
+        """
+        Independent copy of the game for searching elsewhere.
+
+        The copy has no transposition table, search pool or move-ordering
+        history of its own, so it is cheap to pickle to another process.
+        """
+        engine = GameEngine.__new__(GameEngine)
+        engine.__dict__.update(self.__dict__)
+        engine.board = self.board.copy()
+        engine.transposition_table = None
+        engine.move_orderer = MoveOrderer()
+        engine.memo = PositionMemo()
+        engine.search_workers = 1
+        engine._search_pool = None
+        engine._shared_tt = None
+        engine.move_history = self.move_history[:]
+        engine._move_stack = self._move_stack[:]
+        engine._undo_stack = self._undo_stack[:]
+        engine._hash_history = self._hash_history[:]
+        return engine
+
+    def close(self):
+        """Stop any parallel search helpers and release the shared table they used."""
+        if self._search_pool is not None:
+            self._search_pool.close()
+            self._search_pool = None
+        if self._shared_tt is not None:
+            self._shared_tt.close()
+            if self.transposition_table is self._shared_tt:
+                self.transposition_table = None
+            self._shared_tt = None
+
+    @property
+    def current_turn(self) -> str:
+        """Side to move as "white" or "black"."""
+        return COLOR_NAMES[self.side]
+
+    @current_turn.setter
+    def current_turn(self, color: str):
+        self.side = COLOR_INDEX[color]
+
+    @property
+    def castle_rights(self) -> Dict[str, bool]:
+        """Castle rights as a dictionary, derived from the ``castling`` bits."""
+        return {name: bool(self.castling & bit) for bit, name in CASTLE_RIGHT_NAMES}
+
+    @castle_rights.setter
+    def castle_rights(self, rights: Dict[str, bool]):
+        self.castling = 0
+        for bit, name in CASTLE_RIGHT_NAMES:
+            if rights.get(name):
+                self.castling |= bit
         
     def initialize_game(self):
-        # Game initialization logic here
-        pass
         """Reset the game to its initial state."""
-        self.board = Board()
-        self.current_turn = "white"
+        self.board = BitBoard()
+        self.side = WHITE
         self.move_history = []
         self.game_state = "playing"
-        self.castle_rights = {
-            "white_kingside": True, 
-            "white_queenside": True,
-            "black_kingside": True, 
-            "black_queenside": True
-        }
+        self.castling = WHITE_KINGSIDE | WHITE_QUEENSIDE | BLACK_KINGSIDE | BLACK_QUEENSIDE
+        self.ep_square = None
         self.last_move = None
         self.halfmove_clock = 0
         self.fullmove_number = 1
+        self._move_stack = []
+        self._undo_stack = []
+        self._hash_history = []
+        self.hash = zobrist_hash(self.board, self.side, self.castling, self.ep_square)
         
     def is_valid_move(self, start_pos: Tuple[int, int], end_pos: Tuple[int, int]) -> bool:
         """Check if a move is valid according to chess rules."""
@@ -53,7 +177,8 @@ class GameEngine:
             
         return end_pos in self.get_legal_moves(start_pos)
         
-    def make_move(self, start_pos: Tuple[int, int], end_pos: Tuple[int, int]) -> bool:
+    def make_move(self, start_pos: Tuple[int, int], end_pos: Tuple[int, int],
+                  promotion: str = "queen") -> bool:
         """
         Execute a chess move if it's valid.
         
@@ -65,102 +190,366 @@ class GameEngine:
         """
         if not self.is_valid_move(start_pos, end_pos):
             return False
-            
-        # Get the piece and track if it's a capture or pawn move
+
+        move = self._find_move(square_index(start_pos), square_index(end_pos),
+                               PIECE_INDEX.get(promotion, QUEEN))
+        if move is None:
+            return False
+        self.play(move)
+        return True
+
+    def play(self, move: int):
+        """
+        Make an encoded legal move as a game move, such as a search result:
+        unlike ``push`` it records the move history and updates the game state.
+        """
+        start_pos, end_pos = square_pos(move & 63), square_pos((move >> 6) & 63)
+
+        # Store the move for future reference (en passant, etc.)
         piece = self.board.get_piece(start_pos)
-        target = self.board.get_piece(end_pos)
-        is_capture = target is not None
-        is_pawn_move = piece[1] == "pawn"
-        
+        self.last_move = (start_pos, end_pos, piece)
+        self.move_history.append(self.last_move)
+
+        self.push(move)
+
+        # Update game state (check, checkmate, etc.)
+        self.update_game_state()
+
+    def _find_move(self, from_sq: int, to_sq: int, promotion: int) -> Optional[int]:
+        """Find the legal encoded move between two squares."""
+        for move in self.legal_moves():
+            if move & 63 == from_sq and (move >> 6) & 63 == to_sq:
+                promo = (move >> 12) & 7
+                if not promo or promo == promotion:
+                    return move
+        return None
+
+    def push(self, move: int):
+        """
+        Make an encoded move on the board, recording how to take it back.
+
+        The undo record is a single packed int (captured piece, castle rights,
+        en passant square and halfmove clock) plus the previous Zobrist key,
+        so search can make and unmake moves without building temporary
+        containers. The key stack doubles as the repetition history.
+        """
+        board = self.board
+        mailbox = board.mailbox
+        from_sq, to_sq = move & 63, (move >> 6) & 63
+        promotion, flag = (move >> 12) & 7, move >> 15
+        us = self.side
+        piece = mailbox[from_sq]
+
+        if flag == FLAG_EN_PASSANT:
+            # The captured pawn sits behind the target square
+            captured_sq = to_sq + 8 if us == WHITE else to_sq - 8
+        else:
+            captured_sq = to_sq
+        captured = mailbox[captured_sq]
+
+        ep = self.ep_square
+        self._undo_stack.append(
+            (0 if captured is None else captured + 1)
+            | (self.castling << 4)
+            | ((0 if ep is None else ep + 1) << 8)
+            | (self.halfmove_clock << 15)
+        )
+        self._move_stack.append(move)
+        key = self.hash
+        self._hash_history.append(key)
+        key ^= ep_key(board, us, ep) ^ CASTLE_KEYS[self.castling]
+
         # Update halfmove clock (reset on capture or pawn move)
-        if is_capture or is_pawn_move:
+        if captured is not None or piece % 6 == PAWN:
             self.halfmove_clock = 0
         else:
             self.halfmove_clock += 1
-            
-        # Store the move for future reference (en passant, etc.)
-        self.last_move = (start_pos, end_pos, piece)
-        self.move_history.append(self.last_move)
-        
-        # Handle castling
-        if piece[1] == "king" and abs(end_pos[0] - start_pos[0]) == 2:
-            # Kingside castling
-            if end_pos[0] > start_pos[0]:
-                rook_start = (7, start_pos[1])
-                rook_end = (end_pos[0] - 1, end_pos[1])
-            # Queenside castling
-            else:
-                rook_start = (0, start_pos[1])
-                rook_end = (end_pos[0] + 1, end_pos[1])
-                
-            # Move the rook
-            self.board.move_piece(rook_start, rook_end)
-            
-        # Handle en passant capture
-        if piece[1] == "pawn" and end_pos[0] != start_pos[0] and not target:
-            # Remove the captured pawn
-            captured_pawn_pos = (end_pos[0], start_pos[1])
-            self.board.board[captured_pawn_pos[1]][captured_pawn_pos[0]] = None
-            
-        # Execute the move
-        self.board.move_piece(start_pos, end_pos)
-        
-        # Update castle rights if king or rook moves
-        if piece[1] == "king":
-            if piece[0] == "white":
-                self.castle_rights["white_kingside"] = False
-                self.castle_rights["white_queenside"] = False
+
+        changed = (1 << from_sq) | (1 << to_sq)
+        if captured is not None:
+            board.remove(captured, captured_sq)
+            changed |= 1 << captured_sq
+            key ^= PIECE_KEYS[captured][captured_sq]
+        board.relocate(piece, from_sq, to_sq)
+        key ^= PIECE_KEYS[piece][from_sq] ^ PIECE_KEYS[piece][to_sq]
+
+        if flag == FLAG_CASTLE:
+            # Move the rook: kingside from the h-file, queenside from the a-file
+            if to_sq > from_sq:
+                rook_from, rook_to = to_sq + 1, to_sq - 1
             else:
-                self.castle_rights["black_kingside"] = False
-                self.castle_rights["black_queenside"] = False
-        elif piece[1] == "rook":
-            if start_pos == (0, 7) and piece[0] == "white":
-                self.castle_rights["white_queenside"] = False
-            elif start_pos == (7, 7) and piece[0] == "white":
-                self.castle_rights["white_kingside"] = False
-            elif start_pos == (0, 0) and piece[0] == "black":
-                self.castle_rights["black_queenside"] = False
-            elif start_pos == (7, 0) and piece[0] == "black":
-                self.castle_rights["black_kingside"] = False
-                
+                rook_from, rook_to = to_sq - 2, to_sq + 1
+            rook = mailbox[rook_from]
+            board.relocate(rook, rook_from, rook_to)
+            changed |= (1 << rook_from) | (1 << rook_to)
+            key ^= PIECE_KEYS[rook][rook_from] ^ PIECE_KEYS[rook][rook_to]
+        elif promotion:
+            board.remove(piece, to_sq)
+            board.put(us * 6 + promotion, to_sq)
+            key ^= PIECE_KEYS[piece][to_sq] ^ PIECE_KEYS[us * 6 + promotion][to_sq]
+        board.refresh_attacks(changed)
+
+        # Moving a king or rook (or capturing a rook) loses castle rights
+        self.castling &= CASTLE_MASK[from_sq] & CASTLE_MASK[to_sq]
+        self.ep_square = (from_sq + to_sq) >> 1 if flag == FLAG_DOUBLE_PUSH else None
+
         # Update full move number
-        if self.current_turn == "black":
+        if us == BLACK:
             self.fullmove_number += 1
-            
+
         # Switch turns
-        self.current_turn = "white" if self.current_turn == "black" else "black"
-        
-        # Update game state (check, checkmate, etc.)
+        self.side = us ^ 1
+        self.hash = key ^ SIDE_KEY ^ CASTLE_KEYS[self.castling] ^ ep_key(board, us ^ 1, self.ep_square)
+
+    def last_move_code(self) -> Optional[int]:
+        """The last move made with ``push`` as an encoded move, or None at the start."""
+        return self._move_stack[-1] if self._move_stack else None
+
+    def pop(self) -> int:
+        """Take back the last move made with ``push`` and return it."""
+        move = self._move_stack.pop()
+        undo = self._undo_stack.pop()
+        self.hash = self._hash_history.pop()
+        board = self.board
+        from_sq, to_sq = move & 63, (move >> 6) & 63
+        promotion, flag = (move >> 12) & 7, move >> 15
+        us = self.side ^ 1
+        self.side = us
+
+        if us == BLACK:
+            self.fullmove_number -= 1
+        self.castling = (undo >> 4) & 15
+        ep = (undo >> 8) & 127
+        self.ep_square = ep - 1 if ep else None
+        self.halfmove_clock = undo >> 15
+
+        if promotion:
+            board.remove(us * 6 + promotion, to_sq)
+            board.put(us * 6 + PAWN, to_sq)
+        board.relocate(board.mailbox[to_sq], to_sq, from_sq)
+        changed = (1 << from_sq) | (1 << to_sq)
+
+        captured = undo & 15
+        if captured:
+            if flag == FLAG_EN_PASSANT:
+                captured_sq = to_sq + 8 if us == WHITE else to_sq - 8
+                changed |= 1 << captured_sq
+            else:
+                captured_sq = to_sq
+            board.put(captured - 1, captured_sq)
+        elif flag == FLAG_CASTLE:
+            if to_sq > from_sq:
+                board.relocate(board.mailbox[to_sq - 1], to_sq - 1, to_sq + 1)
+                changed |= 0b101 << (to_sq - 1)
+            else:
+                board.relocate(board.mailbox[to_sq + 1], to_sq + 1, to_sq - 2)
+                changed |= 0b1001 << (to_sq - 2)
+        board.refresh_attacks(changed)
+        return move
+
+    def undo_move(self) -> bool:
+        """Take back the last move made with ``make_move``."""
+        if not self._move_stack or not self.move_history:
+            return False
+        self.pop()
+        self.move_history.pop()
+        self.last_move = self.move_history[-1] if self.move_history else None
         self.update_game_state()
-        
         return True
-    
+
+    def _add_castling_moves(self, moves: List[int], king_sq: int):
+        """Append castling moves whose path is empty and not attacked."""
+        us = self.side
+        kingside, queenside = (WHITE_KINGSIDE, WHITE_QUEENSIDE) if us == WHITE else (BLACK_KINGSIDE, BLACK_QUEENSIDE)
+        home = 60 if us == WHITE else 4
+        if king_sq != home or not self.castling & (kingside | queenside):
+            return
+        board = self.board
+        them = us ^ 1
+        if board.is_attacked(home, them):
+            return
+        occupied = board.occupied
+        rook = us * 6 + ROOK
+        if (self.castling & kingside and board.mailbox[home + 3] == rook
+                and not occupied & (3 << (home + 1))
+                and not board.is_attacked(home + 1, them) and not board.is_attacked(home + 2, them)):
+            moves.append(encode_move(home, home + 2, 0, FLAG_CASTLE))
+        if (self.castling & queenside and board.mailbox[home - 4] == rook
+                and not occupied & (7 << (home - 3))
+                and not board.is_attacked(home - 1, them) and not board.is_attacked(home - 2, them)):
+            moves.append(encode_move(home, home - 2, 0, FLAG_CASTLE))
+
+    def _legal_moves(self, from_mask: int = ALL_SQUARES, captures_only: bool = False) -> List[int]:
+        """
+        Generate encoded legal moves for the side to move.
+
+        With ``captures_only`` only captures and promotions are generated,
+        which is what quiescence search needs.
+
+        Checkers and pinned pieces are worked out once for the position, so
+        every move comes out legal without trying it on the board: in check,
+        non-king moves are limited to capturing or blocking the checker; a
+        pinned piece may only move along its pin line; and the king only
+        steps onto squares the enemy does not attack.
+        """
+        board = self.board
+        us, them = self.side, self.side ^ 1
+        pieces = board.pieces
+        own, enemy, occupied = board.occupancy[us], board.occupancy[them], board.occupied
+        base, enemy_base = us * 6, them * 6
+        not_own = ALL_SQUARES ^ own
+        king_targets = enemy if captures_only else not_own
+        moves = []
+
+        king_sq = board.king_squares[us]
+        checkers = pinned = 0
+        if king_sq is not None:
+            if (board.attack_maps[them] >> king_sq) & 1:
+                checkers = board.attackers_to(king_sq, them)
+
+            # Enemy sliders that would attack the king through exactly one
+            # of our pieces pin that piece
+            snipers = (rook_attacks(king_sq, enemy) &
+                       (pieces[enemy_base + ROOK] | pieces[enemy_base + QUEEN]))
+            snipers |= (bishop_attacks(king_sq, enemy) &
+                        (pieces[enemy_base + BISHOP] | pieces[enemy_base + QUEEN]))
+            for sniper_sq in iter_bits(snipers):
+                blockers = BETWEEN[king_sq][sniper_sq] & occupied
+                if blockers and not blockers & (blockers - 1) and blockers & own:
+                    pinned |= blockers
+
+            # King moves
+            if (from_mask >> king_sq) & 1:
+                safe = KING_ATTACKS[king_sq] & king_targets & ~board.attack_maps[them]
+                if checkers:
+                    # A slider checking the king also covers the squares behind
+                    # it, which the attack maps see as shadowed by the king
+                    without_king = occupied ^ (1 << king_sq)
+                    for to_sq in iter_bits(safe):
+                        if not board.attackers_to(to_sq, them, without_king):
+                            moves.append(king_sq | (to_sq << 6))
+                else:
+                    for to_sq in iter_bits(safe):
+                        moves.append(king_sq | (to_sq << 6))
+                    if not captures_only:
+                        self._add_castling_moves(moves, king_sq)
+
+        if checkers:
+            if checkers & (checkers - 1):
+                return moves  # Double check: only the king can move
+            # Capture the checker or block the line between it and the king
+            checker_sq = lsb(checkers)
+            targets = not_own & (checkers | BETWEEN[king_sq][checker_sq])
+        else:
+            targets = not_own
+        piece_targets = targets & enemy if captures_only else targets
+
+        # Pawns
+        if us == WHITE:
+            push, start_rank, promo_rank = -8, 6, 0
+        else:
+            push, start_rank, promo_rank = 8, 1, 7
+        pawn_attacks = PAWN_ATTACKS[us]
+        ep_square = self.ep_square
+        for sq in iter_bits(pieces[base + PAWN] & from_mask):
+            allowed = targets & LINE[king_sq][sq] if (pinned >> sq) & 1 else targets
+            to_sq = sq + push
+            reachable = pawn_attacks[sq] & enemy
+            if not (occupied >> to_sq) & 1 and (not captures_only or to_sq >> 3 == promo_rank):
+                reachable |= 1 << to_sq
+                double = to_sq + push
+                if (not captures_only and sq >> 3 == start_rank and not (occupied >> double) & 1
+                        and (allowed >> double) & 1):
+                    moves.append(encode_move(sq, double, 0, FLAG_DOUBLE_PUSH))
+            for to_sq in iter_bits(reachable & allowed):
+                if to_sq >> 3 == promo_rank:
+                    for promo in PROMOTION_TYPES:
+                        moves.append(encode_move(sq, to_sq, promo))
+                else:
+                    moves.append(sq | (to_sq << 6))
+            if ep_square is not None and (pawn_attacks[sq] >> ep_square) & 1:
+                if self._en_passant_is_legal(sq, ep_square, king_sq, checkers):
+                    moves.append(encode_move(sq, ep_square, 0, FLAG_EN_PASSANT))
+
+        # Knights never move along a pin line, so a pinned knight is stuck
+        for sq in iter_bits(pieces[base + KNIGHT] & from_mask & ~pinned):
+            for to_sq in iter_bits(KNIGHT_ATTACKS[sq] & piece_targets):
+                moves.append(sq | (to_sq << 6))
+
+        # Sliders
+        for piece_type, attacks in ((BISHOP, bishop_attacks), (ROOK, rook_attacks), (QUEEN, queen_attacks)):
+            for sq in iter_bits(pieces[base + piece_type] & from_mask):
+                allowed = piece_targets & LINE[king_sq][sq] if (pinned >> sq) & 1 else piece_targets
+                for to_sq in iter_bits(attacks(sq, occupied) & allowed):
+                    moves.append(sq | (to_sq << 6))
+
+        return moves
+
+    def _en_passant_is_legal(self, from_sq: int, ep_square: int,
+                             king_sq: Optional[int], checkers: int) -> bool:
+        """
+        Check an en passant capture, which removes two pawns from one line
+        at once and so can expose the king in ways pin masks do not cover.
+        """
+        if king_sq is None:
+            return True
+        board = self.board
+        them = self.side ^ 1
+        captured_sq = ep_square + 8 if self.side == WHITE else ep_square - 8
+        pieces = board.pieces
+        enemy_base = them * 6
+
+        # A knight or pawn check can only be answered by capturing that piece
+        if checkers & ~(1 << captured_sq) & (pieces[enemy_base + KNIGHT] | pieces[enemy_base + PAWN]):
+            return False
+
+        occupied = board.occupied ^ (1 << from_sq) ^ (1 << captured_sq) | (1 << ep_square)
+        queens = pieces[enemy_base + QUEEN]
+        if rook_attacks(king_sq, occupied) & (pieces[enemy_base + ROOK] | queens):
+            return False
+        if bishop_attacks(king_sq, occupied) & (pieces[enemy_base + BISHOP] | queens):
+            return False
+        return True
+
+    def legal_moves(self) -> List[int]:
+        """
+        Every encoded legal move for the side to move.
+
+        The list is generated once per position and kept in ``memo``
+        under the position's Zobrist key, so game-state checks, the AI and
+        the GUI all share it; any move or take-back changes the key and so
+        invalidates it. Callers must not modify the list.
+        """
+        return self.memo.get(self.hash, "legal", self._legal_moves)
+
     def get_legal_moves(self, pos: Tuple[int, int]) -> List[Tuple[int, int]]:
-        """Get all legal moves for a piece, considering check and special moves."""
-        piece = self.board.get_piece(pos)
-        if not piece:
-            return []
-            
-        # Get basic moves based on piece type
-        piece_obj = Piece(piece[0], piece[1])
-        moves = piece_obj.valid_moves(
-            self.board.board, 
-            pos, 
-            self.last_move,
-            self.castle_rights
-        )
-        
-        # Filter moves that would put/leave king in check
-        return [move for move in moves if not self.would_be_in_check(pos, move)]
+        """
+        Get all legal moves for a piece, considering check and special moves.
+
+        Answers are memoized until the position changes, so the GUI can
+        ask every frame. Callers must not modify the list.
+        """
+        pos = tuple(pos)  # Lists are accepted too, but only tuples are hashable
+        return self.memo.get(self.hash, pos, lambda: self._piece_targets(square_index(pos)))
+
+    def _piece_targets(self, from_sq: int) -> List[Tuple[int, int]]:
+        """Target squares of the legal moves from one square."""
+        # Promotions share a target square, so only list each square once
+        moves = []
+        for move in self.legal_moves():
+            if move & 63 == from_sq:
+                end = square_pos((move >> 6) & 63)
+                if end not in moves:
+                    moves.append(end)
+        return moves
     
     def update_game_state(self):
         """Update game state (check, checkmate, stalemate, draw)."""
-        if self.is_in_check(self.current_turn):
-            if self.is_checkmate():
-                self.game_state = "checkmate"
-            else:
-                self.game_state = "check"
-        elif self.is_stalemate():
+        in_check = self.is_in_check(self.current_turn)
+        has_moves = bool(self.legal_moves())
+        if in_check:
+            self.game_state = "check" if has_moves else "checkmate"
+        elif not has_moves:
             self.game_state = "stalemate"
         elif self.is_draw():
             self.game_state = "draw"
@@ -169,203 +558,448 @@ class GameEngine:
     
     def is_in_check(self, color: str) -> bool:
         """Check if the specified color's king is in check."""
-        # Find king position
-        king_pos = None
-        for y in range(8):
-            for x in range(8):
-                piece = self.board.board[y][x]
-                if piece and piece[0] == color and piece[1] == "king":
-                    king_pos = (x, y)
-                    break
-            if king_pos:
-                break
-                
-        if not king_pos:
+        us = COLOR_INDEX[color]
+        king_sq = self.board.king_squares[us]
+        if king_sq is None:
             return False  # No king found (shouldn't happen in normal chess)
-            
-        # Check if any opponent piece can capture the king
-        opponent = "white" if color == "black" else "black"
-        for y in range(8):
-            for x in range(8):
-                piece = self.board.board[y][x]
-                if piece and piece[0] == opponent:
-                    piece_obj = Piece(piece[0], piece[1])
-                    if piece_obj.threatens_square((x, y), king_pos, self.board.board):
-                        return True
-        return False
+        return self.board.is_attacked(king_sq, us ^ 1)
     
     def is_checkmate(self) -> bool:
         """Check if current player is in checkmate."""
         if not self.is_in_check(self.current_turn):
             return False
-            
-        # If any piece has legal moves, it's not checkmate
-        for y in range(8):
-            for x in range(8):
-                piece = self.board.board[y][x]
-                if piece and piece[0] == self.current_turn:
-                    if self.get_legal_moves((x, y)):
-                        return False
-        return True
+        return not self.legal_moves()
     
     def is_stalemate(self) -> bool:
         """Check if current player is in stalemate."""
         if self.is_in_check(self.current_turn):
             return False
-            
-        # If no piece has legal moves, it's stalemate
-        for y in range(8):
-            for x in range(8):
-                piece = self.board.board[y][x]
-                if piece and piece[0] == self.current_turn:
-                    if self.get_legal_moves((x, y)):
-                        return False
-        return True
+        return not self.legal_moves()
     
     def is_draw(self) -> bool:
-        """Check for other draw conditions (50-move rule, insufficient material)."""
+        """Check for other draw conditions (50-move rule, repetition, insufficient material)."""
         # 50-move rule
         if self.halfmove_clock >= 100:  # 50 moves = 100 half-moves
             return True
+
+        # Threefold repetition
+        if self.is_repetition(3):
+            return True
             
         # Insufficient material
         return self._has_insufficient_material()
+
+    def is_repetition(self, count: int = 3) -> bool:
+        """
+        Check whether the current position has occurred ``count`` times.
+
+        Only positions since the last capture or pawn move can repeat, and
+        only every other ply has the same side to move, so the scan covers
+        at most ``halfmove_clock / 2`` earlier keys.
+        """
+        history = self._hash_history
+        key = self.hash
+        seen = 1
+        for back in range(2, min(self.halfmove_clock, len(history)) + 1, 2):
+            if history[-back] == key:
+                seen += 1
+                if seen >= count:
+                    return True
+        return False
     
     def _has_insufficient_material(self) -> bool:
         """Check if there's insufficient material for checkmate."""
-        # Count pieces
-        piece_counts = {"white": {}, "black": {}}
-        for y in range(8):
-            for x in range(8):
-                piece = self.board.board[y][x]
-                if piece:
-                    color, p_type = piece
-                    if p_type not in piece_counts[color]:
-                        piece_counts[color][p_type] = 0
-                    piece_counts[color][p_type] += 1
-        
-        # King vs King
-        if len(piece_counts["white"]) == 1 and len(piece_counts["black"]) == 1:
-            return True
-            
-        # King + minor piece vs King
-        if (len(piece_counts["white"]) == 1 and 
-            len(piece_counts["black"]) == 2 and 
-            (piece_counts["black"].get("bishop", 0) == 1 or 
-             piece_counts["black"].get("knight", 0) == 1)):
-            return True
-            
-        if (len(piece_counts["black"]) == 1 and 
-            len(piece_counts["white"]) == 2 and 
-            (piece_counts["white"].get("bishop", 0) == 1 or 
-             piece_counts["white"].get("knight", 0) == 1)):
-            return True
-            
-        return False
+        pieces = self.board.pieces
+        # Any pawn, rook or queen can still mate
+        for color in (WHITE, BLACK):
+            base = color * 6
+            if pieces[base + PAWN] | pieces[base + ROOK] | pieces[base + QUEEN]:
+                return False
+
+        # King vs King, or King + single minor piece vs King
+        minors = (pieces[KNIGHT] | pieces[BISHOP] |
+                  pieces[6 + KNIGHT] | pieces[6 + BISHOP])
+        return popcount(minors) <= 1
     
     def would_be_in_check(self, start_pos: Tuple[int, int], end_pos: Tuple[int, int]) -> bool:
         """Check if moving a piece would result in the player's king being in check."""
+        from_sq, to_sq = square_index(start_pos), square_index(end_pos)
+        piece = self.board.mailbox[from_sq]
+        if piece is None:
+            return False
+        flag = FLAG_NORMAL
+        if piece % 6 == PAWN and to_sq == self.ep_square:
+            flag = FLAG_EN_PASSANT
+        elif piece % 6 == KING and abs(to_sq - from_sq) == 2:
+            flag = FLAG_CASTLE
+
         # Make temporary move
-        original_piece = self.board.board[start_pos[1]][start_pos[0]]
-        target_piece = self.board.board[end_pos[1]][end_pos[0]]
-        
-        # Execute move on board
-        self.board.board[end_pos[1]][end_pos[0]] = original_piece
-        self.board.board[start_pos[1]][start_pos[0]] = None
-        
-        # Check if king is in check
-        in_check = self.is_in_check(self.current_turn)
-        
-        # Undo move
-        self.board.board[start_pos[1]][start_pos[0]] = original_piece
-        self.board.board[end_pos[1]][end_pos[0]] = target_piece
-        
+        color = self.current_turn
+        self.push(encode_move(from_sq, to_sq, 0, flag))
+        in_check = self.is_in_check(color)
+        self.pop()
         return in_check
         
+    def see(self, move: Union[int, Tuple[Tuple[int, int], Tuple[int, int]]]) -> int:
+        """
+        Static exchange evaluation of a capture, in centipawns.
+
+        Positive means the side to move comes out ahead if both sides keep
+        recapturing on the target square as long as it pays for them.
+
+        Args:
+            move: Encoded move, or a (start_pos, end_pos) pair of legal move squares
+        """
+        if not isinstance(move, int):
+            start_pos, end_pos = move
+            move = self._find_move(square_index(start_pos), square_index(end_pos), QUEEN)
+            if move is None:
+                raise ValueError(f"Not a legal move: {start_pos} -> {end_pos}")
+        return static_exchange(self.board, move)
+
+    def search(self, depth: Optional[int] = None, max_nodes: Optional[int] = None,
+               time_limit_ms: Optional[float] = None, cancel_token=None,
+               workers: Optional[int] = None) -> SearchResult:
+        """
+        Search the current position with iterative-deepening alpha-beta.
+
+        Any combination of limits may be given; the search stops at the
+        first one reached and returns the best move of the last completed
+        iteration, so it always answers within the time limit.
+
+        Args:
+            depth: Deepest iteration to run. Defaults to DEFAULT_SEARCH_DEPTH,
+                or to unlimited when another limit is given.
+            max_nodes: Node budget
+            time_limit_ms: Wall-clock budget in milliseconds
+            cancel_token: ``threading.Event`` (or anything with ``is_set()``)
+                that stops the search when set
+            workers: Processes to search with; defaults to ``search_workers``
+
+        Returns:
+            SearchResult with the best encoded move, score, principal
+            variation and stats (depth reached, nodes, nps, elapsed time).
+            Positions the tablebases cover are answered from them at depth 0.
+        """
+        if self.tablebases is not None:
+            result = self.tablebase_move()
+            if result is not None:
+                return result
+        if depth is None:
+            bounded = max_nodes is not None or time_limit_ms is not None or cancel_token is not None
+            depth = MAX_PLY if bounded else DEFAULT_SEARCH_DEPTH
+        workers = self.search_workers if workers is None else workers
+        if workers > 1:
+            return self._parallel_pool(workers).search(self, depth, max_nodes,
+                                                       time_limit_ms, cancel_token)
+        return Search(self, max_depth=depth, max_nodes=max_nodes,
+                      time_limit_ms=time_limit_ms, cancel_token=cancel_token).run()
+
+    def probe_tablebase(self) -> Optional[Tuple[int, int]]:
+        """
+        Look the position up in the tablebases.
+
+        Returns:
+            (result, plies to mate) for the side to move, result being one
+            of ``engine.tablebase`` TB_WIN, TB_DRAW or TB_LOSS; None when
+            there are no tablebases or none covers the position
+        """
+        if self.tablebases is None:
+            return None
+        return self.tablebases.probe(self)
+
+    def book_move(self) -> Optional[SearchResult]:
+        """A move from the opening book, or None when it has none for this position."""
+        if self.opening_book is None:
+            return None
+        move = self.opening_book.choose(self)
+        if move is None:
+            return None
+        return SearchResult(move, 0, 0, 0, [move])
+
+    def tablebase_move(self) -> Optional[SearchResult]:
+        """
+        Best move by the tablebases: the fastest win, else a draw, else
+        the slowest loss. None when the position or one of its captures
+        or promotions is not covered.
+
+        The score is a mate score for the distance to mate, 0 for a draw.
+        """
+        if self.probe_tablebase() is None:
+            return None
+        start = time.perf_counter()
+        best, best_rank, best_score = None, None, 0
+        for move in self.legal_moves():
+            self.push(move)
+            found = self.tablebases.probe(self)
+            self.pop()
+            if found is None:
+                return None
+            result, plies = found
+            # Results are for the opponent, who moves next
+            if result == TB_LOSS:
+                rank, score = (0, plies), MATE_SCORE - plies - 1
+            elif result == TB_WIN:
+                rank, score = (2, -plies), -MATE_SCORE + plies + 1
+            else:
+                rank, score = (1, 0), 0
+            if best_rank is None or rank < best_rank:
+                best, best_rank, best_score = move, rank, score
+        pv = [best] if best is not None else []
+        return SearchResult(best, best_score, 0, 0, pv, time.perf_counter() - start)
+
+    def _parallel_pool(self, workers: int) -> SearchPool:
+        """Helper pool for ``workers`` processes, moving the table to shared memory."""
+        pool = self._search_pool
+        if pool is not None and pool.workers == workers and pool.tt is self.transposition_table:
+            return pool
+        if pool is not None:
+            pool.close()
+        tt = self.transposition_table
+        if tt is None or tt.shared_name is None:
+            size_mb = tt.size_bytes / (1024 * 1024) if tt is not None else DEFAULT_SIZE_MB
+            self.transposition_table = self._shared_tt = TranspositionTable(size_mb, shared=True)
+        self._search_pool = SearchPool(workers, self.transposition_table)
+        return self._search_pool
+
     def get_ai_move(self, difficulty: str = "easy") -> Optional[Tuple[Tuple[int, int], Tuple[int, int]]]:
         """Get an AI move based on the current board state and difficulty."""
+        move = self.think(difficulty).move
+        if move is None:
+            return None
+        return square_pos(move & 63), square_pos((move >> 6) & 63)
+
+    def think(self, difficulty: str = "easy", cancel_token=None) -> SearchResult:
+        """
+        Choose the AI's move as an encoded move.
+
+        Args:
+            difficulty: easy, medium, or one of SEARCH_LEVELS
+            cancel_token: Stops a search-backed difficulty early, as for ``search``
+
+        Returns:
+            SearchResult; ``move`` is None when there are no legal moves.
+            Only the search-backed difficulties fill in the score and PV.
+        """
         import random
+
+        # Book moves take priority at every difficulty
+        result = self.book_move()
+        if result is not None:
+            return result
+
+        # Hard and above: alpha-beta search within the level's budget
+        if difficulty in SEARCH_LEVELS:
+            level = SEARCH_LEVELS[difficulty]
+            return self.search(level["depth"], level["max_nodes"], level["time_limit_ms"],
+                               cancel_token, workers=level.get("workers"))
         
-        # Get all pieces of the current player
-        player_pieces = []
-        for y in range(8):
-            for x in range(8):
-                piece = self.board.board[y][x]
-                if piece and piece[0] == self.current_turn:
-                    player_pieces.append((x, y))
-                    
-        # No pieces left
-        if not player_pieces:
-            return None
-            
         # Collect all legal moves
-        all_moves = []
-        for piece_pos in player_pieces:
-            legal_moves = self.get_legal_moves(piece_pos)
-            for move in legal_moves:
-                all_moves.append((piece_pos, move))
-                
+        legal_moves = self.legal_moves()
+
         # No legal moves
-        if not all_moves:
-            return None
+        if not legal_moves:
+            return SearchResult(None, 0, 0, 0, [])
             
         # Easy: Random move
         if difficulty == "easy":
-            return random.choice(all_moves)
+            move = random.choice(legal_moves)
+            return SearchResult(move, 0, 0, 0, [move])
             
         # Medium: Prioritize captures and checks
         elif difficulty == "medium":
             # Rate each move
             rated_moves = []
-            for start, end in all_moves:
+            for move in legal_moves:
                 score = 0
                 
-                # Check if it's a capture
-                target = self.board.get_piece(end)
-                if target:
-                    piece = self.board.get_piece(start)
-                    target_value = Piece(target[0], target[1]).get_piece_value()
-                    piece_value = Piece(piece[0], piece[1]).get_piece_value()
-                    
-                    # Favor capturing high-value pieces with low-value pieces
-                    score += target_value - piece_value/10
+                # Favor capturing high-value pieces with low-value pieces
+                score += mvv_lva(self.board.mailbox, move) / 100
                 
                 # Check if move puts opponent in check
-                self.board.move_piece(start, end)
-                opponent = "white" if self.current_turn == "black" else "black"
-                if self.is_in_check(opponent):
+                self.push(move)
+                if self.is_in_check(self.current_turn):
                     score += 1
                     
                     # Check for checkmate
-                    old_turn = self.current_turn
-                    self.current_turn = opponent
                     if self.is_checkmate():
                         score += 100  # Very high score for checkmate
-                    self.current_turn = old_turn
                 
                 # Undo the move
-                self.board.move_piece(end, start)
-                if target:
-                    self.board.board[end[1]][end[0]] = target
+                self.pop()
                 
-                rated_moves.append((start, end, score))
+                rated_moves.append((move, score))
             
             # Sort by score and pick one of the top moves
-            rated_moves.sort(key=lambda x: x[2], reverse=True)
+            rated_moves.sort(key=lambda x: x[1], reverse=True)
             top_moves = rated_moves[:max(1, len(rated_moves)//3)]
-            selected = random.choice(top_moves)
-            return (selected[0], selected[1])
+            move = random.choice(top_moves)[0]
+            return SearchResult(move, 0, 0, 0, [move])
             
-        # Hard: Add position evaluation and simple lookahead
+        # Unknown difficulty: fall back to medium
         else:
-            # More sophisticated AI would go here
-            # For now, just use medium difficulty
-            return self.get_ai_move("medium")
+            return self.think("medium")
             
+    def perft(self, depth: int) -> int:
+        """
+        Count the leaf nodes of the legal move tree ``depth`` plies deep.
+
+        Comparing the count with published values checks the move
+        generator; timing it measures generator plus push/pop throughput.
+        """
+        moves = self._legal_moves()
+        if depth <= 1:
+            return len(moves) if depth == 1 else 1
+        nodes = 0
+        for move in moves:
+            self.push(move)
+            nodes += self.perft(depth - 1)
+            self.pop()
+        return nodes
+
+    def divide(self, depth: int) -> Dict[str, int]:
+        """Perft split by root move, keyed by coordinate notation, for finding generator bugs."""
+        counts = {}
+        for move in self._legal_moves():
+            self.push(move)
+            counts[move_name(move)] = self.perft(depth - 1)
+            self.pop()
+        return counts
+
+    def load_fen(self, fen: str):
+        """
+        Set up the position described by a FEN string.
+
+        Raises:
+            ValueError: If the FEN is malformed
+        """
+        fields = fen.split()
+        if len(fields) < 4:
+            raise ValueError(f"Invalid FEN: {fen!r}")
+        ranks = fields[0].split("/")
+        if len(ranks) != 8:
+            raise ValueError(f"Invalid FEN piece placement: {fields[0]!r}")
+
+        board = BitBoard(empty=True)
+        for y, rank in enumerate(ranks):
+            x = 0
+            for char in rank:
+                if char.isdigit():
+                    x += int(char)
+                    continue
+                piece_type = FEN_PIECES.find(char.lower())
+                if piece_type < 0 or x > 7:
+                    raise ValueError(f"Invalid FEN piece placement: {fields[0]!r}")
+                board.put((WHITE if char.isupper() else BLACK) * 6 + piece_type, y * 8 + x)
+                x += 1
+            if x != 8:
+                raise ValueError(f"Invalid FEN piece placement: {fields[0]!r}")
+        if fields[1] not in ("w", "b"):
+            raise ValueError(f"Invalid FEN side to move: {fields[1]!r}")
+        board.refresh_attacks()
+
+        try:
+            halfmove = int(fields[4]) if len(fields) > 4 else 0
+            fullmove = int(fields[5]) if len(fields) > 5 else 1
+        except ValueError:
+            raise ValueError(f"Invalid FEN move counters: {fen!r}") from None
+
+        self.board = board
+        self.side = WHITE if fields[1] == "w" else BLACK
+        self.castling = 0
+        for char, bit in zip("KQkq", (WHITE_KINGSIDE, WHITE_QUEENSIDE, BLACK_KINGSIDE, BLACK_QUEENSIDE)):
+            if char in fields[2]:
+                self.castling |= bit
+        self.ep_square = None
+        if fields[3] != "-":
+            if len(fields[3]) != 2 or fields[3][1] not in "36":
+                raise ValueError(f"Invalid FEN en passant square: {fields[3]!r}")
+            self.ep_square = parse_square(fields[3])
+        self.halfmove_clock = halfmove
+        self.fullmove_number = fullmove
+        self.move_history = []
+        self.last_move = None
+        self._move_stack = []
+        self._undo_stack = []
+        self._hash_history = []
+        self.hash = zobrist_hash(self.board, self.side, self.castling, self.ep_square)
+        self.update_game_state()
+
+    def parse_san(self, san: str) -> int:
+        """
+        Find the legal move written in standard algebraic notation
+        ("Nf3", "exd5", "O-O", "e8=Q+") for the side to move.
+
+        Raises:
+            ValueError: If the text is not exactly one legal move
+        """
+        text = san.rstrip("+#!?")
+        moves = self.legal_moves()
+        if text in ("O-O", "0-0", "O-O-O", "0-0-0"):
+            queenside = len(text) == 5
+            for move in moves:
+                if move >> 15 == FLAG_CASTLE and (((move >> 6) & 63) < (move & 63)) == queenside:
+                    return move
+            raise ValueError(f"Illegal move: {san!r}")
+
+        promotion = 0
+        if "=" in text:
+            text, promoted = text.split("=", 1)
+            promotion = FEN_PIECES.find(promoted.lower())
+        elif text and text[-1] in "QRBN":
+            text, promotion = text[:-1], FEN_PIECES.find(text[-1].lower())
+        if promotion < 0:
+            raise ValueError(f"Invalid promotion: {san!r}")
+
+        piece_type = PAWN
+        if text and text[0] in "NBRQK":
+            piece_type = FEN_PIECES.index(text[0].lower())
+            text = text[1:]
+        text = text.replace("x", "").replace("-", "")
+        if len(text) < 2:
+            raise ValueError(f"Invalid move: {san!r}")
+        to_sq = parse_square(text[-2:])
+        origin = text[:-2]  # Disambiguating file and/or rank
+
+        mailbox = self.board.mailbox
+        candidates = [
+            move for move in moves
+            if (move >> 6) & 63 == to_sq and (move >> 12) & 7 == promotion
+            and mailbox[move & 63] % 6 == piece_type
+            and all(char in square_name(move & 63) for char in origin)
+        ]
+        if len(candidates) != 1:
+            raise ValueError(f"{'Ambiguous' if candidates else 'Illegal'} move: {san!r}")
+        return candidates[0]
+
+    def to_fen(self) -> str:
+        """FEN string of the current position."""
+        mailbox = self.board.mailbox
+        ranks = []
+        for y in range(8):
+            rank, empty = "", 0
+            for x in range(8):
+                piece = mailbox[y * 8 + x]
+                if piece is None:
+                    empty += 1
+                    continue
+                if empty:
+                    rank += str(empty)
+                    empty = 0
+                char = FEN_PIECES[piece % 6]
+                rank += char.upper() if piece < 6 else char
+            ranks.append(rank + (str(empty) if empty else ""))
+        castling = "".join(char for char, bit in zip("KQkq", (WHITE_KINGSIDE, WHITE_QUEENSIDE,
+                                                              BLACK_KINGSIDE, BLACK_QUEENSIDE))
+                           if self.castling & bit) or "-"
+        ep = "-" if self.ep_square is None else square_name(self.ep_square)
+        return (f"{'/'.join(ranks)} {'w' if self.side == WHITE else 'b'} {castling} {ep} "
+                f"{self.halfmove_clock} {self.fullmove_number}")
+
     def get_game_state_for_saving(self) -> Dict[str, Any]:
         """Prepare the current game state for saving to a file."""
         return {
-            "board": [[self.board.board[y][x] for x in range(8)] for y in range(8)],
+            "board": self.board.board,
             "current_turn": self.current_turn,
             "game_state": self.game_state,
             "castle_rights": self.castle_rights,
@@ -378,10 +1012,8 @@ class GameEngine:
         """Load a game state from a saved dictionary."""
         try:
             # Reconstruct the board
-            self.board = Board()
-            for y in range(8):
-                for x in range(8):
-                    self.board.board[y][x] = state["board"][y][x]
+            self.board = BitBoard(empty=True)
+            self.board.set_from_rows(state["board"])
                     
             # Load other state variables
             self.current_turn = state["current_turn"]
@@ -390,12 +1022,23 @@ class GameEngine:
             self.move_history = state["move_history"]
             self.halfmove_clock = state["halfmove_clock"]
             self.fullmove_number = state["fullmove_number"]
+            self._move_stack = []
+            self._undo_stack = []
+            self._hash_history = []
             
             # Set last move if there's move history
             if self.move_history:
                 self.last_move = self.move_history[-1]
             else:
                 self.last_move = None
+
+            # A double pawn push on the last move allows en passant
+            self.ep_square = None
+            if self.last_move:
+                start, end, piece = self.last_move
+                if piece[1] == "pawn" and abs(end[1] - start[1]) == 2:
+                    self.ep_square = square_index((start[0], (start[1] + end[1]) // 2))
+            self.hash = zobrist_hash(self.board, self.side, self.castling, self.ep_square)
                 
             return True
         except (KeyError, IndexError) as e:
@@ -1,9 +1,6 @@
-from Chess_Project.engine.board import Board
-from Chess_Project.engine.piece import Piece
-
-=======
-from typing import List, Tuple, Optional
+from typing import List, Tuple
 from .board import Board
+from .memo import PositionMemo
  
 
 class GameManager:
@@ -12,80 +9,16 @@ class GameManager:
     def __init__(self):
         """Initialize a new chess game"""
         self.board = Board()
-        self.current_turn = "white"
-
-    def move_piece(self, start_pos, end_pos):
-        """
-        מבצע מהלך אם הוא חוקי.
-        """
-        piece = self.board.board[start_pos[1]][start_pos[0]]
-        if piece and piece[0] == self.current_turn:
-            # Check if the move is legal
-            if end_pos in self.get_legal_moves(start_pos):
-                self.board.move_piece(start_pos, end_pos)
-                self.current_turn = "black" if self.current_turn == "white" else "white"
-                return True
-        return False
-
-    def get_legal_moves(self, pos):
-        """
-        מחזיר את כל המהלכים החוקיים לכלי במיקום מסוים.
-        """
-        piece = self.board.board[pos[1]][pos[0]]
-        if piece:
-            return Piece(piece[0], piece[1]).valid_moves(self.board.board, pos)
-        return []
-
-    def is_check(self, color):
-        """
-        Checks if the given color is in check.
-        """
-        king_pos = self.find_king(color)
-        for row in range(8):
-            for col in range(8):
-                piece = self.board.board[row][col]
-                if piece and piece[0] != color:
-                    if king_pos in self.get_legal_moves((col, row)):
-                        return True
-        return False
-
-    def find_king(self, color):
-        """
-        Finds the position of the king of the given color.
-        """
-        for row in range(8):
-            for col in range(8):
-                piece = self.board.board[row][col]
-                if piece and piece[0] == color and piece[1] == "king":
-                    return (col, row)
-        return None
-
-    def is_checkmate(self, color):
-        """
-        Checks if the given color is in checkmate.
-        """
-        if not self.is_check(color):
-            return False
-        for row in range(8):
-            for col in range(8):
-                piece = self.board.board[row][col]
-                if piece and piece[0] == color:
-                    legal_moves = self.get_legal_moves((col, row))
-                    for move in legal_moves:
-                        original_piece = self.board.board[move[1]][move[0]]
-                        self.board.move_piece((col, row), move)
-                        if not self.is_check(color):
-                            self.board.move_piece(move, (col, row))
-                            self.board.board[move[1]][move[0]] = original_piece
-                            return False
-                        self.board.move_piece(move, (col, row))
-                        self.board.board[move[1]][move[0]] = original_piece
-        return True
-=======
         self.current_player = "white"
         self.game_over = False
         self.winner = None
         self.move_history = []
+        self.position_version = 0  # Bumped whenever the position changes
+        self.memo = PositionMemo()  # Legal moves and check results for position_version
+
+    def position_changed(self):
+        """Invalidate memoized results after changing the board or the player to move."""
+        self.position_version += 1
     
     def move_piece(self, from_pos: Tuple[int, int], to_pos: Tuple[int, int]) -> bool:
         """Attempt to move a piece according to chess rules"""
@@ -123,6 +56,7 @@ class GameManager:
         
         # Switch player
         self.current_player = "black" if self.current_player == "white" else "white"
+        self.position_changed()
         
         # Check game state (checkmate, stalemate, etc.)
         self._check_game_state()
@@ -130,7 +64,17 @@ class GameManager:
         return True
     
     def get_legal_moves(self, position: Tuple[int, int]) -> List[Tuple[int, int]]:
-        """Get all legal moves for a piece at the given position"""
+        """
+        Get all legal moves for a piece at the given position.
+
+        Memoized until the position changes; callers must not modify the list.
+        """
+        position = tuple(position)  # Lists are accepted too, but only tuples are hashable
+        return self.memo.get((self.position_version, self.current_player), ("moves", position),
+                             lambda: self._legal_moves_from(position))
+
+    def _legal_moves_from(self, position: Tuple[int, int]) -> List[Tuple[int, int]]:
+        """Legal moves for a piece, computed from scratch"""
         col, row = position
         piece = self.board.get_piece(row, col)
         
@@ -174,6 +118,7 @@ class GameManager:
         
         # Switch back to previous player
         self.current_player = "black" if self.current_player == "white" else "white"
+        self.position_changed()
         
         # Reset game state
         self.game_over = False
@@ -188,7 +133,12 @@ class GameManager:
         pass
     
     def is_in_check(self, color: str) -> bool:
-        """Check if the specified color's king is in check"""
+        """Check if the specified color's king is in check (memoized until the position changes)"""
+        return self.memo.get((self.position_version, self.current_player), ("check", color),
+                             lambda: self._king_attacked(color))
+
+    def _king_attacked(self, color: str) -> bool:
+        """Scan the board for an attack on ``color``'s king"""
         # Find the king
         king_pos = None
         for row in range(8):
@@ -0,0 +1,52 @@
+"""
+Memoization of position queries (legal moves, check) between moves.
+
+The GUI asks the same questions about the same position every frame.
+``PositionMemo`` keeps each answer under the version of the position it
+was computed for and drops them all as soon as a different version is
+asked about, so a result is computed once per position however often it
+is requested.
+"""
+from typing import Any, Callable, Dict, Hashable
+
+
+class PositionMemo:
+    """Query results for the current position version, with hit counters."""
+
+    def __init__(self):
+        self.version: Hashable = None
+        self._results: Dict[Hashable, Any] = {}
+
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, version: Hashable, query: Hashable, compute: Callable[[], Any]) -> Any:
+        """
+        Result of ``query`` for position ``version``, calling ``compute``
+        only if it is not cached yet. Callers must not modify the result.
+        """
+        if version != self.version:
+            self._results = {}
+            self.version = version
+        results = self._results
+        if query in results:
+            self.hits += 1
+            return results[query]
+        self.misses += 1
+        value = results[query] = compute()
+        return value
+
+    def clear(self):
+        """Forget every cached result."""
+        self._results = {}
+        self.version = None
+
+    def stats(self) -> Dict[str, Any]:
+        """How often queries were answered from the memo, and how many results it holds now."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "cached": len(self._results),
+        }
@@ -0,0 +1,149 @@
+"""
+Move ordering for alpha-beta search.
+
+Moves are tried in this order:
+
+1. the transposition-table move
+2. captures, most valuable victim first, then least valuable attacker
+3. promotions
+4. the two killer moves stored for this ply
+5. every other quiet move, ranked by the history table
+
+Killer and history statistics persist across iterative-deepening
+iterations, so each iteration starts from what the previous one learned.
+"""
+from typing import Dict, List
+
+from .bitboard import FLAG_EN_PASSANT, KING
+from .search import MAX_PLY, PIECE_VALUES
+
+TT_MOVE_SCORE = 1 << 30
+CAPTURE_SCORE = 1 << 28
+PROMOTION_SCORE = 1 << 27
+KILLER_SCORE = 1 << 26
+HISTORY_LIMIT = 1 << 24  # History is halved once any entry grows past this
+
+# The king's own value is 0 for material; as an attacker it counts as the most valuable
+_ATTACKER_VALUES = PIECE_VALUES[:KING] + (2000,)
+
+MOVE_KINDS = ("tt", "capture", "promotion", "killer", "quiet")
+
+
+def mvv_lva(mailbox: List, move: int) -> int:
+    """
+    Capture score in centipawns: victim value minus a tenth of the attacker's.
+
+    Returns 0 for moves that do not capture.
+    """
+    attacker = mailbox[move & 63]
+    if move >> 15 == FLAG_EN_PASSANT:
+        victim_value = PIECE_VALUES[0]
+    else:
+        victim = mailbox[(move >> 6) & 63]
+        if victim is None:
+            return 0
+        victim_value = PIECE_VALUES[victim % 6]
+    return victim_value - _ATTACKER_VALUES[attacker % 6] // 10
+
+
+class MoveOrderer:
+    """Ranks moves for the search and learns from the cutoffs it reports."""
+
+    def __init__(self):
+        self.killers = [[0, 0] for _ in range(MAX_PLY + 1)]
+        self.history = [0] * 4096  # Indexed by from | to << 6
+
+        self.cutoffs = 0
+        self.first_move_cutoffs = 0
+        self.cutoffs_by_kind = dict.fromkeys(MOVE_KINDS, 0)
+
+    def new_search(self):
+        """
+        Prepare for a search from a new root.
+
+        Killers are tied to plies from the root, which shift once a move has
+        been played, so they are dropped. History is halved rather than
+        cleared so good quiet moves keep some credit.
+        """
+        for slot in self.killers:
+            slot[0] = slot[1] = 0
+        self.history = [value >> 1 for value in self.history]
+
+    def order(self, mailbox: List, moves: List[int], ply: int, tt_move: int = 0) -> List[int]:
+        """Sort ``moves`` in place, best candidates first, and return them."""
+        killer_1, killer_2 = self.killers[ply]
+        history = self.history
+
+        def score(move: int) -> int:
+            if move == tt_move:
+                return TT_MOVE_SCORE
+            victim = mailbox[(move >> 6) & 63]
+            if victim is not None or move >> 15 == FLAG_EN_PASSANT:
+                return CAPTURE_SCORE + mvv_lva(mailbox, move)
+            promotion = (move >> 12) & 7
+            if promotion:
+                return PROMOTION_SCORE + promotion
+            if move == killer_1:
+                return KILLER_SCORE + 1
+            if move == killer_2:
+                return KILLER_SCORE
+            return history[move & 4095]
+
+        moves.sort(key=score, reverse=True)
+        return moves
+
+    def classify(self, mailbox: List, move: int, ply: int, tt_move: int = 0) -> str:
+        """Which ordering rule placed ``move`` where it was."""
+        if move == tt_move:
+            return "tt"
+        if mailbox[(move >> 6) & 63] is not None or move >> 15 == FLAG_EN_PASSANT:
+            return "capture"
+        if (move >> 12) & 7:
+            return "promotion"
+        if move in self.killers[ply]:
+            return "killer"
+        return "quiet"
+
+    def record_cutoff(self, mailbox: List, move: int, move_number: int,
+                      depth: int, ply: int, tt_move: int = 0):
+        """
+        Learn from a beta cutoff caused by the ``move_number``-th move tried.
+
+        Must be called before the move is made, while ``mailbox`` still
+        shows what the move captures.
+        """
+        kind = self.classify(mailbox, move, ply, tt_move)
+        self.cutoffs += 1
+        self.cutoffs_by_kind[kind] += 1
+        if move_number == 0:
+            self.first_move_cutoffs += 1
+        if kind in ("capture", "promotion"):
+            return
+
+        # Quiet move: remember it as a killer for this ply and credit its history
+        killers = self.killers[ply]
+        if killers[0] != move:
+            killers[1] = killers[0]
+            killers[0] = move
+        index = move & 4095
+        self.history[index] += depth * depth
+        if self.history[index] > HISTORY_LIMIT:
+            self.history = [value >> 1 for value in self.history]
+
+    def reset_stats(self):
+        """Zero the cutoff counters."""
+        self.cutoffs = 0
+        self.first_move_cutoffs = 0
+        self.cutoffs_by_kind = dict.fromkeys(MOVE_KINDS, 0)
+
+    def stats(self) -> Dict[str, float]:
+        """Cutoff counters for tuning; a high first-move rate means good ordering."""
+        result = {
+            "cutoffs": self.cutoffs,
+            "first_move_cutoffs": self.first_move_cutoffs,
+            "first_move_rate": self.first_move_cutoffs / self.cutoffs if self.cutoffs else 0.0,
+            "history_max": max(self.history),
+        }
+        for kind, count in self.cutoffs_by_kind.items():
+            result[f"{kind}_cutoffs"] = count
+        return result
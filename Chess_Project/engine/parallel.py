@@ -0,0 +1,140 @@
+"""
+Lazy SMP: several processes search the same root and share one
+transposition table.
+
+Helpers run an ordinary iterative-deepening search of their own copy of
+the position. They do not split the tree between them; instead every
+entry one process stores is visible to the others through the table in
+shared memory, so each iteration finds more of the tree already searched.
+Helpers start at staggered depths so their iterations drift apart instead
+of repeating each other.
+
+The main process runs its own search alongside the helpers. Once it
+finishes, the helpers are told to stop and the deepest completed result
+of all processes is returned.
+"""
+import multiprocessing as mp
+import queue
+import time
+from typing import List, Optional, Tuple
+
+from .search import Search, SearchResult
+from .transposition import TranspositionTable
+
+RESULT_TIMEOUT = 5.0  # Seconds to wait for a stopped helper to report back
+
+
+def _helper_main(worker_id: int, tasks, results, stop, tt_name: str, tt_entries: int):
+    """Helper process loop: search each position received until told to exit."""
+    tt = TranspositionTable.attach(tt_name, tt_entries)
+    try:
+        while True:
+            task = tasks.get()
+            if task is None:
+                break
+            engine, generation, limits = task
+            engine.transposition_table = tt
+            tt.generation = generation
+            result = Search(engine, cancel_token=stop, **limits).run()
+            results.put((worker_id, result.move, result.score, result.depth,
+                         result.nodes, result.pv))
+    finally:
+        tt.close()
+
+
+class SearchPool:
+    """Persistent helper processes for parallel search on a shared table."""
+
+    def __init__(self, workers: int, tt: TranspositionTable):
+        """
+        Args:
+            workers: Total number of searching processes, including the
+                caller's own; ``workers - 1`` helpers are started
+            tt: Table created with ``shared=True``
+        """
+        if tt.shared_name is None:
+            raise ValueError("Parallel search needs a shared transposition table")
+        self.workers = max(1, workers)
+        self.tt = tt
+        context = mp.get_context("spawn")
+        self._stop = context.Event()
+        self._results = context.Queue()
+        self._tasks = []
+        self._processes = []
+        for worker_id in range(1, self.workers):
+            tasks = context.Queue()
+            process = context.Process(
+                target=_helper_main,
+                args=(worker_id, tasks, self._results, self._stop, tt.shared_name, len(tt.keys)),
+                daemon=True,
+            )
+            process.start()
+            self._tasks.append(tasks)
+            self._processes.append(process)
+
+    def search(self, engine, max_depth: int, max_nodes: Optional[int] = None,
+               time_limit_ms: Optional[float] = None, cancel_token=None) -> SearchResult:
+        """
+        Search ``engine``'s position on every worker and return the deepest
+        completed result; on equal depth the main process's result wins.
+
+        Limits apply to each process separately, so ``max_nodes`` bounds
+        every worker rather than the total. The returned ``nodes`` is the
+        sum over all workers.
+        """
+        start = time.perf_counter()
+        self._stop.clear()
+        position = engine.copy()
+        position.opening_book = None  # Memory-mapped; helpers only search
+        position.tablebases = None
+        for worker_id, tasks in enumerate(self._tasks, start=1):
+            limits = {"max_depth": max_depth, "max_nodes": max_nodes,
+                      "time_limit_ms": time_limit_ms, "start_depth": 1 + worker_id % 2}
+            tasks.put((position, self.tt.generation, limits))
+
+        result = Search(engine, max_depth=max_depth, max_nodes=max_nodes,
+                        time_limit_ms=time_limit_ms, cancel_token=cancel_token).run()
+        self._stop.set()
+
+        best = result
+        nodes = result.nodes
+        for move, score, depth, helper_nodes, pv in self._collect():
+            nodes += helper_nodes
+            if move is not None and depth > best.depth:
+                best = SearchResult(move, score, depth, 0, pv)
+
+        best.nodes = nodes
+        best.elapsed = time.perf_counter() - start
+        best.aborted = result.aborted
+        return best
+
+    def _collect(self) -> List[Tuple]:
+        """Wait for every live helper to report its result."""
+        reports = []
+        pending = len(self._processes)
+        while pending:
+            try:
+                reports.append(self._results.get(timeout=RESULT_TIMEOUT)[1:])
+            except queue.Empty:
+                if not all(process.is_alive() for process in self._processes):
+                    raise RuntimeError("A parallel search helper exited unexpectedly")
+                continue
+            pending -= 1
+        return reports
+
+    def close(self):
+        """Shut the helpers down."""
+        for tasks in self._tasks:
+            tasks.put(None)
+        for process in self._processes:
+            process.join(timeout=RESULT_TIMEOUT)
+            if process.is_alive():
+                process.terminate()
+        self._tasks = []
+        self._processes = []
+
+    def __enter__(self) -> "SearchPool":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,210 @@
+"""
+Perft driver and move-generator benchmark.
+
+Perft counts the leaf nodes of the legal move tree to a fixed depth.
+Published counts for a few well-known positions catch almost any
+move-generation bug (castling through check, en passant discovered
+checks, promotions), and timing the same walk gives a throughput figure
+for the generator and ``push``/``pop``.
+
+Run from the ``Chess_Project`` directory::
+
+    python -m engine.perft                      # reference suite, depth 3
+    python -m engine.perft --depth 4 --save perft_baseline.json
+    python -m engine.perft --compare perft_baseline.json
+    python -m engine.perft --fen "<FEN>" --depth 3 --divide
+
+The exit status is 1 when any count differs from the reference.
+"""
+import argparse
+import json
+import platform
+import sys
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from .game_engine import GameEngine
+
+START_FEN = "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1"
+
+# (name, FEN, node counts for depth 1, 2, ...)
+REFERENCE_POSITIONS: List[Tuple[str, str, List[int]]] = [
+    ("start", START_FEN,
+     [20, 400, 8902, 197281, 4865609]),
+    ("kiwipete", "r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1",
+     [48, 2039, 97862, 4085603]),
+    ("position3", "8/2p5/3p4/KP5r/1R3p1k/8/4P1P1/8 w - - 0 1",
+     [14, 191, 2812, 43238, 674624]),
+    ("position4", "r3k2r/Pppp1ppp/1b3nbN/nP6/BBP1P3/q4N2/Pp1P2PP/R2Q1RK1 w kq - 0 1",
+     [6, 264, 9467, 422333]),
+    ("position5", "rnbq1k1r/pp1Pbppp/2p5/8/2B5/8/PPP1NnPP/RNBQK2R w KQ - 1 8",
+     [44, 1486, 62379, 2103487]),
+    ("position6", "r4rk1/1pp1qppp/p1np1n2/2b1p1B1/2B1P1b1/P1NP1N2/1PP1QPPP/R4RK1 w - - 0 10",
+     [46, 2079, 89890, 3894594]),
+]
+
+DEFAULT_DEPTH = 3
+PHASES = ("generate", "push", "pop")
+
+
+def perft_phases(engine: GameEngine, depth: int) -> Dict[str, float]:
+    """
+    Walk the same tree as ``engine.perft`` but time move generation,
+    ``push`` and ``pop`` separately.
+
+    The timer calls add overhead, so the phase totals exceed a plain perft
+    run; use them for proportions, not absolute speed.
+    """
+    clock = time.perf_counter
+    totals = dict.fromkeys(PHASES, 0.0)
+
+    def walk(depth: int):
+        start = clock()
+        moves = engine._legal_moves()
+        totals["generate"] += clock() - start
+        if depth <= 1:
+            return
+        for move in moves:
+            start = clock()
+            engine.push(move)
+            totals["push"] += clock() - start
+            walk(depth - 1)
+            start = clock()
+            engine.pop()
+            totals["pop"] += clock() - start
+
+    if depth > 0:
+        walk(depth)
+    return totals
+
+
+def run_position(fen: str, depth: int, expected: Optional[int] = None) -> Dict[str, Any]:
+    """Perft one position, timed, with a phase breakdown from a second pass."""
+    engine = GameEngine()
+    engine.load_fen(fen)
+    start = time.perf_counter()
+    nodes = engine.perft(depth)
+    seconds = time.perf_counter() - start
+    phases = perft_phases(engine, depth)
+    return {
+        "fen": fen,
+        "depth": depth,
+        "nodes": nodes,
+        "expected": expected,
+        "ok": expected is None or nodes == expected,
+        "seconds": round(seconds, 4),
+        "nps": int(nodes / seconds) if seconds > 0 else 0,
+        "phases": {name: round(value, 4) for name, value in phases.items()},
+    }
+
+
+def run_suite(depth: int = DEFAULT_DEPTH, names: Optional[List[str]] = None) -> Dict[str, Any]:
+    """
+    Perft every reference position (or those in ``names``) to ``depth``,
+    capped at the deepest published count for each.
+    """
+    results = {}
+    for name, fen, counts in REFERENCE_POSITIONS:
+        if names and name not in names:
+            continue
+        position_depth = min(depth, len(counts))
+        results[name] = run_position(fen, position_depth, counts[position_depth - 1])
+
+    nodes = sum(result["nodes"] for result in results.values())
+    seconds = sum(result["seconds"] for result in results.values())
+    return {
+        "python": platform.python_version(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "depth": depth,
+        "positions": results,
+        "total": {
+            "nodes": nodes,
+            "seconds": round(seconds, 4),
+            "nps": int(nodes / seconds) if seconds > 0 else 0,
+            "ok": all(result["ok"] for result in results.values()),
+        },
+    }
+
+
+def compare(report: Dict[str, Any], baseline: Dict[str, Any]) -> List[str]:
+    """Lines describing how ``report`` differs from a saved baseline."""
+    lines = []
+    for name, result in report["positions"].items():
+        old = baseline.get("positions", {}).get(name)
+        if old is None:
+            lines.append(f"{name:<10} not in baseline")
+            continue
+        if old["depth"] != result["depth"]:
+            lines.append(f"{name:<10} depth {result['depth']} vs baseline depth {old['depth']}")
+            continue
+        change = (result["nps"] / old["nps"] - 1) * 100 if old["nps"] else 0.0
+        line = f"{name:<10} {old['nps']:>9} -> {result['nps']:>9} nps ({change:+.1f}%)"
+        if old["nodes"] != result["nodes"]:
+            line += f"  NODE COUNT CHANGED {old['nodes']} -> {result['nodes']}"
+        lines.append(line)
+    old_total, total = baseline.get("total", {}), report["total"]
+    if old_total.get("nps"):
+        change = (total["nps"] / old_total["nps"] - 1) * 100
+        lines.append(f"{'total':<10} {old_total['nps']:>9} -> {total['nps']:>9} nps ({change:+.1f}%)")
+    return lines
+
+
+def _print_result(name: str, result: Dict[str, Any]):
+    phases = result["phases"]
+    phase_total = sum(phases.values()) or 1.0
+    breakdown = "  ".join(f"{phase} {phases[phase] / phase_total:4.0%}" for phase in PHASES)
+    status = "ok" if result["ok"] else f"MISMATCH (expected {result['expected']})"
+    print(f"{name:<10} d{result['depth']} {result['nodes']:>9} nodes "
+          f"{result['seconds']:8.3f}s {result['nps']:>9} nps  {breakdown}  {status}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Perft driver and move-generator benchmark")
+    parser.add_argument("--depth", type=int, default=DEFAULT_DEPTH, help="perft depth")
+    parser.add_argument("--fen", help="position to test instead of the reference suite")
+    parser.add_argument("--divide", action="store_true", help="print the count for each root move")
+    parser.add_argument("--position", action="append", dest="positions",
+                        help="reference position to run (repeatable)")
+    parser.add_argument("--save", metavar="PATH", help="write the results as a JSON baseline")
+    parser.add_argument("--compare", metavar="PATH", help="compare with a saved JSON baseline")
+    args = parser.parse_args(argv)
+    if args.depth < 1:
+        parser.error("--depth must be at least 1")
+
+    if args.fen:
+        engine = GameEngine()
+        try:
+            engine.load_fen(args.fen)
+        except ValueError as e:
+            parser.error(str(e))
+        if args.divide:
+            counts = engine.divide(args.depth)
+            for move in sorted(counts):
+                print(f"{move}: {counts[move]}")
+            print(f"\nMoves: {len(counts)}  Nodes: {sum(counts.values())}")
+            return 0
+        _print_result("fen", run_position(args.fen, args.depth))
+        return 0
+
+    report = run_suite(args.depth, args.positions)
+    for name, result in report["positions"].items():
+        _print_result(name, result)
+    total = report["total"]
+    print(f"{'total':<10}    {total['nodes']:>9} nodes {total['seconds']:8.3f}s {total['nps']:>9} nps")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        print(f"\nCompared with {args.compare} ({baseline.get('timestamp', 'unknown date')}):")
+        for line in compare(report, baseline):
+            print(line)
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nBaseline saved to {args.save}")
+    return 0 if total["ok"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,114 @@
+"""
+Pondering: thinking on the opponent's time.
+
+After the AI moves, its principal variation predicts the opponent's reply.
+A ``Ponderer`` searches the position after that reply in a background
+thread while the opponent is on move, writing into the engine's own
+transposition table and move-ordering history.
+
+If the opponent plays the predicted move ("ponder hit"), the running
+search is simply given the AI's normal budget and keeps going, so the
+iterations it has already completed are not repeated. Any other move
+stops it; the table entries it wrote still help the next search.
+Positions covered by the opening book or the tablebases are answered
+from them, as ``GameEngine.think`` would, without searching.
+"""
+import threading
+from typing import Optional
+
+from .search import MAX_PLY, Search, SearchResult
+
+
+class Ponderer:
+    """Background search of the position the AI expects to face next."""
+
+    def __init__(self, engine):
+        """
+        Args:
+            engine: GameEngine the AI plays with; pondering uses its
+                transposition table and move orderer
+        """
+        self.engine = engine
+        self.predicted_move: Optional[int] = None
+        self._position = None
+        self._search: Optional[Search] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._result: Optional[SearchResult] = None
+
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def active(self) -> bool:
+        """Whether a ponder search has been started and not stopped."""
+        return self._thread is not None
+
+    def start(self, predicted_move: int, max_depth: int = MAX_PLY):
+        """
+        Start searching the position after the opponent plays ``predicted_move``.
+
+        ``max_depth`` should be the depth of the AI's difficulty level, so
+        a ponder hit answers with the same strength as a normal search.
+        """
+        self.stop()
+        position = self.engine.copy()
+        position.transposition_table = self.engine.tt
+        position.move_orderer = self.engine.move_orderer
+        position.push(predicted_move)
+
+        self.predicted_move = predicted_move
+        self._result = None
+        self._stop.clear()
+        self._position = position
+        self._search = Search(position, max_depth=max_depth, cancel_token=self._stop)
+        self._thread = threading.Thread(target=self._run, name="ponder", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        position = self._position
+        result = position.book_move()
+        if result is None and position.tablebases is not None:
+            result = position.tablebase_move()
+        self._result = result if result is not None else self._search.run()
+
+    def opponent_moved(self, move: int, time_limit_ms: Optional[float] = None,
+                       max_nodes: Optional[int] = None) -> bool:
+        """
+        Report the opponent's move.
+
+        On a ponder hit the search continues under the given budget and
+        True is returned; poll ``done`` and collect it with ``result``.
+        Otherwise the search is stopped and False is returned.
+        """
+        if not self.active:
+            return False
+        if move != self.predicted_move:
+            self.misses += 1
+            self.stop()
+            return False
+        self.hits += 1
+        self._search.limit(time_limit_ms, max_nodes)
+        return True
+
+    def done(self) -> bool:
+        """Whether the search has finished."""
+        return self._thread is not None and not self._thread.is_alive()
+
+    def result(self) -> Optional[SearchResult]:
+        """Wait for the search to finish and return it, clearing the ponderer."""
+        if self._thread is None:
+            return None
+        self._thread.join()
+        result = self._result
+        self._thread = self._search = self._position = None
+        self.predicted_move = None
+        return result
+
+    def stop(self):
+        """Abandon the ponder search, if any."""
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+        self._thread = self._search = self._position = self._result = None
+        self.predicted_move = None
@@ -0,0 +1,350 @@
+"""
+Iterative-deepening negamax search with alpha-beta pruning.
+
+The search runs directly on a ``GameEngine`` using ``push``/``pop`` and
+shares the engine's transposition table, so results carry over between
+iterations and between moves of the same game.
+
+Searches are anytime: a depth limit, a node budget, a wall-clock deadline
+and a cancellation token can be combined, and whichever runs out first
+stops the search with the result of the last completed iteration.
+"""
+import time
+from typing import Any, Dict, List, Optional
+
+from .bitboard import (
+    PAWN, KNIGHT, BISHOP, ROOK, QUEEN, KING, WHITE,
+    FLAG_CASTLE, FLAG_EN_PASSANT,
+)
+from .evaluation import evaluate
+from .transposition import EXACT, LOWER_BOUND, UPPER_BOUND, MATE_SCORE
+
+MAX_PLY = 64
+INFINITY = MATE_SCORE + 1
+LIMIT_CHECK_INTERVAL = 1024  # Nodes between clock / cancellation checks
+
+# Material values in centipawns, indexed by piece type
+PIECE_VALUES = (100, 320, 330, 500, 900, 0)
+# Exchange values: the king is worth more than anything it could win
+SEE_VALUES = PIECE_VALUES[:KING] + (20000,)
+
+
+class SearchAborted(Exception):
+    """Raised inside the tree when the search budget runs out."""
+
+
+class SearchResult:
+    """Outcome of a search: best move, its score and how much work it took."""
+
+    def __init__(self, move: Optional[int], score: int, depth: int,
+                 nodes: int, pv: List[int], elapsed: float = 0.0, aborted: bool = False):
+        self.move = move        # Encoded best move, None if there are no legal moves
+        self.score = score      # Centipawns from the side to move's point of view
+        self.depth = depth      # Deepest fully completed iteration
+        self.nodes = nodes      # Nodes visited, including any unfinished iteration
+        self.pv = pv            # Principal variation, starting with ``move``
+        self.elapsed = elapsed  # Wall-clock seconds
+        self.aborted = aborted  # Whether a budget or cancellation cut the search short
+
+    @property
+    def elapsed_ms(self) -> float:
+        """Wall-clock time in milliseconds."""
+        return self.elapsed * 1000
+
+    @property
+    def nps(self) -> int:
+        """Nodes searched per second."""
+        return int(self.nodes / self.elapsed) if self.elapsed > 0 else 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Search statistics for logging or display."""
+        return {
+            "depth": self.depth,
+            "nodes": self.nodes,
+            "nps": self.nps,
+            "elapsed_ms": round(self.elapsed_ms, 1),
+            "score": self.score,
+            "aborted": self.aborted,
+        }
+
+    def __repr__(self) -> str:
+        return (f"SearchResult(move={self.move}, score={self.score}, "
+                f"depth={self.depth}, nodes={self.nodes}, elapsed_ms={self.elapsed_ms:.1f})")
+
+
+def static_exchange(board, move: int) -> int:
+    """
+    Static exchange evaluation: the material the side making ``move`` wins
+    or loses if both sides keep recapturing on the target square with their
+    least valuable attacker, each stopping whenever continuing would lose.
+
+    Attackers are recomputed from the shrinking occupancy after every
+    capture, so sliders lined up behind each other (x-rays) join in.
+    """
+    mailbox = board.mailbox
+    from_sq, to_sq = move & 63, (move >> 6) & 63
+    promotion, flag = (move >> 12) & 7, move >> 15
+    if flag == FLAG_CASTLE:
+        return 0
+
+    mover = mailbox[from_sq]
+    side = mover // 6
+    occupied = board.occupied ^ (1 << from_sq)
+    if flag == FLAG_EN_PASSANT:
+        gain = SEE_VALUES[PAWN]
+        occupied ^= 1 << (to_sq + 8 if side == WHITE else to_sq - 8)
+    else:
+        victim = mailbox[to_sq]
+        gain = 0 if victim is None else SEE_VALUES[victim % 6]
+
+    on_square = SEE_VALUES[mover % 6]
+    if promotion:
+        gain += SEE_VALUES[promotion] - SEE_VALUES[PAWN]
+        on_square = SEE_VALUES[promotion]
+
+    gains = [gain]
+    pieces = board.pieces
+    side ^= 1
+    while True:
+        attackers = board.attackers_to(to_sq, side, occupied) & occupied
+        if not attackers:
+            break
+        base = side * 6
+        for piece_type in (PAWN, KNIGHT, BISHOP, ROOK, QUEEN, KING):
+            candidates = attackers & pieces[base + piece_type]
+            if candidates:
+                break
+        if piece_type == KING and board.attackers_to(to_sq, side ^ 1, occupied) & occupied:
+            break  # The king cannot recapture onto a defended square
+        gains.append(on_square - gains[-1])
+        on_square = SEE_VALUES[piece_type]
+        occupied ^= candidates & -candidates
+        side ^= 1
+
+    # Each side may stop instead of recapturing, so fold the sequence back
+    for i in range(len(gains) - 1, 0, -1):
+        gains[i - 1] = -max(-gains[i - 1], gains[i])
+    return gains[0]
+
+
+class Search:
+    """Alpha-beta searcher bound to one engine."""
+
+    def __init__(self, engine, max_depth: int = 4, max_nodes: Optional[int] = None,
+                 time_limit_ms: Optional[float] = None, cancel_token=None,
+                 start_depth: int = 1):
+        """
+        Args:
+            engine: GameEngine whose current position is searched
+            max_depth: Deepest iteration to run
+            max_nodes: Stop once this many nodes have been visited
+            time_limit_ms: Stop once this much wall-clock time has passed
+            cancel_token: Object with an ``is_set()`` method, such as a
+                ``threading.Event``; the search stops once it is set
+            start_depth: First iteration to run. Parallel helpers start
+                at different depths so they do not all repeat one search.
+        """
+        self.engine = engine
+        self.tt = engine.tt
+        self.orderer = engine.move_orderer
+        self.max_depth = min(max_depth, MAX_PLY)
+        self.max_nodes = max_nodes
+        self.time_limit = None if time_limit_ms is None else time_limit_ms / 1000
+        self.cancel_token = cancel_token
+        self.start_depth = max(1, min(start_depth, self.max_depth))
+        self.nodes = 0
+        self.pv_table: List[List[int]] = [[] for _ in range(MAX_PLY + 1)]
+        self._deadline: Optional[float] = None
+        self._next_check = 0
+
+    def _check_limits(self):
+        """Abort the search if any budget is exhausted; called every few nodes."""
+        if self.max_nodes is not None and self.nodes > self.max_nodes:
+            raise SearchAborted()
+        if self._deadline is not None and time.perf_counter() >= self._deadline:
+            raise SearchAborted()
+        if self.cancel_token is not None and self.cancel_token.is_set():
+            raise SearchAborted()
+        self._next_check = self.nodes + LIMIT_CHECK_INTERVAL
+        if self.max_nodes is not None:
+            self._next_check = min(self._next_check, self.max_nodes + 1)
+
+    def limit(self, time_limit_ms: Optional[float] = None, max_nodes: Optional[int] = None):
+        """
+        Give a running search a budget counted from now.
+
+        Used when a ponder search, started without limits, turns out to be
+        searching the real position and must now answer in time.
+        """
+        if time_limit_ms is not None:
+            self.time_limit = time_limit_ms / 1000
+            self._deadline = time.perf_counter() + self.time_limit
+        if max_nodes is not None:
+            self.max_nodes = self.nodes + max_nodes
+        self._next_check = self.nodes  # Check the new limits at the next node
+
+    def run(self) -> SearchResult:
+        """Deepen one ply at a time and return the last completed iteration."""
+        start = time.perf_counter()
+        if self.time_limit is not None:
+            self._deadline = start + self.time_limit
+        engine = self.engine
+        root_moves = engine._legal_moves()
+        if not root_moves:
+            score = -MATE_SCORE if engine.is_in_check(engine.current_turn) else 0
+            return SearchResult(None, score, 0, 0, [])
+
+        self.tt.new_search()
+        self.orderer.new_search()
+        root_depth = len(engine._move_stack)
+
+        # Until an iteration completes, fall back to the best-ordered root move
+        entry = self.tt.probe(engine.hash)
+        self.orderer.order(engine.board.mailbox, root_moves, 0, entry[0] if entry else 0)
+        result = SearchResult(root_moves[0], 0, 0, 0, [root_moves[0]])
+
+        aborted = False
+        self._next_check = 0
+        for depth in range(self.start_depth, self.max_depth + 1):
+            try:
+                score = self._negamax(depth, -INFINITY, INFINITY, 0)
+            except SearchAborted:
+                # Unwind whatever the interrupted iteration left on the board
+                while len(engine._move_stack) > root_depth:
+                    engine.pop()
+                aborted = True
+                break
+            pv = list(self.pv_table[0])
+            result = SearchResult(pv[0] if pv else result.move, score, depth, self.nodes, pv)
+            if abs(score) >= MATE_SCORE - MAX_PLY:
+                break  # A forced mate will not change with more depth
+            # The next iteration costs several times this one; don't start
+            # it if it cannot finish before the deadline
+            deadline = self._deadline
+            if deadline is not None and deadline - time.perf_counter() < self.time_limit / 2:
+                break
+
+        result.nodes = self.nodes
+        result.elapsed = time.perf_counter() - start
+        result.aborted = aborted
+        return result
+
+    def _negamax(self, depth: int, alpha: int, beta: int, ply: int) -> int:
+        engine = self.engine
+        self.nodes += 1
+        if self.nodes >= self._next_check:
+            self._check_limits()
+        self.pv_table[ply] = []
+
+        if ply > 0 and (engine.halfmove_clock >= 100 or engine.is_repetition(2)):
+            return 0
+
+        # Transposition table cutoff
+        key = engine.hash
+        tt_move = 0
+        entry = self.tt.probe(key)
+        if entry is not None:
+            tt_move, tt_score, tt_depth, tt_bound = entry
+            if ply > 0 and tt_depth >= depth:
+                tt_score = _score_from_tt(tt_score, ply)
+                if (tt_bound == EXACT
+                        or (tt_bound == LOWER_BOUND and tt_score >= beta)
+                        or (tt_bound == UPPER_BOUND and tt_score <= alpha)):
+                    return tt_score
+
+        if depth <= 0 or ply >= MAX_PLY:
+            return self._quiesce(alpha, beta, ply)
+
+        moves = engine._legal_moves()
+        if not moves:
+            return -MATE_SCORE + ply if engine.is_in_check(engine.current_turn) else 0
+
+        mailbox = engine.board.mailbox
+        self.orderer.order(mailbox, moves, ply, tt_move)
+
+        original_alpha = alpha
+        best_score, best_move = -INFINITY, moves[0]
+        for move_number, move in enumerate(moves):
+            engine.push(move)
+            score = -self._negamax(depth - 1, -beta, -alpha, ply + 1)
+            engine.pop()
+
+            if score > best_score:
+                best_score, best_move = score, move
+                if score > alpha:
+                    alpha = score
+                    self.pv_table[ply] = [move] + self.pv_table[ply + 1]
+                    if alpha >= beta:
+                        self.orderer.record_cutoff(mailbox, move, move_number, depth, ply, tt_move)
+                        break
+
+        if best_score <= original_alpha:
+            bound = UPPER_BOUND
+        elif best_score >= beta:
+            bound = LOWER_BOUND
+        else:
+            bound = EXACT
+        self.tt.store(key, depth, bound, _score_to_tt(best_score, ply), best_move)
+        return best_score
+
+    def _quiesce(self, alpha: int, beta: int, ply: int) -> int:
+        """
+        Resolve captures and promotions until the position is quiet, so the
+        static evaluation is never taken in the middle of an exchange.
+
+        The side to move may "stand pat" on the static score instead of
+        capturing, and captures that lose material by static exchange are
+        not searched at all. In check every evasion is searched instead.
+        """
+        engine = self.engine
+        self.nodes += 1
+        if self.nodes >= self._next_check:
+            self._check_limits()
+        if ply >= MAX_PLY:
+            return evaluate(engine)
+        self.pv_table[ply] = []
+
+        in_check = engine.is_in_check(engine.current_turn)
+        if in_check:
+            moves = engine._legal_moves()
+            if not moves:
+                return -MATE_SCORE + ply
+        else:
+            stand_pat = evaluate(engine)
+            if stand_pat >= beta:
+                return stand_pat
+            if stand_pat > alpha:
+                alpha = stand_pat
+            moves = engine._legal_moves(captures_only=True)
+
+        board = engine.board
+        self.orderer.order(board.mailbox, moves, ply)
+        for move in moves:
+            if not in_check and static_exchange(board, move) < 0:
+                continue
+            engine.push(move)
+            score = -self._quiesce(-beta, -alpha, ply + 1)
+            engine.pop()
+            if score > alpha:
+                if score >= beta:
+                    return score
+                alpha = score
+        return alpha
+
+
+def _score_to_tt(score: int, ply: int) -> int:
+    """Store mate scores relative to the node instead of the root."""
+    if score >= MATE_SCORE - MAX_PLY:
+        return score + ply
+    if score <= -MATE_SCORE + MAX_PLY:
+        return score - ply
+    return score
+
+
+def _score_from_tt(score: int, ply: int) -> int:
+    """Convert a stored mate score back to distance from the root."""
+    if score >= MATE_SCORE - MAX_PLY:
+        return score - ply
+    if score <= -MATE_SCORE + MAX_PLY:
+        return score + ply
+    return score
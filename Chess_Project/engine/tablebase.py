@@ -0,0 +1,641 @@
+"""
+Endgame tablebases for three- and four-piece endings, built by retrograde
+analysis.
+
+A table covers one material signature such as ``KQvK`` or ``KRvKN``. For
+every legal placement of those pieces, with either side to move, it holds
+the result with best play (win, draw or loss for the side to move) and the
+distance to mate in plies. Results are for positions without castling
+rights, and the fifty-move rule is ignored.
+
+Generation works backwards from the end of the game:
+
+1. Every position's moves are generated once. Moves that leave the table
+   (captures and promotions) are resolved straight away from the smaller
+   tables they lead to; the rest are only counted.
+2. Checkmates are resolved at distance 0. Then, level by level, the
+   positions resolved at distance ``d`` are un-made into their
+   predecessors. A predecessor of a loss is a win at ``d + 1``; a
+   predecessor whose count of unresolved moves drops to zero has only
+   moves into wins, so it is a loss.
+3. Whatever is still open when no level produces anything new is a draw.
+
+Step 1 and the predecessor generation of each level are spread over a
+process pool.
+
+Positions are indexed by the squares of the pieces in signature order and
+the side to move. Tables are folded by board symmetry so the white king
+always stands on the a-d files (and on ranks 1-4 when there are no pawns),
+which keeps a four-piece pawnless table to 16 * 64**3 * 2 entries. Tables
+are built with the stronger side as white; a position with the colors the
+other way round is mirrored before lookup.
+
+Each table is two files. ``<signature>.wdl`` packs four 2-bit results per
+byte, and ``<signature>.dtm`` holds one byte of distance per position.
+Both are opened with ``mmap``, so a probe costs a few byte reads::
+
+    python -m engine.tablebase generate tablebases KQvK KRvK KPvK KBNvK
+    python -m engine.tablebase probe tablebases --fen "8/8/8/8/8/2k5/8/K6Q w - - 0 1"
+"""
+import argparse
+import mmap
+import multiprocessing as mp
+import os
+import sys
+import time
+from array import array
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .bitboard import (
+    WHITE, BLACK, PAWN, KNIGHT, BISHOP, ROOK, QUEEN, KING,
+    PAWN_ATTACKS, iter_bits, piece_attacks, popcount,
+)
+
+# Results, always for the side to move
+TB_DRAW, TB_WIN, TB_LOSS, TB_INVALID = 0, 1, 2, 3
+RESULT_NAMES = ("draw", "win", "loss", "invalid")
+
+MAX_PIECES = 4
+PIECE_LETTERS = "PNBRQK"  # Signature letters indexed by piece type
+PROMOTION_TYPES = (QUEEN, ROOK, BISHOP, KNIGHT)
+MAX_DTM = 255             # Distances are stored in one byte
+CHUNK_SIZE = 1 << 14      # Positions per pool task
+
+_UNRESOLVED = 0xFFFF
+_NO_WIN = 0xFFFF
+# Kinds reported by the forward pass
+_OPEN, _MATED, _STALEMATE, _INVALID = 0, 1, 2, 3
+
+# Byte tables that shift a 2-bit result into its slot of a packed byte
+_PACK = [bytes((value << shift) & 0xFF for value in range(256)) for shift in (0, 2, 4, 6)]
+
+
+def _letters(piece_types: Iterable[int]) -> str:
+    return "".join(PIECE_LETTERS[piece_type] for piece_type in piece_types)
+
+
+def material_signature(pieces: Iterable[int]) -> Tuple[str, bool]:
+    """
+    Table signature for a set of piece indices.
+
+    Returns:
+        (signature, swap), ``swap`` telling whether the colors must be
+        exchanged to look the position up, because black is the stronger side
+    """
+    pieces = list(pieces)
+    white = tuple(sorted((piece for piece in pieces if piece < 6), reverse=True))
+    black = tuple(sorted((piece - 6 for piece in pieces if piece >= 6), reverse=True))
+    swap = (len(black), black) > (len(white), white)
+    if swap:
+        white, black = black, white
+    return _letters(white) + "v" + _letters(black), swap
+
+
+def parse_signature(signature: str) -> List[int]:
+    """
+    Piece indices of a signature such as "KBNvK", in table order.
+
+    Raises:
+        ValueError: For anything but one king per side plus known piece letters
+    """
+    sides = signature.upper().split("V")
+    if len(sides) != 2:
+        raise ValueError(f"Not a material signature: {signature!r}")
+    pieces = []
+    for color, letters in zip((WHITE, BLACK), sides):
+        if not letters.startswith("K") or "K" in letters[1:] or not set(letters) <= set(PIECE_LETTERS):
+            raise ValueError(f"Not a material signature: {signature!r}")
+        pieces.extend(color * 6 + PIECE_LETTERS.index(letter) for letter in letters)
+    return pieces
+
+
+class TableLayout:
+    """Position indexing for one material signature."""
+
+    def __init__(self, signature: str):
+        pieces = parse_signature(signature)
+        normalized, swap = material_signature(pieces)
+        if swap or normalized != signature:
+            raise ValueError(f"{signature!r} is not in table order; use {normalized!r}")
+        if len(pieces) > MAX_PIECES:
+            raise ValueError(f"{signature}: tables go up to {MAX_PIECES} pieces")
+        if PAWN in pieces and 6 + PAWN in pieces:
+            # En passant would have to be part of the position
+            raise ValueError(f"{signature}: pawns on both sides are not supported")
+
+        self.signature = signature
+        self.pieces = pieces
+        self.count = len(pieces)
+        self.kings = (0, pieces.index(6 + KING))  # Positions of the kings in ``pieces``
+        has_pawns = PAWN in pieces or 6 + PAWN in pieces
+        # Square mirrors as XOR masks: files, and ranks too when there are no pawns
+        self.mirrors = (0, 7) if has_pawns else (0, 7, 56, 63)
+        self.king_region = [sq for sq in range(64) if sq & 7 < 4 and (has_pawns or sq >> 3 >= 4)]
+        self.king_slot = [-1] * 64
+        for slot, sq in enumerate(self.king_region):
+            self.king_slot[sq] = slot
+        self.size = len(self.king_region) * 64 ** (self.count - 1) * 2
+
+    def index(self, squares: Sequence[int], side: int) -> int:
+        """Index of the pieces on ``squares`` (in signature order) with ``side`` to move."""
+        white_king = squares[0]
+        for mask in self.mirrors:
+            index = self.king_slot[white_king ^ mask]
+            if index >= 0:
+                break
+        for sq in squares[1:]:
+            index = (index << 6) | (sq ^ mask)
+        return (index << 1) | side
+
+    def decode(self, index: int) -> Tuple[List[int], int]:
+        """Squares and side to move of a canonical index."""
+        side = index & 1
+        index >>= 1
+        squares = [0] * self.count
+        for k in range(self.count - 1, 0, -1):
+            squares[k] = index & 63
+            index >>= 6
+        squares[0] = self.king_region[index]
+        return squares, side
+
+    def squares_of(self, placed: Iterable[Tuple[int, int]]) -> List[int]:
+        """Order (piece, square) pairs of this signature's material into signature order."""
+        by_piece: Dict[int, List[int]] = {}
+        for piece, sq in placed:
+            by_piece.setdefault(piece, []).append(sq)
+        return [by_piece[piece].pop() for piece in self.pieces]
+
+
+# ---------------------------------------------------------------------------
+# Probing
+# ---------------------------------------------------------------------------
+
+class EndgameTable:
+    """One memory-mapped table."""
+
+    def __init__(self, directory: str, signature: str):
+        self.layout = TableLayout(signature)
+        self._files = []
+        self._maps = []
+        for suffix, size in ((".wdl", (self.layout.size + 3) // 4), (".dtm", self.layout.size)):
+            path = os.path.join(directory, signature + suffix)
+            f = open(path, "rb")
+            if f.seek(0, 2) != size:
+                f.close()
+                self.close()
+                raise ValueError(f"{path} has the wrong size for {signature}")
+            self._files.append(f)
+            self._maps.append(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+        self._wdl, self._dtm = self._maps
+
+    def probe(self, index: int) -> Tuple[int, int]:
+        """(result, plies to mate) at a position index."""
+        return (self._wdl[index >> 2] >> ((index & 3) << 1)) & 3, self._dtm[index]
+
+    def close(self):
+        """Unmap the table and close its files."""
+        for table_map in self._maps:
+            table_map.close()
+        for f in self._files:
+            f.close()
+        self._maps = []
+        self._files = []
+
+
+class Tablebases:
+    """The tables in one directory, each opened on first use."""
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        names = os.listdir(directory) if os.path.isdir(directory) else []
+        self.signatures = {name[:-4] for name in names
+                           if name.endswith(".wdl") and name[:-4] + ".dtm" in names}
+        self.max_pieces = max((len(signature) - 1 for signature in self.signatures), default=0)
+        self._tables: Dict[str, EndgameTable] = {}
+
+        self.hits = 0
+        self.misses = 0
+
+    def table(self, signature: str) -> Optional[EndgameTable]:
+        """Open table for ``signature``, or None if the directory lacks it."""
+        table = self._tables.get(signature)
+        if table is None and signature in self.signatures:
+            table = self._tables[signature] = EndgameTable(self.directory, signature)
+        return table
+
+    def probe_pieces(self, placed: Sequence[Tuple[int, int]], side: int) -> Optional[Tuple[int, int]]:
+        """
+        Look up a position given as (piece index, square) pairs.
+
+        Returns:
+            (result, plies to mate) for ``side`` to move, or None when no
+            table covers the material
+        """
+        signature, swap = material_signature(piece for piece, _ in placed)
+        if signature == "KvK":
+            return TB_DRAW, 0
+        table = self.table(signature)
+        if table is None:
+            return None
+        if swap:
+            placed = [((piece + 6) % 12, sq ^ 56) for piece, sq in placed]
+            side ^= 1
+        layout = table.layout
+        return table.probe(layout.index(layout.squares_of(placed), side))
+
+    def probe(self, engine) -> Optional[Tuple[int, int]]:
+        """
+        Look up a ``GameEngine`` position.
+
+        Returns:
+            (result, plies to mate) for the side to move, or None for
+            positions outside the tables or with castling rights left
+        """
+        board = engine.board
+        if engine.castling or popcount(board.occupied) > self.max_pieces:
+            self.misses += 1
+            return None
+        mailbox = board.mailbox
+        found = self.probe_pieces([(mailbox[sq], sq) for sq in iter_bits(board.occupied)], engine.side)
+        if found is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return found
+
+    def close(self):
+        """Close every open table."""
+        for table in self._tables.values():
+            table.close()
+        self._tables = {}
+
+    def __enter__(self) -> "Tablebases":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+# ---------------------------------------------------------------------------
+# Generation
+# ---------------------------------------------------------------------------
+
+class _Solver:
+    """Move and un-move generation over one table's positions."""
+
+    def __init__(self, signature: str, directory: str):
+        self.layout = TableLayout(signature)
+        self.pieces = self.layout.pieces
+        self.tablebases = Tablebases(directory)  # Smaller tables that moves out of this one reach
+
+    def _attacked(self, squares: Sequence[int], color: int, target: int, occupied: int) -> bool:
+        """Whether ``color``'s pieces still on the board attack ``target``."""
+        for piece, sq in zip(self.pieces, squares):
+            if piece // 6 == color and sq >= 0 and (piece_attacks(piece, sq, occupied) >> target) & 1:
+                return True
+        return False
+
+    def _targets(self, piece: int, sq: int, occupied: int, own: int) -> Iterable[Tuple[int, int]]:
+        """(to square, promotion type) for a piece's pseudo-legal moves."""
+        if piece % 6 != PAWN:
+            return [(to_sq, 0) for to_sq in iter_bits(piece_attacks(piece, sq, occupied) & ~own)]
+        color = piece // 6
+        step, start_rank, last_rank = (-8, 6, 0) if color == WHITE else (8, 1, 7)
+        targets = list(iter_bits(PAWN_ATTACKS[color][sq] & occupied & ~own))
+        forward = sq + step
+        if not (occupied >> forward) & 1:
+            targets.append(forward)
+            if sq >> 3 == start_rank and not (occupied >> (forward + step)) & 1:
+                targets.append(forward + step)
+        if forward >> 3 == last_rank:
+            return [(to_sq, promotion) for to_sq in targets for promotion in PROMOTION_TYPES]
+        return [(to_sq, 0) for to_sq in targets]
+
+    def analyze(self, index: int) -> Tuple[int, int, int, int, bool]:
+        """
+        Forward pass over one position.
+
+        Returns:
+            (kind, moves staying in the table, fastest win through a move
+            leaving it, slowest loss through such a move, whether one of
+            those moves avoids losing)
+        """
+        layout, pieces = self.layout, self.pieces
+        squares, side = layout.decode(index)
+        occupied = 0
+        for sq in squares:
+            occupied |= 1 << sq
+        if popcount(occupied) != layout.count:
+            return _INVALID, 0, _NO_WIN, 0, False
+        for piece, sq in zip(pieces, squares):
+            if piece % 6 == PAWN and sq >> 3 in (0, 7):
+                return _INVALID, 0, _NO_WIN, 0, False
+        them = side ^ 1
+        if self._attacked(squares, side, squares[layout.kings[them]], occupied):
+            return _INVALID, 0, _NO_WIN, 0, False  # The side that just moved is in check
+
+        own = 0
+        for piece, sq in zip(pieces, squares):
+            if piece // 6 == side:
+                own |= 1 << sq
+        king = layout.kings[side]
+        legal = inside = 0
+        win, loss, safe = _NO_WIN, 0, False
+        for j, piece in enumerate(pieces):
+            if piece // 6 != side:
+                continue
+            from_sq = squares[j]
+            for to_sq, promotion in self._targets(piece, from_sq, occupied, own):
+                moved = squares[:]
+                moved[j] = to_sq
+                captured = (occupied >> to_sq) & 1
+                if captured:
+                    moved[squares.index(to_sq)] = -1
+                after = occupied ^ (1 << from_sq) | (1 << to_sq)
+                if self._attacked(moved, them, moved[king], after):
+                    continue
+                legal += 1
+                if not captured and not promotion:
+                    inside += 1
+                    continue
+                placed = [(side * 6 + promotion if k == j and promotion else other, sq)
+                          for k, (other, sq) in enumerate(zip(pieces, moved)) if sq >= 0]
+                found = self.tablebases.probe_pieces(placed, them)
+                if found is None:
+                    signature, _ = material_signature(piece for piece, _ in placed)
+                    raise RuntimeError(f"{layout.signature} needs the {signature} table first")
+                result, plies = found
+                if result == TB_LOSS:
+                    win = min(win, plies + 1)
+                    safe = True
+                elif result == TB_WIN:
+                    loss = max(loss, plies + 1)
+                else:
+                    safe = True
+        if not legal:
+            mated = self._attacked(squares, them, squares[king], occupied)
+            return (_MATED if mated else _STALEMATE), 0, _NO_WIN, 0, False
+        return _OPEN, inside, win, loss, safe
+
+    def predecessors(self, index: int) -> List[int]:
+        """Indices of the positions that reach ``index`` by a move staying in the table."""
+        layout, pieces = self.layout, self.pieces
+        squares, side = layout.decode(index)
+        mover = side ^ 1
+        occupied = 0
+        for sq in squares:
+            occupied |= 1 << sq
+        king = layout.kings[side]
+        found = []
+        for j, piece in enumerate(pieces):
+            if piece // 6 != mover:
+                continue
+            to_sq = squares[j]
+            if piece % 6 == PAWN:
+                step, double_rank = (8, 4) if mover == WHITE else (-8, 3)
+                origin = to_sq + step
+                origins = []
+                if 1 <= origin >> 3 <= 6 and not (occupied >> origin) & 1:
+                    origins.append(origin)
+                    if to_sq >> 3 == double_rank and not (occupied >> (origin + step)) & 1:
+                        origins.append(origin + step)
+            else:
+                origins = iter_bits(piece_attacks(piece, to_sq, occupied) & ~occupied)
+            for from_sq in origins:
+                squares[j] = from_sq
+                before = occupied ^ (1 << to_sq) | (1 << from_sq)
+                # The side that is now to move cannot have been in check then
+                if not self._attacked(squares, mover, squares[king], before):
+                    found.append(layout.index(squares, mover))
+            squares[j] = to_sq
+        return found
+
+
+_solver: Optional[_Solver] = None  # Per worker process
+
+
+def _start_worker(signature: str, directory: str):
+    global _solver
+    _solver = _Solver(signature, directory)
+
+
+def _analyze_range(bounds: Tuple[int, int]):
+    """
+    Forward pass over ``range(*bounds)``.
+
+    Returns:
+        (moves staying in the table per position, slowest exit loss per
+        position, flags for positions with an exit that avoids losing,
+        invalid indices, [(index, distance, result)] resolved already)
+    """
+    start, stop = bounds
+    counts = bytearray(stop - start)
+    losses = array("H", bytes(2 * (stop - start)))
+    safe = bytearray(stop - start)
+    invalid = array("L")
+    resolved = []
+    analyze = _solver.analyze
+    for index in range(start, stop):
+        kind, inside, win, loss, avoids = analyze(index)
+        if kind == _OPEN:
+            offset = index - start
+            counts[offset], losses[offset], safe[offset] = inside, loss, avoids
+            if win != _NO_WIN:
+                resolved.append((index, win, TB_WIN))
+            elif not inside and not avoids:
+                resolved.append((index, loss, TB_LOSS))
+        elif kind == _MATED:
+            resolved.append((index, 0, TB_LOSS))
+        elif kind == _INVALID:
+            invalid.append(index)
+    return bytes(counts), losses.tobytes(), bytes(safe), invalid.tobytes(), resolved
+
+
+def _predecessors_of(indices: bytes) -> bytes:
+    """Predecessor indices of every position in a packed index array."""
+    found = array("L")
+    predecessors = _solver.predecessors
+    for index in array("L", indices):
+        found.extend(predecessors(index))
+    return found.tobytes()
+
+
+def _batches(indices: List[int]) -> Iterable[bytes]:
+    for start in range(0, len(indices), CHUNK_SIZE):
+        yield array("L", indices[start:start + CHUNK_SIZE]).tobytes()
+
+
+def _solve(signature: str, size: int, imap, log) -> Tuple[bytearray, array]:
+    """Run the retrograde analysis; returns (results, distances)."""
+    counts = bytearray(size)
+    losses = array("H", bytes(2 * size))
+    safe = bytearray(size)
+    results = bytearray(size)  # TB_DRAW until shown otherwise
+    distances = array("H", [_UNRESOLVED]) * size
+    pending: Dict[int, List[Tuple[int, int]]] = {}
+
+    chunks = [(start, min(start + CHUNK_SIZE, size)) for start in range(0, size, CHUNK_SIZE)]
+    for (start, stop), report in zip(chunks, imap(_analyze_range, chunks)):
+        chunk_counts, chunk_losses, chunk_safe, invalid, resolved = report
+        counts[start:stop] = chunk_counts
+        losses[start:stop] = array("H", chunk_losses)
+        safe[start:stop] = chunk_safe
+        for index in array("L", invalid):
+            results[index] = TB_INVALID
+        for index, plies, result in resolved:
+            pending.setdefault(plies, []).append((index, result))
+    log(f"{signature}: forward pass done")
+
+    while pending:
+        plies = min(pending)
+        wins, lost = [], []
+        for index, result in pending.pop(plies):
+            if distances[index] == _UNRESOLVED:
+                distances[index] = plies
+                results[index] = result
+                (wins if result == TB_WIN else lost).append(index)
+
+        # Every position with a move into a loss is won one ply later
+        for found in imap(_predecessors_of, _batches(lost)):
+            for index in array("L", found):
+                if distances[index] == _UNRESOLVED:
+                    pending.setdefault(plies + 1, []).append((index, TB_WIN))
+
+        # A position whose last open move reaches a win is lost, as late
+        # as its slowest losing exit allows
+        for found in imap(_predecessors_of, _batches(wins)):
+            for index in array("L", found):
+                if distances[index] == _UNRESOLVED:
+                    counts[index] -= 1
+                    if not counts[index] and not safe[index]:
+                        pending.setdefault(max(plies + 1, losses[index]), []).append((index, TB_LOSS))
+        if wins or lost:
+            log(f"{signature}: {len(wins)} wins and {len(lost)} losses at {plies} plies")
+    return results, distances
+
+
+def _write_table(directory: str, signature: str, results: bytearray, distances: array):
+    """Write the packed result file and the distance file."""
+    size = len(results)
+    padded = bytes(results) + bytes(-size % 4)
+    packed = 0
+    for slot in range(4):
+        packed += int.from_bytes(padded[slot::4].translate(_PACK[slot]), "little")
+    dtm = bytes(min(plies, MAX_DTM) if plies != _UNRESOLVED else 0 for plies in distances)
+
+    for suffix, data in ((".wdl", packed.to_bytes(len(padded) // 4, "little")), (".dtm", dtm)):
+        path = os.path.join(directory, signature + suffix)
+        with open(path + ".tmp", "wb") as f:
+            f.write(data)
+        os.replace(path + ".tmp", path)
+
+
+def dependencies(signature: str) -> List[str]:
+    """Smaller tables that captures and promotions in ``signature`` lead to."""
+    pieces = parse_signature(signature)
+    found = set()
+    for j, piece in enumerate(pieces):
+        if piece % 6 == KING:
+            continue
+        found.add(material_signature(pieces[:j] + pieces[j + 1:])[0])
+        if piece % 6 == PAWN:
+            promoted = [piece - PAWN + promotion for promotion in PROMOTION_TYPES]
+            for new_piece in promoted:
+                rest = pieces[:j] + [new_piece] + pieces[j + 1:]
+                found.add(material_signature(rest)[0])
+                for k, victim in enumerate(rest):
+                    if victim // 6 != piece // 6 and victim % 6 != KING:
+                        found.add(material_signature(rest[:k] + rest[k + 1:])[0])
+    found.discard("KvK")
+    return sorted(found, key=lambda name: (len(name), name))
+
+
+def generate_table(signature: str, directory: str, workers: Optional[int] = None, log=print) -> str:
+    """
+    Build one table into ``directory``; the tables it depends on must be there already.
+
+    Returns:
+        Path of the result file written
+    """
+    size = TableLayout(signature).size
+    workers = workers or os.cpu_count() or 1
+    start = time.perf_counter()
+    if workers > 1:
+        context = mp.get_context("spawn")
+        with context.Pool(workers, initializer=_start_worker, initargs=(signature, directory)) as pool:
+            results, distances = _solve(signature, size, pool.imap, log)
+    else:
+        _start_worker(signature, directory)
+        results, distances = _solve(signature, size, map, log)
+    _write_table(directory, signature, results, distances)
+    log(f"{signature}: {size} positions in {time.perf_counter() - start:.1f}s")
+    return os.path.join(directory, signature + ".wdl")
+
+
+def generate(signatures: Iterable[str], directory: str, workers: Optional[int] = None,
+             log=print) -> List[str]:
+    """
+    Build tables and every smaller table they depend on, skipping those
+    already in ``directory``.
+
+    Returns:
+        Signatures generated, in order
+    """
+    os.makedirs(directory, exist_ok=True)
+    existing = Tablebases(directory).signatures
+    order: List[str] = []
+
+    def visit(signature: str):
+        if signature in order or signature in existing:
+            return
+        for needed in dependencies(signature):
+            visit(needed)
+        order.append(signature)
+
+    for signature in signatures:
+        normalized, _ = material_signature(parse_signature(signature))
+        visit(normalized)
+    for signature in order:
+        generate_table(signature, directory, workers, log)
+    return order
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command-line entry point."""
+    from .bitboard import move_name
+    from .game_engine import GameEngine
+
+    parser = argparse.ArgumentParser(description="Generate or probe endgame tablebases")
+    commands = parser.add_subparsers(dest="command", required=True)
+    build = commands.add_parser("generate", help="build tables and the tables they need")
+    build.add_argument("directory")
+    build.add_argument("signatures", nargs="+", help="material such as KQvK or KBNvK")
+    build.add_argument("--workers", type=int, help="processes to use (default: one per CPU)")
+    probe = commands.add_parser("probe", help="look a position up")
+    probe.add_argument("directory")
+    probe.add_argument("--fen", required=True)
+    args = parser.parse_args(argv)
+
+    if args.command == "generate":
+        try:
+            generate(args.signatures, args.directory, args.workers)
+        except ValueError as e:
+            parser.error(str(e))
+        return 0
+
+    engine = GameEngine(tablebases=Tablebases(args.directory))
+    engine.load_fen(args.fen)
+    found = engine.probe_tablebase()
+    if found is None:
+        print("Position not in the tablebases")
+        return 1
+    result, plies = found
+    print(f"{RESULT_NAMES[result]}" + (f" in {plies} plies" if result in (TB_WIN, TB_LOSS) else ""))
+    best = engine.tablebase_move()
+    if best is not None and best.move is not None:
+        print(f"best move {move_name(best.move)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,221 @@
+"""
+Fixed-size transposition table for the AI search.
+
+Entries live in two flat ``array('Q')`` buffers (keys and packed data), so
+the table's memory is allocated once up front and never grows. Each bucket
+holds two slots: a depth-preferred slot that keeps the most expensive result
+seen for the current search, and an always-replace slot for everything else.
+
+A table can instead be placed in ``multiprocessing.shared_memory`` so
+several search processes read and write the same entries. There are no
+locks: keys are stored XOR-ed with their data, and a probe only accepts an
+entry when ``stored_key ^ data`` gives back the full key, so a slot written
+halfway by another thread or process reads as a miss instead of returning
+a mismatched result.
+"""
+import weakref
+from array import array
+from multiprocessing import shared_memory
+from typing import Dict, List, Optional, Tuple
+
+# Bound types
+EXACT, LOWER_BOUND, UPPER_BOUND = 1, 2, 3
+
+# Scores at or beyond this magnitude mean "mate"
+MATE_SCORE = 100000
+
+DEFAULT_SIZE_MB = 16
+ENTRY_BYTES = 16  # 8-byte key + 8-byte data
+SLOTS_PER_BUCKET = 2
+
+# Data layout: move (18 bits) | depth (8) | bound (2) | generation (6) | score (24)
+_DEPTH_SHIFT = 18
+_BOUND_SHIFT = 26
+_GENERATION_SHIFT = 28
+_SCORE_SHIFT = 34
+_SCORE_OFFSET = 1 << 23
+
+
+def _release_shared(shm: shared_memory.SharedMemory, views: List[memoryview], unlink: bool):
+    """Drop the views onto a shared segment, then close (and maybe unlink) it."""
+    for view in reversed(views):
+        view.release()
+    shm.close()
+    if unlink:
+        shm.unlink()
+
+
+def _open_shared(name: str) -> shared_memory.SharedMemory:
+    """Attach to an existing segment without handing its lifetime to this process."""
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        # Python < 3.13 always registers the segment, but processes started
+        # by the creator report to the creator's resource tracker, which
+        # already holds it, so the registration changes nothing
+        return shared_memory.SharedMemory(name=name)
+
+
+class TranspositionTable:
+    """Bounded hash table of search results keyed by Zobrist hash."""
+
+    def __init__(self, size_mb: float = DEFAULT_SIZE_MB, shared: bool = False):
+        """
+        Allocate a table using at most ``size_mb`` megabytes.
+
+        The bucket count is rounded down to a power of two so the bucket
+        index is a mask of the key.
+
+        Args:
+            size_mb: Memory budget
+            shared: Place the entries in shared memory so other processes
+                can ``attach`` to them by ``shared_name``
+        """
+        buckets = max(1, int(size_mb * 1024 * 1024) // (ENTRY_BYTES * SLOTS_PER_BUCKET))
+        buckets = 1 << (buckets.bit_length() - 1)
+        slots = buckets * SLOTS_PER_BUCKET
+        self.shm: Optional[shared_memory.SharedMemory] = None
+        if shared:
+            self._map_shared(shared_memory.SharedMemory(create=True, size=slots * ENTRY_BYTES),
+                             slots, owner=True)
+        else:
+            self.keys = array("Q", bytes(8 * slots))
+            self.data = array("Q", bytes(8 * slots))
+        self._setup(slots)
+
+    @classmethod
+    def attach(cls, name: str, entries: int) -> "TranspositionTable":
+        """Open a shared table created by another process."""
+        table = cls.__new__(cls)
+        table._map_shared(_open_shared(name), entries, owner=False)
+        table._setup(entries)
+        return table
+
+    def _map_shared(self, shm: shared_memory.SharedMemory, slots: int, owner: bool):
+        words = shm.buf.cast("Q")
+        self.shm = shm
+        self.keys = words[:slots]
+        self.data = words[slots:2 * slots]
+        # Only the creating process removes the segment
+        self._finalizer = weakref.finalize(self, _release_shared, shm,
+                                           [words, self.keys, self.data], owner)
+
+    def _setup(self, slots: int):
+        self.bucket_mask = slots // SLOTS_PER_BUCKET - 1
+        self.generation = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.collisions = 0
+        self.stores = 0
+        self.overwrites = 0
+
+    @property
+    def shared_name(self) -> Optional[str]:
+        """Name other processes pass to ``attach``, or None for a private table."""
+        return self.shm.name if self.shm is not None else None
+
+    @property
+    def size_bytes(self) -> int:
+        """Memory used by the entry buffers."""
+        return len(self.keys) * ENTRY_BYTES
+
+    def close(self):
+        """Release a shared table (unlinking it if this process created it)."""
+        if self.shm is not None:
+            self._finalizer()
+
+    def new_search(self):
+        """Start a new search so entries from older searches become replaceable."""
+        self.generation = (self.generation + 1) & 63
+
+    def clear(self):
+        """Empty the table and reset its statistics."""
+        if self.shm is not None:
+            self.shm.buf[:self.size_bytes] = bytes(self.size_bytes)
+        else:
+            self.keys = array("Q", bytes(8 * len(self.keys)))
+            self.data = array("Q", bytes(8 * len(self.data)))
+        self.generation = 0
+        self.reset_stats()
+
+    def reset_stats(self):
+        """Zero the hit/miss/collision counters."""
+        self.hits = self.misses = self.collisions = self.stores = self.overwrites = 0
+
+    def probe(self, key: int) -> Optional[Tuple[int, int, int, int]]:
+        """
+        Look up a position.
+
+        Returns:
+            (move, score, depth, bound) for a stored position, or None
+        """
+        index = (key & self.bucket_mask) << 1
+        keys, data = self.keys, self.data
+        for slot in (index, index + 1):
+            entry = data[slot]
+            if entry and keys[slot] ^ entry == key:
+                self.hits += 1
+                return (entry & 0x3FFFF,
+                        ((entry >> _SCORE_SHIFT) & 0xFFFFFF) - _SCORE_OFFSET,
+                        (entry >> _DEPTH_SHIFT) & 0xFF,
+                        (entry >> _BOUND_SHIFT) & 3)
+        self.misses += 1
+        if data[index] or data[index + 1]:
+            self.collisions += 1
+        return None
+
+    def store(self, key: int, depth: int, bound: int, score: int, move: int = 0):
+        """
+        Record a search result.
+
+        The depth-preferred slot is overwritten by the same position, by a
+        result at least as deep, or when its entry is from an older search;
+        otherwise the result goes to the always-replace slot.
+        """
+        depth = 0 if depth < 0 else (255 if depth > 255 else depth)
+        entry = (move
+                 | (depth << _DEPTH_SHIFT)
+                 | (bound << _BOUND_SHIFT)
+                 | (self.generation << _GENERATION_SHIFT)
+                 | ((score + _SCORE_OFFSET) << _SCORE_SHIFT))
+        index = (key & self.bucket_mask) << 1
+        keys, data = self.keys, self.data
+
+        old = data[index]
+        if (not old or keys[index] ^ old == key
+                or depth >= (old >> _DEPTH_SHIFT) & 0xFF
+                or (old >> _GENERATION_SHIFT) & 63 != self.generation):
+            slot = index
+        else:
+            slot = index + 1
+            old = data[slot]
+
+        if old and keys[slot] ^ old != key:
+            self.overwrites += 1
+        self.stores += 1
+        data[slot] = entry
+        keys[slot] = key ^ entry
+
+    def hashfull(self) -> int:
+        """Permille of sampled slots holding an entry from the current search."""
+        sample = min(1000, len(self.data))
+        used = sum(1 for entry in self.data[:sample]
+                   if entry and (entry >> _GENERATION_SHIFT) & 63 == self.generation)
+        return used * 1000 // sample
+
+    def stats(self) -> Dict[str, float]:
+        """Counters for tuning the table size."""
+        probes = self.hits + self.misses
+        return {
+            "size_mb": self.size_bytes / (1024 * 1024),
+            "shared": self.shm is not None,
+            "entries": len(self.data),
+            "hits": self.hits,
+            "misses": self.misses,
+            "collisions": self.collisions,
+            "stores": self.stores,
+            "overwrites": self.overwrites,
+            "hit_rate": self.hits / probes if probes else 0.0,
+            "hashfull": self.hashfull(),
+        }
@@ -0,0 +1,46 @@
+"""
+Zobrist keys for 64-bit position hashing.
+
+A position's key is the XOR of one random number per (piece, square), one
+for the side to move when it is black, one for the castle rights and one for
+the en passant file. Because XOR is its own inverse, a move updates the key
+by XOR-ing out what changed and XOR-ing in the result.
+"""
+import random
+from typing import Optional
+
+from .bitboard import BLACK, PAWN, PAWN_ATTACKS, BitBoard, iter_bits
+
+_rng = random.Random(0x5EED)
+
+PIECE_KEYS = [[_rng.getrandbits(64) for _ in range(64)] for _ in range(12)]
+SIDE_KEY = _rng.getrandbits(64)
+CASTLE_KEYS = [_rng.getrandbits(64) for _ in range(16)]
+EP_FILE_KEYS = [_rng.getrandbits(64) for _ in range(8)]
+
+
+def ep_key(board: BitBoard, side: int, ep_square: Optional[int]) -> int:
+    """
+    Key for the en passant square, or 0.
+
+    The file is only hashed when a pawn of the side to move can actually
+    capture, so a double push that allows no capture does not make the
+    position look different from the same placement reached another way.
+    """
+    if ep_square is None:
+        return 0
+    if PAWN_ATTACKS[side ^ 1][ep_square] & board.pieces[side * 6 + PAWN]:
+        return EP_FILE_KEYS[ep_square & 7]
+    return 0
+
+
+def zobrist_hash(board: BitBoard, side: int, castling: int, ep_square: Optional[int]) -> int:
+    """Compute a position's key from scratch."""
+    key = CASTLE_KEYS[castling] ^ ep_key(board, side, ep_square)
+    if side == BLACK:
+        key ^= SIDE_KEY
+    for piece in range(12):
+        keys = PIECE_KEYS[piece]
+        for sq in iter_bits(board.pieces[piece]):
+            key ^= keys[sq]
+    return key
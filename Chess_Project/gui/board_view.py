@@ -1,5 +1,7 @@
 import pygame
-from typing import List, Tuple, Dict, Any, Optional
+from typing import List, Tuple, Dict, Any, Optional, Set
+
+from .graphics_utils import get_font, render_text
 
 class BoardView:
     """Handles rendering of the chess board and pieces"""
@@ -18,28 +20,62 @@ class BoardView:
         # Fonts for drawing text - initialized in main.py
         self.coordinate_font = None
         self.font = None
+
+        # Empty board with coordinates, and the settings it was drawn with
+        self._background_key = None
+        self._background_surface: Optional[pygame.Surface] = None
+
+        # What render_frame last drew: per-square contents, the status
+        # line and the screen area of its box (None forces a full redraw)
+        self._frame: Optional[List[Tuple]] = None
+        self._frame_status: Optional[Tuple[str, str]] = None
+        self._frame_status_rect: Optional[pygame.Rect] = None
+        self._frame_images = None
+        self._frame_background_key = None
+
+    def invalidate(self):
+        """Make the next render_frame redraw everything, e.g. after the window was uncovered."""
+        self._frame = None
     
-    def draw_board(self):
-        """Draw the chess board squares"""
+    def _background(self) -> pygame.Surface:
+        """
+        The empty board with its coordinates, rendered once and redrawn
+        only when the square size, square colors or coordinate font change
+        """
+        key = (self.square_size, self.light_square, self.dark_square, self.coordinate_font)
+        if key == self._background_key:
+            return self._background_surface
+
+        size = self.square_size
+        surface = pygame.Surface((8 * size, 8 * size))
         for row in range(8):
             for col in range(8):
-                # Calculate position and color
-                x, y = col * self.square_size, row * self.square_size
                 color = self.light_square if (row + col) % 2 == 0 else self.dark_square
-                
-                # Draw the square
-                pygame.draw.rect(self.screen, color, (x, y, self.square_size, self.square_size))
-                
-        # Draw coordinates
+                pygame.draw.rect(surface, color, (col * size, row * size, size, size))
+
         for i in range(8):
             # Draw rank numbers (1-8)
             text = self.coordinate_font.render(str(8 - i), True, (0, 0, 0))
-            self.screen.blit(text, (5, i * self.square_size + 5))
-            
+            surface.blit(text, (5, i * size + 5))
+
             # Draw file letters (a-h)
             text = self.coordinate_font.render(chr(97 + i), True, (0, 0, 0))
-            self.screen.blit(text, (i * self.square_size + self.square_size - 15, 
-                                  8 * self.square_size - 20))
+            surface.blit(text, (i * size + size - 15, 8 * size - 20))
+
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert()  # Opaque, so no per-pixel alpha to blend when blitting squares
+        self._background_key = key
+        self._background_surface = surface
+        return surface
+
+    def draw_board(self):
+        """Draw the chess board squares and coordinates"""
+        self.screen.blit(self._background(), (0, 0))
+
+    def _draw_square(self, row: int, col: int):
+        """Draw one board square with any coordinate label that falls on it"""
+        x, y = col * self.square_size, row * self.square_size
+        self.screen.blit(self._background(), (x, y), (x, y, self.square_size, self.square_size))
 
     def draw_pieces(self, board, images: Dict[Tuple[str, str], pygame.Surface]):
         """Draw the chess pieces on the board"""
@@ -47,30 +83,33 @@ class BoardView:
             for col in range(8):
                 piece = board.get_piece(row, col)
                 if piece:
-                    # Get the image for this piece type and color
-                    img_key = (piece.color, piece.type)
-                    if img_key in images:
-                        # Calculate position to center the piece in the square
-                        x = col * self.square_size
-                        y = row * self.square_size
-                        self.screen.blit(images[img_key], (x, y))
-                    else:
-                        # Fallback if image not found: draw a colored rectangle with text
-                        x = col * self.square_size + 5
-                        y = row * self.square_size + 5
-                        size = self.square_size - 10
-                        color = (200, 200, 200) if piece.color == "white" else (50, 50, 50)
-                        pygame.draw.rect(self.screen, color, (x, y, size, size))
-                        
-                        # Add initial of piece type
-                        font = pygame.font.SysFont("Arial", 24)
-                        text = font.render(piece.type[0].upper(), True, 
-                                          (0, 0, 0) if piece.color == "white" else (255, 255, 255))
-                        text_rect = text.get_rect(center=(
-                            x + size // 2,
-                            y + size // 2
-                        ))
-                        self.screen.blit(text, text_rect)
+                    self._draw_piece((piece.color, piece.type), row, col, images)
+
+    def _draw_piece(self, img_key: Tuple[str, str], row: int, col: int,
+                    images: Dict[Tuple[str, str], pygame.Surface]):
+        """Draw one piece, given as (color, type), on its square"""
+        color_name, piece_type = img_key
+        if img_key in images:
+            # Calculate position to center the piece in the square
+            x = col * self.square_size
+            y = row * self.square_size
+            self.screen.blit(images[img_key], (x, y))
+        else:
+            # Fallback if image not found: draw a colored rectangle with text
+            x = col * self.square_size + 5
+            y = row * self.square_size + 5
+            size = self.square_size - 10
+            color = (200, 200, 200) if color_name == "white" else (50, 50, 50)
+            pygame.draw.rect(self.screen, color, (x, y, size, size))
+
+            # Add initial of piece type
+            text = render_text(get_font("Arial", 24), piece_type[0].upper(),
+                               (0, 0, 0) if color_name == "white" else (255, 255, 255))
+            text_rect = text.get_rect(center=(
+                x + size // 2,
+                y + size // 2
+            ))
+            self.screen.blit(text, text_rect)
     
     def highlight_square(self, square: Tuple[int, int]):
         """Highlight the selected square"""
@@ -92,18 +131,113 @@ class BoardView:
             # Draw a circle to indicate a legal move
             pygame.draw.circle(self.screen, self.move_indicator, (x, y), self.square_size // 6)
 
-    def draw_game_status(self, game_state: str, current_turn: str):
-        """Draw game status (check, checkmate, stalemate)."""
+    def _status_rect(self, game_state: str) -> pygame.Rect:
+        """Screen area of the status box for a game state"""
+        width = self.font.size(f"Game Status: {game_state.capitalize()}")[0]
+        return pygame.Rect(10, 10, width + 20, 60)
+
+    def draw_game_status(self, game_state: str, current_turn: str) -> pygame.Rect:
+        """Draw game status (check, checkmate, stalemate); returns the area drawn."""
         status_text = f"Game Status: {game_state.capitalize()}"
         turn_text = f"Current Turn: {current_turn.capitalize()}"
         
-        status = self.font.render(status_text, True, (255, 255, 255))
-        turn = self.font.render(turn_text, True, (255, 255, 255))
+        status = render_text(self.font, status_text, (255, 255, 255))
+        turn = render_text(self.font, turn_text, (255, 255, 255))
         
         # Draw with background
-        pygame.draw.rect(self.screen, (0, 0, 0), (10, 10, status.get_width() + 20, 60))
+        rect = pygame.Rect(10, 10, status.get_width() + 20, 60)
+        pygame.draw.rect(self.screen, (0, 0, 0), rect)
         self.screen.blit(status, (20, 20))
         self.screen.blit(turn, (20, 45))
+        return rect
+
+    def _squares_under(self, rect: Optional[pygame.Rect]) -> Set[int]:
+        """Indices (row * 8 + col) of the squares a screen rectangle overlaps"""
+        if rect is None:
+            return set()
+        size = self.square_size
+        rows = range(max(0, rect.top // size), min(8, (rect.bottom - 1) // size + 1))
+        cols = range(max(0, rect.left // size), min(8, (rect.right - 1) // size + 1))
+        return {row * 8 + col for row in rows for col in cols}
+
+    def render_frame(self, board, images: Dict[Tuple[str, str], pygame.Surface],
+                     selected: Optional[Tuple[int, int]] = None,
+                     legal_moves: List[Tuple[int, int]] = (),
+                     game_state: str = "playing", current_turn: str = "white",
+                     hidden: Optional[Tuple[int, int]] = None) -> List[pygame.Rect]:
+        """
+        Draw a frame, repainting only the squares whose contents changed
+        since the last call.
+
+        A square is dirty when its piece, its selection highlight or its
+        legal-move dot changed. The status box is repainted when its text
+        changes or a repainted square lies under it, and every square under
+        its old or new outline is repainted when it changes size. The
+        first call, the first after ``invalidate`` and any call after the
+        square size, square colors or coordinate font changed repaint
+        everything.
+
+        Args:
+            board: Board with ``get_piece(row, col)``
+            images: Piece images keyed by (color, type)
+            selected: Selected square as (col, row)
+            legal_moves: Legal-move dots as (row, col)
+            hidden: Square as (col, row) drawn without its piece, such as
+                the destination of a piece that is still being animated
+
+        Returns:
+            Screen rectangles that changed, for ``pygame.display.update``;
+            empty when nothing did
+        """
+        dots = set(legal_moves)
+        squares = []
+        for row in range(8):
+            for col in range(8):
+                piece = None if hidden == (col, row) else board.get_piece(row, col)
+                squares.append(((piece.color, piece.type) if piece else None,
+                                selected == (col, row), (row, col) in dots))
+        status = (game_state, current_turn)
+        self._background()  # Rebuilt if its settings changed since the last frame
+
+        if (self._frame is None or images is not self._frame_images
+                or self._background_key != self._frame_background_key):
+            dirty = set(range(64))
+            status_rect = self._status_rect(game_state)
+            status_changed = True
+        else:
+            previous = self._frame
+            dirty = {sq for sq in range(64) if squares[sq] != previous[sq]}
+            status_rect = self._frame_status_rect
+            status_changed = status != self._frame_status
+            if status_changed:
+                status_rect = self._status_rect(game_state)
+                if status_rect != self._frame_status_rect:
+                    dirty |= self._squares_under(self._frame_status_rect) | self._squares_under(status_rect)
+
+        size = self.square_size
+        rects = []
+        for sq in sorted(dirty):
+            row, col = divmod(sq, 8)
+            img_key, is_selected, has_dot = squares[sq]
+            self._draw_square(row, col)
+            if img_key:
+                self._draw_piece(img_key, row, col, images)
+            if is_selected:
+                self.highlight_square((col, row))
+            if has_dot:
+                self.draw_legal_moves([(row, col)])
+            rects.append(pygame.Rect(col * size, row * size, size, size))
+
+        if status_changed or dirty & self._squares_under(status_rect):
+            status_rect = self.draw_game_status(game_state, current_turn)
+            rects.append(status_rect)
+
+        self._frame = squares
+        self._frame_status = status
+        self._frame_status_rect = status_rect
+        self._frame_images = images
+        self._frame_background_key = self._background_key
+        return rects
 
     def render(self, board: List[List], images: Dict[str, pygame.Surface], 
                game_state: str = "playing", current_turn: str = "white", 
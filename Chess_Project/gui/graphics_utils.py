@@ -2,7 +2,100 @@
 
 import os
 import pygame
-from typing import Tuple, Optional, Dict, List
+from collections import OrderedDict
+from typing import Tuple, Optional, Dict, List, Any
+
+TEXT_CACHE_SIZE = 256  # Rendered strings kept by the shared text cache
+
+Color = Tuple[int, ...]
+
+
+class FontCache:
+    """
+    Font objects shared by everything that draws text.
+
+    Building a font (``pygame.font.SysFont`` searches the system font
+    list) is far more expensive than using one, so each name/size/style
+    combination is built once.
+    """
+    def __init__(self):
+        self._fonts: Dict[Tuple, pygame.font.Font] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, name: Optional[str], size: int, bold: bool = False,
+            italic: bool = False) -> pygame.font.Font:
+        """The font for a system font name (None for pygame's default) and size."""
+        key = (name, size, bold, italic)
+        font = self._fonts.get(key)
+        if font is None:
+            self.misses += 1
+            font = self._fonts[key] = pygame.font.SysFont(name, size, bold, italic)
+        else:
+            self.hits += 1
+        return font
+
+    def stats(self) -> Dict[str, Any]:
+        """How many font lookups reused a loaded font, and how many fonts are loaded."""
+        lookups = self.hits + self.misses
+        return {"hits": self.hits, "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0, "fonts": len(self._fonts)}
+
+
+class TextCache:
+    """
+    Rendered text surfaces keyed by font, text and colors.
+
+    Most UI text is the same from one frame to the next, so rendering it
+    again rasterizes the same glyphs for nothing. The least recently used
+    surface is dropped once ``capacity`` strings are cached.
+    """
+    def __init__(self, capacity: int = TEXT_CACHE_SIZE):
+        self.capacity = capacity
+        self._surfaces: "OrderedDict[Tuple, pygame.Surface]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font: pygame.font.Font, text: str, color: Color,
+               antialias: bool = True, background: Optional[Color] = None) -> pygame.Surface:
+        """Same as ``font.render``, from the cache when possible. Do not draw on the result."""
+        key = (font, text, tuple(color), antialias, tuple(background) if background else None)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self._surfaces.move_to_end(key)
+            return surface
+        self.misses += 1
+        surface = self._surfaces[key] = font.render(text, antialias, color, background)
+        if len(self._surfaces) > self.capacity:
+            self._surfaces.popitem(last=False)
+        return surface
+
+    def clear(self):
+        """Drop every cached surface."""
+        self._surfaces.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """How many renders were served without rasterizing, and how many surfaces are kept."""
+        lookups = self.hits + self.misses
+        return {"hits": self.hits, "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0, "cached": len(self._surfaces)}
+
+
+# Shared by every view
+font_cache = FontCache()
+text_cache = TextCache()
+
+
+def get_font(name: Optional[str], size: int, bold: bool = False, italic: bool = False) -> pygame.font.Font:
+    """Shared font object for a system font name and size."""
+    return font_cache.get(name, size, bold, italic)
+
+
+def render_text(font: pygame.font.Font, text: str, color: Color,
+                antialias: bool = True, background: Optional[Color] = None) -> pygame.Surface:
+    """Render text through the shared cache."""
+    return text_cache.render(font, text, color, antialias, background)
 
 def load_image(file_path: str) -> pygame.Surface:
     """
@@ -44,27 +137,12 @@ def create_transparent_surface(size: Tuple[int, int],
 def load_piece_images(directory: str, square_size: int) -> Dict[str, pygame.Surface]:
     """
     Load all chess piece images from a directory and scale them.
+
+    Images come from the shared piece atlas for the directory (see
+    ``gui.sprites``), keyed like "white_pawn".
     """
-    images = {}
-    pieces = ["king", "queen", "bishop", "knight", "rook", "pawn"]
-    colors = ["white", "black"]
-    
-    try:
-        for color in colors:
-            for piece in pieces:
-                file_path = os.path.join(directory, f"{color}_{piece}.png")
-                if os.path.exists(file_path):
-                    image = load_image(file_path)
-                    images[f"{color}_{piece}"] = scale_image(
-                        image, (square_size, square_size)
-                    )
-                else:
-                    print(f"Warning: Missing piece image: {file_path}")
-    except Exception as e:
-        print(f"Error loading piece images: {e}")
-        raise
-        
-    return images
+    from .sprites import piece_images_by_name  # sprites builds on this module
+    return piece_images_by_name(square_size, directory)
 
 class InfoPanel:
     """
@@ -92,9 +170,9 @@ class InfoPanel:
         self.highlight_color = (70, 130, 180)
         
         # Fonts
-        self.title_font = pygame.font.SysFont(None, 32)
-        self.normal_font = pygame.font.SysFont(None, 24)
-        self.small_font = pygame.font.SysFont(None, 18)
+        self.title_font = get_font(None, 32)
+        self.normal_font = get_font(None, 24)
+        self.small_font = get_font(None, 18)
         
         # Load piece type icons
         self.icons = self._load_icons()
@@ -179,12 +257,12 @@ class InfoPanel:
         pygame.draw.rect(self.screen, self.text_color, panel_rect, 2)
         
         # Draw title
-        title = self.title_font.render("Chess Game", True, self.text_color)
+        title = render_text(self.title_font, "Chess Game", self.text_color)
         self.screen.blit(title, (self.position[0] + 10, self.position[1] + 10))
         
         # Draw current game state
         state_text = f"Game State: {game_state.capitalize()}"
-        state = self.normal_font.render(state_text, True, self.text_color)
+        state = render_text(self.normal_font, state_text, self.text_color)
         self.screen.blit(state, (self.position[0] + 10, self.position[1] + 50))
         
         # Draw current turn
@@ -195,7 +273,7 @@ class InfoPanel:
         pygame.draw.rect(self.screen, self.text_color, turn_rect, 1)
         
         turn_text = f"{current_turn.capitalize()}'s turn"
-        turn = self.normal_font.render(turn_text, True, self.text_color)
+        turn = render_text(self.normal_font, turn_text, self.text_color)
         self.screen.blit(turn, (self.position[0] + 40, self.position[1] + 80))
         
         # Draw selected piece info if available
@@ -203,7 +281,7 @@ class InfoPanel:
             pos, piece = selected_piece
             
             # Section header
-            selected_header = self.normal_font.render("Selected Piece:", True, self.text_color)
+            selected_header = render_text(self.normal_font, "Selected Piece:", self.text_color)
             self.screen.blit(selected_header, (self.position[0] + 10, self.position[1] + 120))
             
             # Draw piece info
@@ -225,8 +303,8 @@ class InfoPanel:
             piece_name = f"{color.capitalize()} {piece_type.capitalize()}"
             piece_pos_text = f"Position: {chr(97 + pos[0])}{8 - pos[1]}"
             
-            name_text = self.normal_font.render(piece_name, True, self.text_color)
-            pos_text = self.small_font.render(piece_pos_text, True, self.text_color)
+            name_text = render_text(self.normal_font, piece_name, self.text_color)
+            pos_text = render_text(self.small_font, piece_pos_text, self.text_color)
             
             self.screen.blit(name_text, (self.position[0] + 80, self.position[1] + 150))
             self.screen.blit(pos_text, (self.position[0] + 20, self.position[1] + 175))
@@ -234,13 +312,13 @@ class InfoPanel:
         # Draw captured pieces if available
         if captured_pieces:
             # Section header
-            captured_header = self.normal_font.render("Captured Pieces:", True, self.text_color)
+            captured_header = render_text(self.normal_font, "Captured Pieces:", self.text_color)
             self.screen.blit(captured_header, (self.position[0] + 10, self.position[1] + 210))
             
             # Draw white's captures
             white_y = self.position[1] + 240
             if "black" in captured_pieces and captured_pieces["black"]:
-                white_text = self.small_font.render("White captured:", True, self.text_color)
+                white_text = render_text(self.small_font, "White captured:", self.text_color)
                 self.screen.blit(white_text, (self.position[0] + 20, white_y))
                 
                 # Draw icons for each captured piece
@@ -253,7 +331,7 @@ class InfoPanel:
             # Draw black's captures
             black_y = white_y + 70
             if "white" in captured_pieces and captured_pieces["white"]:
-                black_text = self.small_font.render("Black captured:", True, self.text_color)
+                black_text = render_text(self.small_font, "Black captured:", self.text_color)
                 self.screen.blit(black_text, (self.position[0] + 20, black_y))
                 
                 # Draw icons for each captured piece
@@ -267,7 +345,7 @@ class InfoPanel:
         if last_move:
             start, end = last_move
             last_move_text = f"Last move: {chr(97 + start[0])}{8 - start[1]} → {chr(97 + end[0])}{8 - end[1]}"
-            move_text = self.small_font.render(last_move_text, True, self.text_color)
+            move_text = render_text(self.small_font, last_move_text, self.text_color)
             self.screen.blit(move_text, (self.position[0] + 10, self.position[1] + self.size[1] - 40))
 
 def draw_coordinates(screen: pygame.Surface, square_size: int, 
@@ -281,20 +359,20 @@ def draw_coordinates(screen: pygame.Surface, square_size: int,
         font: Font to use (creates default if None)
     """
     if font is None:
-        font = pygame.font.SysFont(None, 20)
+        font = get_font(None, 20)
     
     text_color = (50, 50, 50)
     
     # Draw file labels (a-h)
     for i in range(8):
-        label = font.render(chr(97 + i), True, text_color)
+        label = render_text(font, chr(97 + i), text_color)
         x = i * square_size + square_size//2 - label.get_width()//2
         y = 8 * square_size + 5
         screen.blit(label, (x, y))
     
     # Draw rank labels (1-8)
     for i in range(8):
-        label = font.render(str(8 - i), True, text_color)
+        label = render_text(font, str(8 - i), text_color)
         x = -5 - label.get_width()
         y = i * square_size + square_size//2 - label.get_height()//2
         screen.blit(label, (x, y))
@@ -332,8 +410,8 @@ def draw_promotion_dialog(screen: pygame.Surface, square_size: int,
     pygame.draw.rect(screen, (0, 0, 0), dialog_rect, 2)
     
     # Draw title
-    font = pygame.font.SysFont(None, 24)
-    title = font.render("Promote to:", True, (0, 0, 0))
+    font = get_font(None, 24)
+    title = render_text(font, "Promote to:", (0, 0, 0))
     screen.blit(title, (x + 10, y + 10))
     
     # Draw piece options
@@ -1,25 +1,14 @@
-import pygame
 import os
 import json
 
+from .sprites import piece_images_by_name
+
+
 def load_piece_images(square_size):
     """
-    Load chess piece images.
+    Load chess piece images, keyed like "white_pawn", from the shared piece atlas.
     """
-    images = {}
-    base_path = os.path.join(os.path.dirname(__file__), "../assets/pieces")
-    for piece in ["pawn", "knight", "bishop", "rook", "queen", "king"]:
-        for color in ["white", "black"]:
-            key = f"{color}_{piece}"
-            path = os.path.join(base_path, f"{key}.png")
-            try:
-                image = pygame.transform.scale(pygame.image.load(path), 
-                                               (square_size, square_size))
-                images[key] = image
-            except FileNotFoundError:
-                print(f"Error: Missing file {path}")
-    return images
-=======
+    return piece_images_by_name(square_size)
 
 def save_game_state(game_state, filename="saved_game.json"):
     """
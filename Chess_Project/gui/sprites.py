@@ -0,0 +1,199 @@
+"""
+Piece sprites: all twelve piece images packed into one atlas per square size.
+
+The source PNGs are decoded once. For each square size they are scaled
+into a single 6 x 2 atlas surface, converted to the display format, and
+every piece is handed out as a subsurface of it, so all sizes used in a
+session stay in memory ready to blit.
+
+Scaled atlases are also written to a cache directory as raw RGBA, named
+by square size and a digest of the source files' names, sizes and
+modification times. A later start at the same size reads one file
+instead of decoding and scaling twelve images; editing or replacing a
+source image changes the digest, so stale atlases are never used.
+"""
+import hashlib
+import os
+from typing import Dict, Optional, Tuple
+
+import pygame
+
+from .graphics_utils import get_font, render_text, scale_image
+
+COLORS = ("white", "black")
+PIECE_TYPES = ("pawn", "knight", "bishop", "rook", "queen", "king")
+PIECES_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "assets", "pieces")
+CACHE_VERSION = 1  # Bump when the atlas layout or scaling changes
+
+_to_bytes = getattr(pygame.image, "tobytes", None) or pygame.image.tostring
+_from_bytes = getattr(pygame.image, "frombytes", None) or pygame.image.fromstring
+
+PieceKey = Tuple[str, str]  # (color, piece type)
+
+
+class PieceAtlas:
+    """Piece images from one directory, scaled and cached per square size."""
+
+    def __init__(self, directory: str = PIECES_DIR, cache_dir: Optional[str] = None):
+        """
+        Args:
+            directory: Folder of piece PNGs named ``white_pawn.png`` or ``WhitePawn.png``
+            cache_dir: Where scaled atlases are kept between runs
+                (default: a ``.cache`` folder inside ``directory``)
+        """
+        self.directory = directory
+        self.cache_dir = cache_dir or os.path.join(directory, ".cache")
+        self._sources: Optional[Dict[PieceKey, Optional[pygame.Surface]]] = None
+        self._atlases: Dict[int, pygame.Surface] = {}
+        self._images: Dict[int, Dict[PieceKey, pygame.Surface]] = {}
+
+        self.disk_hits = 0
+        self.disk_misses = 0
+
+    def source_path(self, color: str, piece_type: str) -> Optional[str]:
+        """Image file for a piece in either naming format, or None if there is none."""
+        for filename in (f"{color}_{piece_type}.png", f"{color.capitalize()}{piece_type.capitalize()}.png"):
+            path = os.path.join(self.directory, filename)
+            if os.path.exists(path):
+                return path
+        return None
+
+    def images(self, square_size: int) -> Dict[PieceKey, pygame.Surface]:
+        """Every piece at ``square_size``, keyed by (color, type); missing images get placeholders."""
+        images = self._images.get(square_size)
+        if images is None:
+            atlas = self.atlas(square_size)
+            images = {
+                (color, piece_type): atlas.subsurface((col * square_size, row * square_size,
+                                                       square_size, square_size))
+                for row, color in enumerate(COLORS)
+                for col, piece_type in enumerate(PIECE_TYPES)
+            }
+            self._images[square_size] = images
+        return images
+
+    def atlas(self, square_size: int) -> pygame.Surface:
+        """The atlas for a square size: one row per color, one column per piece type."""
+        atlas = self._atlases.get(square_size)
+        if atlas is None:
+            path = os.path.join(self.cache_dir, f"pieces-{square_size}-{self._digest(square_size)}.rgba")
+            atlas = self._read_cached(path, square_size)
+            if atlas is None:
+                self.disk_misses += 1
+                atlas = self._build(square_size)
+                self._write_cached(path, atlas, square_size)
+            else:
+                self.disk_hits += 1
+            if pygame.display.get_surface() is not None:
+                atlas = atlas.convert_alpha()  # Raw RGBA from the cache would be converted on every blit
+            self._atlases[square_size] = atlas
+        return atlas
+
+    def clear(self):
+        """Forget the scaled atlases held in memory (the disk cache is kept)."""
+        self._atlases = {}
+        self._images = {}
+
+    def _digest(self, square_size: int) -> str:
+        """Cache key covering the atlas layout and every source file's identity."""
+        parts = [f"v{CACHE_VERSION}", str(square_size)]
+        for color in COLORS:
+            for piece_type in PIECE_TYPES:
+                path = self.source_path(color, piece_type)
+                if path is None:
+                    parts.append(f"{color}_{piece_type}:missing")
+                else:
+                    stat = os.stat(path)
+                    parts.append(f"{os.path.basename(path)}:{stat.st_size}:{stat.st_mtime_ns}")
+        return hashlib.sha1("|".join(parts).encode()).hexdigest()[:16]
+
+    def _load_sources(self) -> Dict[PieceKey, Optional[pygame.Surface]]:
+        """Decode the source images once; None marks a piece that has none."""
+        if self._sources is None:
+            self._sources = {}
+            for color in COLORS:
+                for piece_type in PIECE_TYPES:
+                    image = None
+                    path = self.source_path(color, piece_type)
+                    if path is not None:
+                        try:
+                            image = pygame.image.load(path)
+                        except pygame.error as e:
+                            print(f"Error loading {path}: {e}")
+                    self._sources[(color, piece_type)] = image
+        return self._sources
+
+    def _build(self, square_size: int) -> pygame.Surface:
+        """Scale every source (or draw its placeholder) into a fresh atlas."""
+        atlas = pygame.Surface((len(PIECE_TYPES) * square_size, len(COLORS) * square_size), pygame.SRCALPHA)
+        sources = self._load_sources()
+        for row, color in enumerate(COLORS):
+            for col, piece_type in enumerate(PIECE_TYPES):
+                image = sources[(color, piece_type)]
+                if image is None:
+                    print(f"Creating placeholder for {color} {piece_type}")
+                    image = _placeholder(color, piece_type, square_size)
+                else:
+                    image = scale_image(image, (square_size, square_size))
+                atlas.blit(image, (col * square_size, row * square_size))
+        return atlas
+
+    def _read_cached(self, path: str, square_size: int) -> Optional[pygame.Surface]:
+        """Atlas from the disk cache, or None if it is missing or unreadable."""
+        size = (len(PIECE_TYPES) * square_size, len(COLORS) * square_size)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except OSError:
+            return None
+        if len(data) != size[0] * size[1] * 4:
+            return None
+        return _from_bytes(data, size, "RGBA")
+
+    def _write_cached(self, path: str, atlas: pygame.Surface, square_size: int):
+        """Store an atlas in the disk cache, replacing older ones of the same size."""
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            prefix = f"pieces-{square_size}-"
+            for name in os.listdir(self.cache_dir):
+                if name.startswith(prefix) and name.endswith(".rgba"):
+                    os.remove(os.path.join(self.cache_dir, name))
+            with open(path + ".tmp", "wb") as f:
+                f.write(_to_bytes(atlas, "RGBA"))
+            os.replace(path + ".tmp", path)
+        except OSError as e:
+            print(f"Could not cache piece images in {self.cache_dir}: {e}")
+
+
+def _placeholder(color: str, piece_type: str, square_size: int) -> pygame.Surface:
+    """A lettered square standing in for a missing piece image."""
+    image = pygame.Surface((square_size, square_size), pygame.SRCALPHA)
+    rect_color = (220, 220, 220) if color == "white" else (50, 50, 50)
+    pygame.draw.rect(image, rect_color, (5, 5, square_size - 10, square_size - 10))
+    text = render_text(get_font("Arial", int(square_size / 3)), piece_type[0].upper(),
+                       (0, 0, 0) if color == "white" else (255, 255, 255))
+    image.blit(text, text.get_rect(center=(square_size / 2, square_size / 2)))
+    return image
+
+
+_atlases: Dict[str, PieceAtlas] = {}
+
+
+def get_atlas(directory: str = PIECES_DIR) -> PieceAtlas:
+    """The shared atlas for a directory of piece images."""
+    directory = os.path.abspath(directory)
+    atlas = _atlases.get(directory)
+    if atlas is None:
+        atlas = _atlases[directory] = PieceAtlas(directory)
+    return atlas
+
+
+def piece_images(square_size: int, directory: str = PIECES_DIR) -> Dict[PieceKey, pygame.Surface]:
+    """Piece images keyed by (color, type), e.g. ("white", "pawn")."""
+    return get_atlas(directory).images(square_size)
+
+
+def piece_images_by_name(square_size: int, directory: str = PIECES_DIR) -> Dict[str, pygame.Surface]:
+    """Piece images keyed by name, e.g. "white_pawn"."""
+    return {f"{color}_{piece_type}": image
+            for (color, piece_type), image in piece_images(square_size, directory).items()}
@@ -9,7 +9,15 @@ pygame.init()
 # Fix any imports to match your project structure
 try:
     from engine.game_manager import GameManager
+    from engine.async_ai import AsyncAI
+    from engine.book import OpeningBook
+    from engine.game_engine import GameEngine, DEFAULT_SEARCH_DEPTH, SEARCH_LEVELS
+    from engine.piece import Piece
+    from engine.ponder import Ponderer
+    from engine.tablebase import Tablebases
+    from gui.animate_move import MoveAnimator
     from gui.board_view import BoardView
+    from gui.graphics_utils import get_font
     from utils.load_pieces import load_piece_images
 except ImportError as e:
     print(f"Error importing project modules: {e}")
@@ -22,6 +30,17 @@ WIDTH, HEIGHT = 800, 800
 SQUARE_SIZE = WIDTH // 8
 FPS = 60
 
+# Event-driven rendering: sleep until input arrives instead of running at
+# FPS, waking every AI_POLL_MS while the computer is thinking
+EVENT_DRIVEN = False
+AI_POLL_MS = 50
+
+# Computer opponent: the color it plays (None for two human players) and its strength
+AI_COLOR = None
+AI_DIFFICULTY = "hard"
+BOOK_PATH = os.path.join(os.path.dirname(__file__), "assets", "book.bin")  # Optional opening book
+TABLEBASE_DIR = os.path.join(os.path.dirname(__file__), "tablebases")  # Optional endgame tables
+
 def init_pygame() -> pygame.surface.Surface:
     """Initialize Pygame and create window"""
     # Create window with error checking
@@ -39,18 +58,83 @@ def init_pygame() -> pygame.surface.Surface:
         print(f"Display initialization error: {e}")
         sys.exit(1)
 
-def handle_move(game: GameManager, pos: Tuple[int, int], selected_square: Optional[Tuple[int, int]]) -> Optional[Tuple[int, int]]:
+def next_events(clock: pygame.time.Clock, waiting_on_ai: bool, animating: bool = False) -> List[pygame.event.Event]:
+    """
+    Wait for the next pass of the main loop and return the events to handle.
+
+    By default the loop runs at a fixed FPS. With EVENT_DRIVEN it blocks in
+    pygame.event.wait until input arrives, with an AI_POLL_MS timeout while
+    the AI is thinking so its move is picked up, and falls back to the fixed
+    frame rate only while a move is being animated. A timed-out wait yields
+    a NOEVENT, which no handler reacts to.
+    """
+    if not EVENT_DRIVEN or animating:
+        clock.tick(FPS)
+        return pygame.event.get()
+    first = pygame.event.wait(AI_POLL_MS if waiting_on_ai else 0)
+    return [first] + pygame.event.get()
+
+def handle_move(game: GameManager, pos: Tuple[int, int], selected_square: Optional[Tuple[int, int]],
+                engine: Optional[GameEngine] = None) -> Optional[Tuple[int, int]]:
     """Handle piece movement logic"""
     col, row = pos[0] // SQUARE_SIZE, pos[1] // SQUARE_SIZE
     current_pos = (col, row)
     
     if selected_square:
         # If a piece is already selected, try to move it
-        if game.move_piece(selected_square, current_pos):
+        if engine is not None:
+            # Against the computer the engine enforces the full rules
+            moved = engine.make_move(selected_square, current_pos)
+            if moved:
+                sync_game(game, engine)
+        else:
+            moved = game.move_piece(selected_square, current_pos)
+        if moved:
             return None  # Reset selection after successful move
         return current_pos  # New selection if move failed
     return current_pos  # First selection
 
+def animate_last_move(animator: MoveAnimator, game: GameManager, engine: Optional[GameEngine],
+                      images) -> Optional[Tuple[int, int]]:
+    """Slide the piece that just moved onto its square; returns that square as (col, row)"""
+    if engine:
+        start, end, _ = engine.last_move
+    else:
+        move = game.move_history[-1]
+        start, end = move['from'][::-1], move['to'][::-1]
+    piece = game.board.get_piece(end[1], end[0])
+    image = images.get((piece.color, piece.type)) if piece else None
+    if image is None:
+        return None
+    animator.start_animation(start, end, image)
+    return end
+
+def sync_game(game: GameManager, engine: GameEngine):
+    """Copy the engine's position into the GameManager the board view draws"""
+    for row in range(8):
+        for col in range(8):
+            piece = engine.board.get_piece((col, row))
+            game.board.squares[row][col] = Piece(piece[0], piece[1], (row, col)) if piece else None
+    game.current_player = engine.current_turn
+    game.game_over = engine.game_state in ("checkmate", "stalemate", "draw")
+    game.position_changed()
+
+def play_ai_move(game: GameManager, engine: GameEngine, ponderer: Ponderer, result):
+    """Make the computer's chosen move, then ponder the reply it expects"""
+    if result.move is not None:
+        engine.play(result.move)
+    sync_game(game, engine)
+
+    if len(result.pv) > 1 and not game.game_over:
+        level = SEARCH_LEVELS.get(AI_DIFFICULTY, {})
+        ponderer.start(result.pv[1], level.get("depth", DEFAULT_SEARCH_DEPTH))
+
+def human_moved(engine: GameEngine, ponderer: Ponderer) -> bool:
+    """Tell the ponderer what the human played; True if its search continues"""
+    level = SEARCH_LEVELS.get(AI_DIFFICULTY, {})
+    return ponderer.opponent_moved(engine.last_move_code(), level.get("time_limit_ms"),
+                                   level.get("max_nodes"))
+
 def main():
     """Main function to run the chess game"""
     screen = None
@@ -77,53 +161,133 @@ def main():
             
             board_view = BoardView(screen, SQUARE_SIZE)
             # Initialize fonts for coordinates in BoardView
-            board_view.coordinate_font = pygame.font.SysFont("Arial", 18)
-            board_view.font = pygame.font.SysFont("Arial", 18)
+            board_view.coordinate_font = get_font("Arial", 18)
+            board_view.font = get_font("Arial", 18)
             
         except Exception as e:
             print(f"Component initialization error: {e}")
             return
         
+        # Computer opponent
+        book = OpeningBook(BOOK_PATH) if AI_COLOR and os.path.exists(BOOK_PATH) else None
+        tablebases = Tablebases(TABLEBASE_DIR) if AI_COLOR and os.path.isdir(TABLEBASE_DIR) else None
+        engine = GameEngine(opening_book=book, tablebases=tablebases) if AI_COLOR else None
+        ponderer = Ponderer(engine) if engine else None
+        ai = AsyncAI(engine) if engine else None
+        if engine:
+            # Hand the GIL back to this thread promptly while the AI thinks
+            sys.setswitchinterval(0.001)
+
         # Game state
         clock = pygame.time.Clock()
         running = True
         selected_square = None
+        pondering_hit = False  # The ponder search is now answering the human's move
+        animator = MoveAnimator(screen, SQUARE_SIZE)
+        animating_to = None  # Square the animated piece is moving onto
+        moves_shown = 0  # Moves made so far, to spot new ones to animate
         
+        if EVENT_DRIVEN:
+            pygame.event.set_blocked(pygame.MOUSEMOTION)  # Unused; would only wake the loop
+
         # Main game loop
         while running and pygame.display.get_init():
             # Event handling
-            for event in pygame.event.get():
+            waiting_on_ai = engine is not None and (ai.busy or pondering_hit)
+            for event in next_events(clock, waiting_on_ai, animator.is_animating()):
                 if event.type in (pygame.QUIT, pygame.WINDOWCLOSE):
                     running = False
                     break
-                    
+
+                elif event.type in (pygame.WINDOWEXPOSED, pygame.VIDEOEXPOSE):
+                    board_view.invalidate()  # Uncovered parts of the window need repainting
+
+                elif event.type == pygame.KEYDOWN and event.key in (pygame.K_u, pygame.K_n):
+                    # Undo or new game: whatever the AI was thinking about is obsolete
+                    if engine:
+                        ai.cancel()
+                        ponderer.stop()
+                        pondering_hit = False
+                        if event.key == pygame.K_n:
+                            engine.initialize_game()
+                        elif engine.undo_move() and engine.current_turn == AI_COLOR:
+                            engine.undo_move()  # Take back the human's move too
+                        sync_game(game, engine)
+                    elif event.key == pygame.K_n:
+                        game = GameManager()
+                    else:
+                        game.undo_move()
+                    selected_square = None
+
                 elif event.type == pygame.MOUSEBUTTONDOWN and pygame.display.get_active():
+                    if engine and (game.current_player == AI_COLOR or game.game_over):
+                        continue  # Not the human's turn
                     try:
                         pos = pygame.mouse.get_pos()
-                        selected_square = handle_move(game, pos, selected_square)
+                        moves_before = len(engine.move_history) if engine else 0
+                        selected_square = handle_move(game, pos, selected_square, engine)
+                        if engine and len(engine.move_history) > moves_before:
+                            pondering_hit = human_moved(engine, ponderer)
+                            if game.game_over:
+                                # The human's move ended the game: nothing left to answer
+                                ponderer.stop()
+                                pondering_hit = False
                     except Exception as e:
                         print(f"Move error: {e}")
                         continue
             
+            # Computer's turn: the search runs in the background, so keep
+            # handling events and drawing frames until its move is ready
+            if running and engine and game.current_player == AI_COLOR and not game.game_over:
+                if pondering_hit:
+                    if ponderer.done():
+                        pondering_hit = False
+                        play_ai_move(game, engine, ponderer, ponderer.result())
+                elif ai.busy:
+                    result = ai.poll()
+                    if result is not None:
+                        play_ai_move(game, engine, ponderer, result)
+                else:
+                    ai.request_move(AI_DIFFICULTY)
+            
+            # Animate each new move; undo and new game just redraw
+            moves_made = len(engine.move_history) if engine else len(game.move_history)
+            if moves_made > moves_shown:
+                animating_to = animate_last_move(animator, game, engine, images)
+            elif moves_made < moves_shown and animator.is_animating():
+                animator.animating = False  # The animated move was taken back
+                board_view.invalidate()
+            moves_shown = moves_made
+
             # Drawing
             if running:  # Only draw if still running
                 try:
-                    screen.fill((0, 0, 0))  # Clear screen with black
-                    board_view.draw_board()
-                    board_view.draw_pieces(game.board, images)
-                    
+                    legal_moves = []
                     if selected_square:
-                        board_view.highlight_square(selected_square)
-                        legal_moves = game.get_legal_moves(selected_square)
-                        if legal_moves:
-                            board_view.draw_legal_moves(legal_moves)
-                    
-                    # Draw game status
-                    game_state = "check" if game.is_in_check(game.current_player) else "playing"
-                    board_view.draw_game_status(game_state, game.current_player)
+                        if engine:
+                            legal_moves = [(y, x) for x, y in engine.get_legal_moves(selected_square)]
+                        else:
+                            legal_moves = game.get_legal_moves(selected_square)
                     
-                    pygame.display.flip()
-                    clock.tick(FPS)
+                    # Game status
+                    if engine:
+                        game_state = engine.game_state
+                    else:
+                        game_state = "check" if game.is_in_check(game.current_player) else "playing"
+
+                    if animator.is_animating():
+                        # The animator flips the whole screen, so redraw all of it
+                        def draw_under_animation():
+                            board_view.invalidate()
+                            board_view.render_frame(game.board, images, selected_square, legal_moves,
+                                                    game_state, game.current_player, hidden=animating_to)
+                        animator.update(draw_under_animation)
+                    if not animator.is_animating():
+                        # Repaint and push only the squares that changed
+                        dirty = board_view.render_frame(game.board, images, selected_square, legal_moves,
+                                                        game_state, game.current_player)
+                        if dirty:
+                            pygame.display.update(dirty)
                     
                 except Exception as e:
                     print(f"Rendering error: {e}")
@@ -133,6 +297,14 @@ def main():
         print(f"Error in game: {e}")
     finally:
         # Ensure proper cleanup
+        if 'ponderer' in locals() and ponderer:
+            ponderer.stop()
+        if 'ai' in locals() and ai:
+            ai.shutdown()
+        if 'book' in locals() and book:
+            book.close()
+        if 'tablebases' in locals() and tablebases:
+            tablebases.close()
         if pygame.get_init():
             pygame.quit()
         if 'screen' in locals() and screen:
@@ -141,6 +313,3 @@ def main():
 
 if __name__ == "__main__":
     main()
-=======
-
-    
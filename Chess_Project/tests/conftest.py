@@ -0,0 +1,6 @@
+import os
+import sys
+
+# Run from any directory, and draw the GUI without opening a window
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
@@ -0,0 +1,101 @@
+import pygame
+import pytest
+
+from engine.game_manager import GameManager
+from gui.board_view import BoardView
+from gui.graphics_utils import get_font
+from gui.sprites import COLORS, PIECE_TYPES
+
+SQUARE_SIZE = 50
+
+
+@pytest.fixture
+def screen():
+    # Left initialized: the shared font cache outlives a single test
+    pygame.init()
+    return pygame.display.set_mode((8 * SQUARE_SIZE, 8 * SQUARE_SIZE))
+
+
+@pytest.fixture
+def view(screen):
+    view = BoardView(screen, SQUARE_SIZE)
+    view.coordinate_font = get_font("Arial", 14)
+    view.font = get_font("Arial", 14)
+    return view
+
+
+@pytest.fixture
+def images():
+    """A distinct solid color per piece, so misplaced pieces show up as pixels."""
+    images = {}
+    for row, color in enumerate(COLORS):
+        for col, piece_type in enumerate(PIECE_TYPES):
+            image = pygame.Surface((SQUARE_SIZE, SQUARE_SIZE), pygame.SRCALPHA)
+            pygame.draw.circle(image, (40 * col, 120 * row, 200), (SQUARE_SIZE // 2, SQUARE_SIZE // 2), 15)
+            images[(color, piece_type)] = image
+    return images
+
+
+def pixels(surface):
+    return pygame.image.tobytes(surface, "RGB")
+
+
+def full_render(view, board, images, game_state="playing", current_turn="white",
+                selected=None, legal_moves=()):
+    view.render(board, images, game_state, current_turn)
+    if selected:
+        view.highlight_square(selected)
+    view.draw_legal_moves(list(legal_moves))
+    view.draw_game_status(game_state, current_turn)  # Back on top of the highlights
+    return pixels(view.screen)
+
+
+def test_frames_match_a_full_redraw(view, images):
+    game = GameManager()
+    # (move to make first, selected square, game state)
+    script = [
+        (None, None, "playing"),
+        (None, (4, 6), "playing"),
+        (((4, 6), (4, 4)), None, "playing"),
+        (None, (1, 0), "check"),
+        (None, (6, 0), "checkmate"),  # Wider status box
+        (((6, 0), (5, 2)), None, "playing"),  # Narrower again
+        (None, None, "playing"),  # Nothing changed
+    ]
+    for move, selected, game_state in script:
+        if move:
+            assert game.move_piece(*move)
+        legal_moves = game.get_legal_moves(selected) if selected else []
+        dots = [(row, col) for col, row in legal_moves]
+        view.render_frame(game.board, images, selected, dots, game_state, game.current_player)
+        frame = pixels(view.screen)
+        assert frame == full_render(view, game.board, images, game_state, game.current_player, selected, dots)
+
+
+def test_idle_frame_repaints_nothing(view, images):
+    game = GameManager()
+    assert view.render_frame(game.board, images)
+    assert view.render_frame(game.board, images) == []
+    view.invalidate()
+    assert len(view.render_frame(game.board, images)) > 64
+
+
+def test_color_change_repaints_the_whole_board(view, images):
+    game = GameManager()
+    view.render_frame(game.board, images)
+
+    view.light_square = (200, 210, 255)
+    view.dark_square = (60, 80, 140)
+    assert len(view.render_frame(game.board, images)) > 64
+    frame = pixels(view.screen)
+
+    assert frame == full_render(view, game.board, images)
+
+
+def test_hidden_square_is_drawn_empty(view, images):
+    game = GameManager()
+    view.render_frame(game.board, images, hidden=(4, 6))
+    frame = pixels(view.screen)
+
+    game.board.squares[6][4] = None
+    assert frame == full_render(view, game.board, images)
@@ -0,0 +1,99 @@
+import pytest
+
+from engine.evaluation import evaluate, evaluate_from_scratch
+from engine.game_engine import GameEngine
+from engine.perft import REFERENCE_POSITIONS
+from engine.zobrist import zobrist_hash
+
+FENS = [p[1] for p in REFERENCE_POSITIONS]
+NAMES = [p[0] for p in REFERENCE_POSITIONS]
+
+
+def snapshot(engine):
+    board = engine.board
+    return (engine.to_fen(), engine.hash, list(board.mailbox),
+            board.mg_score, board.eg_score, board.phase)
+
+
+def recomputed_hash(engine):
+    return zobrist_hash(engine.board, engine.side, engine.castling, engine.ep_square)
+
+
+@pytest.mark.parametrize("fen", FENS, ids=NAMES)
+def test_push_pop_restores_position(fen):
+    engine = GameEngine()
+    engine.load_fen(fen)
+
+    def walk(depth):
+        before = snapshot(engine)
+        for move in engine._legal_moves():
+            engine.push(move)
+            assert engine.hash == recomputed_hash(engine)
+            white_score = evaluate(engine) if engine.side == 0 else -evaluate(engine)
+            assert white_score == evaluate_from_scratch(engine.board)
+            if depth > 1:
+                walk(depth - 1)
+            assert engine.pop() == move
+            assert snapshot(engine) == before
+
+    walk(2)
+
+
+def test_undo_move_restores_position():
+    engine = GameEngine()
+    start = snapshot(engine)
+    assert engine.make_move((4, 6), (4, 4))
+    assert engine.make_move((4, 1), (4, 3))
+    assert engine.undo_move() and engine.undo_move()
+    assert snapshot(engine) == start
+    assert not engine.undo_move()
+
+
+def test_threefold_repetition():
+    engine = GameEngine()
+    shuffle = ["Nf3", "Nf6", "Ng1", "Ng8"]
+    for san in shuffle:
+        engine.play(engine.parse_san(san))
+    assert engine.is_repetition(2) and not engine.is_repetition(3)
+    assert engine.game_state != "draw"
+    for san in shuffle:
+        engine.play(engine.parse_san(san))
+    assert engine.is_repetition(3)
+    assert engine.game_state == "draw"
+
+
+def test_pawn_move_resets_repetition():
+    engine = GameEngine()
+    for san in ["Nf3", "Nf6", "Ng1", "Ng8", "e4"]:
+        engine.play(engine.parse_san(san))
+    assert not engine.is_repetition(2)
+
+
+def test_last_move_code():
+    engine = GameEngine()
+    assert engine.last_move_code() is None
+    move = engine.parse_san("Nf3")
+    engine.play(move)
+    assert engine.last_move_code() == move
+
+
+def test_evaluation_is_symmetric():
+    engine = GameEngine()
+    assert evaluate(engine) == 0
+    engine.load_fen("4k3/8/8/8/8/8/8/3QK3 w - - 0 1")
+    white = evaluate(engine)
+    engine.load_fen("3qk3/8/8/8/8/8/8/4K3 b - - 0 1")
+    assert evaluate(engine) == white > 800
+
+
+def test_get_legal_moves_accepts_lists():
+    engine = GameEngine()
+    assert engine.get_legal_moves([4, 6]) == engine.get_legal_moves((4, 6)) == [(4, 4), (4, 5)]
+
+
+def test_legal_moves_follow_the_position():
+    engine = GameEngine()
+    assert engine.get_legal_moves((5, 7)) == []  # Bishop blocked by pawns
+    engine.play(engine.parse_san("g3"))
+    engine.play(engine.parse_san("a6"))
+    assert (6, 6) in engine.get_legal_moves((5, 7))  # Bishop to g2 now that the pawn moved
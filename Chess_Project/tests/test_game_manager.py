@@ -0,0 +1,15 @@
+from engine.game_manager import GameManager
+
+
+def test_legal_moves_accept_lists():
+    game = GameManager()
+    assert game.get_legal_moves([4, 6]) == game.get_legal_moves((4, 6)) == [(5, 4), (4, 4)]
+
+
+def test_legal_moves_refresh_after_a_move_and_undo():
+    game = GameManager()
+    assert game.get_legal_moves((5, 7)) == []  # Bishop blocked by pawns
+    assert game.move_piece((4, 6), (4, 4))
+    assert game.get_legal_moves((5, 7)) == []  # Black to move
+    game.undo_move()
+    assert game.get_legal_moves((4, 6)) == [(5, 4), (4, 4)]
@@ -0,0 +1,28 @@
+import pytest
+
+from engine.game_engine import GameEngine
+from engine.perft import REFERENCE_POSITIONS, main
+
+MAX_DEPTH = 3  # Deeper counts are checked by ``python -m engine.perft --depth 5``
+
+
+@pytest.mark.parametrize("name, fen, counts", REFERENCE_POSITIONS, ids=[p[0] for p in REFERENCE_POSITIONS])
+def test_reference_counts(name, fen, counts):
+    engine = GameEngine()
+    engine.load_fen(fen)
+    for depth, expected in enumerate(counts[:MAX_DEPTH], start=1):
+        assert engine.perft(depth) == expected, f"{name} depth {depth}"
+    assert engine.to_fen() == fen
+
+
+def test_divide_sums_to_perft():
+    engine = GameEngine()
+    engine.load_fen(REFERENCE_POSITIONS[1][1])
+    assert sum(engine.divide(2).values()) == engine.perft(2)
+
+
+@pytest.mark.parametrize("depth", ["0", "-1"])
+def test_depth_below_one_is_a_usage_error(depth):
+    with pytest.raises(SystemExit) as exc:
+        main(["--depth", depth])
+    assert exc.value.code == 2
@@ -0,0 +1,24 @@
+from engine.game_engine import GameEngine
+from engine.ponder import Ponderer
+
+
+def test_ponder_hit_keeps_the_level_depth():
+    engine = GameEngine()
+    predicted = engine.parse_san("e4")
+    ponderer = Ponderer(engine)
+    ponderer.start(predicted, max_depth=2)
+    engine.play(predicted)
+    assert ponderer.opponent_moved(engine.last_move_code(), time_limit_ms=5000)
+    result = ponderer.result()
+    assert result.depth == 2
+    assert result.move in engine.legal_moves()
+    assert ponderer.hits == 1 and not ponderer.active
+
+
+def test_ponder_miss_stops_the_search():
+    engine = GameEngine()
+    ponderer = Ponderer(engine)
+    ponderer.start(engine.parse_san("e4"), max_depth=2)
+    engine.play(engine.parse_san("d4"))
+    assert not ponderer.opponent_moved(engine.last_move_code())
+    assert ponderer.misses == 1 and not ponderer.active
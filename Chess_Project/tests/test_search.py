@@ -0,0 +1,81 @@
+import pytest
+
+from engine.evaluation import evaluate
+from engine.game_engine import GameEngine
+from engine.search import INFINITY, MAX_PLY, Search, static_exchange
+from engine.transposition import MATE_SCORE
+
+
+def position(fen):
+    engine = GameEngine()
+    engine.load_fen(fen)
+    return engine
+
+
+def test_finds_mate_in_one():
+    engine = position("k7/8/1K6/8/8/8/7Q/8 w - - 0 1")
+    result = engine.search(3)
+    assert result.score == MATE_SCORE - 1
+    engine.play(result.move)
+    assert engine.is_checkmate()
+
+
+def test_wins_hanging_queen():
+    engine = position("4k3/8/8/3q4/8/8/3R4/4K3 w - - 0 1")
+    assert engine.search(3).move == engine.parse_san("Rxd5")
+
+
+def test_search_leaves_position_unchanged():
+    engine = GameEngine()
+    fen, key = engine.to_fen(), engine.hash
+    result = engine.search(3)
+    assert result.move in engine.legal_moves()
+    assert result.pv[0] == result.move and result.depth == 3
+    assert (engine.to_fen(), engine.hash) == (fen, key)
+
+
+@pytest.mark.parametrize("fen, san, expected", [
+    ("4k3/8/8/3n4/4P3/8/8/4K3 w - - 0 1", "exd5", 320),  # Undefended knight
+    ("4k3/2p5/3p4/8/8/8/3Q4/4K3 w - - 0 1", "Qxd6", 100 - 900),  # Pawn defended by a pawn
+    ("4k3/8/3p4/8/8/8/8/3RK3 w - - 0 1", "Rxd6", 100),  # Nothing recaptures
+    ("3rk3/8/3p4/8/8/8/3R4/3RK3 w - - 0 1", "Rxd6", 100),  # X-ray: the second rook backs up the first
+    ("4k3/8/8/8/8/8/8/4K3 w - - 0 1", "Kd2", 0),  # Quiet move
+])
+def test_static_exchange(fen, san, expected):
+    engine = position(fen)
+    assert static_exchange(engine.board, engine.parse_san(san)) == expected
+
+
+def test_quiescence_stops_at_max_ply():
+    # In check with evasions available: must not recurse past the PV table
+    engine = position("4k3/8/8/8/8/8/4r3/4K3 w - - 0 1")
+    search = Search(engine)
+    assert search._quiesce(-INFINITY, INFINITY, MAX_PLY) == evaluate(engine)
+
+
+def test_node_budget():
+    engine = GameEngine()
+    result = engine.search(max_nodes=2000)
+    assert result.aborted
+    assert result.move in engine.legal_moves()
+    assert result.nodes <= 2001
+
+
+def test_time_limit():
+    engine = position("r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1")
+    result = engine.search(time_limit_ms=200)
+    assert result.move in engine.legal_moves()
+    assert result.elapsed_ms < 200 + 150
+
+
+def test_cancelled_search_still_answers():
+    class Cancelled:
+        def is_set(self):
+            return True
+
+    engine = GameEngine()
+    fen = engine.to_fen()
+    result = engine.search(6, cancel_token=Cancelled())
+    assert result.aborted and result.depth == 0
+    assert result.move in engine.legal_moves()
+    assert engine.to_fen() == fen
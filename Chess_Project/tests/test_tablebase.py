@@ -0,0 +1,55 @@
+import pytest
+
+from engine.game_engine import GameEngine
+from engine.tablebase import TB_DRAW, TB_INVALID, TB_LOSS, TB_WIN, Tablebases, generate
+
+
+@pytest.fixture(scope="module")
+def tablebases(tmp_path_factory):
+    directory = str(tmp_path_factory.mktemp("tablebases"))
+    generate(["KQvK"], directory, workers=1, log=lambda *args: None)
+    with Tablebases(directory) as tablebases:
+        yield tablebases
+
+
+def probe(tablebases, fen):
+    engine = GameEngine(tablebases=tablebases)
+    engine.load_fen(fen)
+    return engine, tablebases.probe(engine)
+
+
+def test_longest_win_is_mate_in_ten(tablebases):
+    table = tablebases.table("KQvK")
+    longest = max(dtm for index in range(table.layout.size)
+                  for result, dtm in [table.probe(index)] if result == TB_WIN)
+    assert longest == 19  # Plies: ten moves for the side with the queen
+
+
+@pytest.mark.parametrize("fen, expected", [
+    ("k7/8/1K6/8/8/8/7Q/8 w - - 0 1", (TB_WIN, 1)),  # Qh8 mates
+    ("k6Q/8/1K6/8/8/8/8/8 b - - 0 1", (TB_LOSS, 0)),  # Mated
+    ("k7/8/1Q6/8/8/8/8/K7 b - - 0 1", (TB_DRAW, 0)),  # Stalemate
+    ("8/8/8/8/8/8/8/4K2k w - - 0 1", (TB_DRAW, 0)),  # Bare kings
+    ("8/7q/8/8/8/1k6/8/K7 b - - 0 1", (TB_WIN, 1)),  # Colors swapped: Qh1 mates
+    ("k7/8/1K6/8/8/8/8/7Q w - - 0 1", (TB_INVALID, 0)),  # Side not to move is in check
+])
+def test_probe(tablebases, fen, expected):
+    assert probe(tablebases, fen)[1] == expected
+
+
+def test_black_queen_mirrors_white_queen(tablebases):
+    white = probe(tablebases, "8/8/8/3k4/8/8/2Q5/4K3 w - - 0 1")[1]
+    black = probe(tablebases, "4k3/2q5/8/8/3K4/8/8/8 b - - 0 1")[1]
+    assert white == black and white[0] == TB_WIN
+
+
+def test_tablebase_move_shortens_the_mate(tablebases):
+    engine, (result, plies) = probe(tablebases, "8/8/8/3k4/8/8/2Q5/4K3 w - - 0 1")
+    engine.play(engine.tablebase_move().move)
+    assert tablebases.probe(engine) == (TB_LOSS, plies - 1)
+
+
+def test_invalid_positions_are_marked(tablebases):
+    table = tablebases.table("KQvK")
+    results = {table.probe(index)[0] for index in range(table.layout.size)}
+    assert results == {TB_WIN, TB_DRAW, TB_LOSS, TB_INVALID}
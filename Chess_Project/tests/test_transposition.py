@@ -0,0 +1,55 @@
+import pytest
+
+from engine.game_engine import GameEngine
+from engine.transposition import (EXACT, LOWER_BOUND, MATE_SCORE, UPPER_BOUND,
+                                  TranspositionTable)
+
+
+@pytest.mark.parametrize("score", [0, 35, -35, MATE_SCORE - 3, -MATE_SCORE + 3])
+def test_round_trip(score):
+    tt = TranspositionTable(1)
+    key, move = 0x1234_5678_9ABC_DEF0, 2745
+    tt.store(key, 7, EXACT, score, move)
+    assert tt.probe(key) == (move, score, 7, EXACT)
+    assert tt.probe(key ^ 1) is None
+
+
+def test_size_is_bounded():
+    tt = TranspositionTable(1)
+    assert tt.size_bytes <= 1024 * 1024
+    for key in range(1, 200000):
+        tt.store(key * 0x9E3779B97F4A7C15 & (2 ** 64 - 1), 1, EXACT, 0)
+    assert tt.size_bytes <= 1024 * 1024
+
+
+def bucket_mates(tt, key, count):
+    """Different keys that map to the same bucket as ``key``."""
+    return [key + (tt.bucket_mask + 1) * i for i in range(1, count + 1)]
+
+
+def test_keeps_deeper_entry():
+    tt = TranspositionTable(1)
+    key = 42
+    other, = bucket_mates(tt, key, 1)
+    tt.store(key, 6, LOWER_BOUND, 50, 1)
+    tt.store(other, 2, UPPER_BOUND, -10, 2)
+    assert tt.probe(key) == (1, 50, 6, LOWER_BOUND)
+    assert tt.probe(other) == (2, -10, 2, UPPER_BOUND)
+
+
+def test_replaces_entries_from_older_searches():
+    tt = TranspositionTable(1)
+    key = 42
+    other, = bucket_mates(tt, key, 1)
+    tt.store(key, 6, EXACT, 50, 1)
+    tt.new_search()
+    tt.store(other, 2, EXACT, -10, 2)
+    assert tt.probe(other) == (2, -10, 2, EXACT)
+    assert tt.probe(key) is None
+
+
+def test_medium_difficulty_leaves_the_table_alone():
+    engine = GameEngine()
+    engine.load_fen("6k1/5ppp/8/8/8/8/8/R5K1 w - - 0 1")  # Ra8 mates
+    engine.think("medium")
+    assert engine.tt.stores == 0